@@ -0,0 +1,70 @@
+from devito import clear_cache, configuration
+
+from examples.seismic.self_adjoint.example_iso import acoustic_sa_setup
+from examples.seismic.tti.tti_example import tti_setup
+from examples.seismic.viscoelastic.viscoelastic_example import viscoelastic_setup
+
+
+# The seismic models whose Operators are the most expensive to build
+models = {
+    'tti': tti_setup,
+    'viscoelastic': viscoelastic_setup,
+    'sa-iso': acoustic_sa_setup,
+}
+
+
+class Compilation:
+
+    """
+    Construction time and peak memory consumption of large stencil Operators.
+
+    Only the lowering is measured, as the Operators are JIT-compiled lazily.
+    """
+
+    # ASV parametrization
+    params = (list(models), [4, 8, 12, 16], ['noop', 'advanced'], [0, 'full'])
+    param_names = ['model', 'space_order', 'opt', 'mpi']
+
+    # ASV config
+    number = 1
+    repeat = 1
+    warmup_time = 0
+    timeout = 1800.0
+
+    # The grid shape has no impact on the build time, so it's kept small to
+    # make the setup cheap
+    shape = (20, 20, 20)
+    spacing = (10., 10., 10.)
+
+    def setup(self, model, space_order, opt, mpi):
+        if model == 'sa-iso' and space_order < 8:
+            # Not supported by the self-adjoint solver; skipped by asv
+            raise NotImplementedError
+
+        self._mpi = configuration['mpi']
+        configuration['mpi'] = mpi
+
+        # The Operators are memoized by the solver, so a fresh solver is
+        # required by each benchmark
+        self.solver = models[model](shape=self.shape, spacing=self.spacing,
+                                    space_order=space_order, opt=opt)
+
+    def teardown(self, model, space_order, opt, mpi):
+        configuration['mpi'] = self._mpi
+
+        del self.solver
+        clear_cache()
+
+    def time_forward(self, model, space_order, opt, mpi):
+        self.solver.op_fwd()
+
+    def peakmem_forward(self, model, space_order, opt, mpi):
+        self.solver.op_fwd()
+
+    def track_forward_cire(self, model, space_order, opt, mpi):
+        # The time spent in the detection and optimization of aliasing
+        # expressions, which dominates the build time at high space orders
+        profile = self.solver.op_fwd().compile_profile
+        return sum(v.time for k, v in profile.items() if k.endswith('/cire'))
+
+    track_forward_cire.unit = 'seconds'
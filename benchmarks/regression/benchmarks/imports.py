@@ -0,0 +1,25 @@
+# ASV config
+repeat = 10
+timeout = 120.0
+
+
+class Import:
+
+    """
+    Cost of importing Devito, as seen by short-lived processes (e.g., workers,
+    pytest collection). Each benchmark runs in a fresh interpreter.
+    """
+
+    def timeraw_import(self):
+        # The hardware sniffing and the compiler initialization are deferred
+        # until first use, so they are excluded from here...
+        return "import devito"
+
+    def timeraw_import_and_initialize(self):
+        # ...but not from here
+        return """
+        import devito
+        devito.configuration['platform'].isa
+        devito.configuration['platform'].cores_physical
+        devito.configuration['compiler']
+        """
@@ -0,0 +1,69 @@
+import numpy as np
+
+from devito import Eq, Function, Grid, Operator, TimeFunction, configuration, solve
+from devito.tools import bfloat16
+
+
+# The compact storage types under test; `None` stands for `dtype`
+storage_dtypes = {
+    'float32': None,
+    'float16': np.float16,
+}
+if bfloat16 is not None:
+    storage_dtypes['bfloat16'] = bfloat16
+
+
+class CompactStorage:
+
+    """
+    Runtime and memory traffic of a bandwidth-bound acoustic-like stencil, with
+    the wavefield and the velocity model stored in reduced precision while
+    computing in float32.
+
+    The traffic is the one estimated by the `advanced` profiler, which accounts
+    for the storage data type.
+    """
+
+    # ASV parametrization
+    params = ([(256, 256, 256)], [8], list(storage_dtypes))
+    param_names = ['shape', 'space_order', 'storage']
+
+    # ASV config
+    repeat = 3
+    timeout = 600.0
+
+    nt = 20
+
+    def setup(self, shape, space_order, storage):
+        self._profiling = configuration['profiling']
+        configuration['profiling'] = 'advanced'
+
+        storage_dtype = storage_dtypes[storage]
+
+        grid = Grid(shape=shape, extent=tuple(10.*(i - 1) for i in shape))
+        m = Function(name='m', grid=grid, space_order=space_order,
+                     storage_dtype=storage_dtype)
+        u = TimeFunction(name='u', grid=grid, time_order=2,
+                         space_order=space_order, storage_dtype=storage_dtype)
+        m.data[:] = 1/1.5**2
+        u.data[:, shape[0]//2, shape[1]//2, shape[2]//2] = 1.
+
+        pde = m * u.dt2 - u.laplace
+        self.op = Operator(Eq(u.forward, solve(pde, u.forward)),
+                           opt=('advanced', {'openmp': True}))
+        self.dt = 0.5*grid.spacing[0]*np.sqrt(m.data.min())/1.5
+
+        # Trigger JIT-compilation outside of the timed region
+        self.op.cfunction
+
+    def teardown(self, shape, space_order, storage):
+        configuration['profiling'] = self._profiling
+
+    def time_forward(self, shape, space_order, storage):
+        self.op.apply(time_M=self.nt, dt=self.dt)
+
+    def track_traffic(self, shape, space_order, storage):
+        summary = self.op.apply(time_M=self.nt, dt=self.dt)
+        return sum(v.traffic for v in summary.input.values()) / 2**30
+
+    track_traffic.unit = 'GB'
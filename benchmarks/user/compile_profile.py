@@ -0,0 +1,132 @@
+import json
+
+import click
+
+from devito import configuration, switchconfig
+from devito.operator.profiling import CompileProfile
+
+from benchmark import model_type, option_simulation
+
+
+# The Operator factories of the seismic solvers, by operator type
+solver_ops = {
+    'forward': ('op_fwd',),
+    'adjoint': ('op_adj',),
+    'jacobian': ('op_born', 'op_jac'),
+    'jacobian_adjoint': ('op_grad', 'op_jacadj')
+}
+
+
+@click.group()
+def compile_profile():
+    """
+    Profile the construction of seismic operators.
+
+    \b
+    There are two main 'execution modes':
+    dump: build an operator and save its compile profile as JSON
+    compare: compare the compile profiles of the same operators,
+             e.g. as obtained with different Devito versions
+    """
+    pass
+
+
+@compile_profile.command(name='dump')
+@option_simulation
+@click.option('--opt', default='advanced', help='Performance optimization level')
+@click.option('-o', '--output', required=True,
+              help='File where the compile profiles are saved')
+def cli_dump(problem, **kwargs):
+    """`click` interface for the `dump` mode."""
+    dump(problem, **kwargs)
+
+
+def dump(problem, output=None, operator='forward', opt='advanced', **kwargs):
+    """
+    Build the `operator` of `problem` and save its compile profile into `output`.
+    """
+    setup = model_type[problem]['setup']
+
+    space_orders = kwargs.pop('space_order')
+    time_orders = kwargs.pop('time_order')
+
+    profiles = []
+    for space_order in space_orders:
+        for time_order in time_orders:
+            with switchconfig(**{'compile-profiling': True}):
+                solver = setup(space_order=space_order, time_order=time_order,
+                               opt=opt, **kwargs)
+
+                for name in solver_ops[operator]:
+                    try:
+                        op = getattr(solver, name)()
+                        break
+                    except AttributeError:
+                        pass
+                else:
+                    raise click.BadParameter("Operator `%s` not implemented for `%s`"
+                                             % (operator, problem))
+
+            profile = op.compile_profile.todict()
+            profile['key'] = '%s-%s-so%d-to%d' % (problem, operator, space_order,
+                                                  time_order)
+            profiles.append(profile)
+
+            click.echo(op.compile_profile)
+
+    with open(output, 'w') as f:
+        json.dump(profiles, f, indent=2)
+
+
+@compile_profile.command(name='compare')
+@click.argument('baseline', type=click.Path(exists=True))
+@click.argument('target', type=click.Path(exists=True))
+@click.option('--threshold', default=0.05, type=float,
+              help='Only show passes whose time changed by more than this '
+                   'fraction of the total')
+def cli_compare(**kwargs):
+    """`click` interface for the `compare` mode."""
+    compare(**kwargs)
+
+
+def compare(baseline, target, threshold=0.05):
+    """
+    Compare two sets of compile profiles, as produced by `dump`.
+    """
+    profiles = []
+    for path in [baseline, target]:
+        with open(path) as f:
+            profiles.append({i.pop('key', i['name']): CompileProfile.fromdict(i)
+                             for i in json.load(f)})
+    profiles0, profiles1 = profiles
+
+    for key in profiles0:
+        try:
+            p0, p1 = profiles0[key], profiles1[key]
+        except KeyError:
+            click.echo("`%s` not found in `%s`, skipping" % (key, target))
+            continue
+
+        # The baseline may have recorded no time at all, e.g. on a cache hit
+        if p0.total > 0:
+            change = "%+.1f %%" % ((p1.total / p0.total - 1)*100)
+        else:
+            change = "n/a"
+        click.echo("%s: %.2f s --> %.2f s (%s)" % (key, p0.total, p1.total, change))
+
+        rows = []
+        for name in list(p0) + [i for i in p1 if i not in p0]:
+            t0 = p0[name].time if name in p0 else 0.
+            t1 = p1[name].time if name in p1 else 0.
+            if abs(t1 - t0) < threshold*max(p0.total, p1.total):
+                continue
+            rows.append((abs(t1 - t0), name, t0, t1))
+
+        for _, name, t0, t1 in sorted(rows, reverse=True):
+            click.echo("  %-60s %8.3f s --> %8.3f s" % (name, t0, t1))
+
+
+if __name__ == "__main__":
+    configuration['develop-mode'] = False
+
+    compile_profile(standalone_mode=False)
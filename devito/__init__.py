@@ -20,7 +20,7 @@ from devito.types.sparse import *  # noqa
 from devito.types.tensor import *  # noqa
 from devito.finite_differences import *  # noqa
 from devito.operations.solve import *
-from devito.operator import Operator  # noqa
+from devito.operator import Operator, compile_all  # noqa
 from devito.symbolics import CondEq, CondNe  # noqa
 
 # Other stuff exposed to the user
@@ -28,6 +28,7 @@ from devito.builtins import *  # noqa
 from devito.data.allocators import *  # noqa
 from devito.logger import error, warning, info, set_log_level  # noqa
 from devito.mpi import MPI, CustomTopology  # noqa
+from devito.checkpointing import SnapshotStream  # noqa
 try:
     from devito.checkpointing import DevitoCheckpoint, CheckpointOperator  # noqa
     from pyrevolve import Revolver
@@ -47,25 +48,36 @@ from devito.operator import profiler_registry, operator_registry
 from devito.mpatches import *  # noqa
 
 
-from ._version import get_versions  # noqa
-__version__ = get_versions()['version']
-del get_versions
+def __getattr__(name):
+    # The version is computed lazily, as it may require calling `git` several
+    # times, which is rather expensive for an import
+    if name == '__version__':
+        from ._version import get_versions
+        globals()['__version__'] = version = get_versions()['version']
+        return version
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 def reinit_compiler(val):
     """
     Re-initialize the Compiler.
     """
+    if configuration.is_pending('compiler'):
+        # Not built yet; it will pick up `val` upon first access
+        return val
     configuration['compiler'].__init__(suffix=configuration['compiler'].suffix,
                                        mpi=configuration['mpi'])
     return val
 
 
-# Setup target platform and compiler
+# Setup target platform and compiler. The compiler is lazy, as its
+# initialization sniffs the compiler version and the ISA, so it's deferred
+# until the first Operator is built
 configuration.add('platform', 'cpu64', list(platform_registry),
                   callback=lambda i: platform_registry[i]())
 configuration.add('compiler', 'custom', compiler_registry,
-                  callback=lambda i: compiler_registry[i]())
+                  callback=lambda i: compiler_registry[i](mpi=configuration['mpi']),
+                  lazy=True)
 
 # Setup language for shared-memory parallelism
 preprocessor = lambda i: {0: 'C', 1: 'openmp'}.get(i, i)  # Handles DEVITO_OPENMP deprec
@@ -78,9 +90,11 @@ preprocessor = lambda i: {0: False, 1: 'basic'}.get(i, i)
 configuration.add('mpi', 0, [0, 1] + list(mpi_registry),
                   preprocessor=preprocessor, callback=reinit_compiler)
 
-# Domain decomposition topology. Only relevant with MPI
-preprocessor = lambda i: CustomTopology._shortcuts.get(i)
-configuration.add('topology', None, [None] + list(CustomTopology._shortcuts),
+# Domain decomposition topology. Only relevant with MPI. With `optimal`, the
+# topology minimizing the estimated volume of halo exchanges is computed
+preprocessor = lambda i: CustomTopology._shortcuts.get(i, i)
+configuration.add('topology', None,
+                  [None, 'optimal'] + list(CustomTopology._shortcuts),
                   preprocessor=preprocessor)
 
 # Should Devito run a first-touch Operator upon data allocation?
@@ -102,6 +116,21 @@ configuration.add('log-level', 'INFO', list(logger_registry),
 # and will instead use the custom kernel
 configuration.add('jit-backdoor', 0, [0, 1], preprocessor=bool, impacts_jit=False)
 
+# Persistent, on-disk cache of lowered Operators. If enabled, an Operator whose
+# symbolic input matches that of an Operator built by a previous process is
+# restored straight from disk, thus entirely bypassing the lowering
+configuration.add('build-cache', 0, [0, 1], preprocessor=bool, impacts_jit=False)
+
+# Lift the floating-point literals in the input equations into Constants, so
+# that Operators differing only in the value of some coefficients are lowered
+# and JIT-compiled only once
+configuration.add('lift-literals', 0, [0, 1], preprocessor=bool, impacts_jit=False)
+
+# Emit the elemental functions (e.g., the MPI routines) into separate translation
+# units, compiled in parallel and cached individually, rather than emitting
+# the whole Operator into a single, potentially very large, file
+configuration.add('jit-split', 0, [0, 1], preprocessor=bool, impacts_jit=False)
+
 # By default unsafe math is allowed as most applications are insensitive to
 # floating-point roundoff errors. Enabling this disables unsafe math
 # optimisations.
@@ -144,6 +173,26 @@ accepted = levels + [list(i) for i in product(levels, modes)]
 configuration.add('autotuning', 'off', accepted, callback=autotune_callback,
                   impacts_jit=False)
 
+# The autotuning search strategy. With `exhaustive`, all of the candidate block
+# shapes are tried; with `model`, only the few whose working set best fits the
+# caches, according to a cache-capacity model
+configuration.add('autotuning-search', 'exhaustive', ['exhaustive', 'model'],
+                  impacts_jit=False)
+
+
+def _preprocess_autotuning_db(val):
+    if val in (0, 1, '0', '1'):
+        return bool(int(val))
+    return str(val)
+
+
+# Persistent, on-disk database of autotuning outcomes. If enabled, autotuning
+# reuses the tuned arguments found by a previous process for the same Operator,
+# problem size, number of threads and platform. Either a bool, to use a
+# directory within the OS temporary directory, or the database directory
+configuration.add('autotuning-db', 0, preprocessor=_preprocess_autotuning_db,
+                  impacts_jit=False)
+
 # In develop-mode:
 # - The ALLOC_GUARD data allocator is used. This will trigger segfaults as soon
 #   as an out-of-bounds memory access is performed
@@ -157,6 +206,11 @@ configuration.add('opt-options', {}, deprecate='dle-options')
 # Setup Operator profiling
 configuration.add('profiling', 'basic', list(profiler_registry), impacts_jit=False)
 
+# Collect detailed metrics about the compilation passes (e.g., size of the IR in
+# input and output, SymPy cache size, peak memory usage) while building an
+# Operator. Accessible via `Operator.compile_profile`
+configuration.add('compile-profiling', 0, [0, 1], preprocessor=bool, impacts_jit=False)
+
 # Initialize `configuration`
 init_configuration()
 
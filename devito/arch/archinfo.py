@@ -1,6 +1,7 @@
 """Collection of utilities to detect properties of the underlying architecture."""
 
 from functools import cached_property
+from glob import glob
 from subprocess import PIPE, Popen, DEVNULL, run
 import ctypes
 import re
@@ -8,7 +9,6 @@ import os
 import sys
 import json
 
-import cpuinfo
 import numpy as np
 import psutil
 
@@ -35,6 +35,12 @@ __all__ = ['platform_registry', 'get_cpu_info', 'get_gpu_info', 'get_nvidia_cc',
            'PVC', 'INTELGPUMAX', 'MAX1100', 'MAX1550']
 
 
+def _cpuinfo():
+    # Imported lazily as, upon import, `cpuinfo` spawns several subprocesses
+    import cpuinfo
+    return cpuinfo
+
+
 @memoized_func
 def get_cpu_info():
     """Attempt CPU info autodetection."""
@@ -81,7 +87,7 @@ def get_cpu_info():
 
             try:
                 # Certain ARM CPUs, e.g. Marvell Thunder X2
-                return cpuinfo.get_cpu_info().get('arch').lower()
+                return _cpuinfo().get_cpu_info().get('arch').lower()
             except:
                 return None
 
@@ -90,7 +96,7 @@ def get_cpu_info():
 
     if not cpu_info.get('flags'):
         try:
-            cpu_info['flags'] = cpuinfo.get_cpu_info().get('flags')
+            cpu_info['flags'] = _cpuinfo().get_cpu_info().get('flags')
         except:
             # We've rarely seen cpuinfo>=8 raising exceptions at this point,
             # while trying to fetch the cpu `flags`
@@ -98,7 +104,7 @@ def get_cpu_info():
 
     if not cpu_info.get('brand'):
         try:
-            ret = cpuinfo.get_cpu_info()
+            ret = _cpuinfo().get_cpu_info()
             cpu_info['brand'] = ret.get('brand', ret.get('brand_raw'))
         except:
             cpu_info['brand'] = None
@@ -552,6 +558,49 @@ def lscpu():
         return {}
 
 
+@memoized_func
+def get_cache_info():
+    """
+    Attempt CPU cache detection, through sysfs.
+
+    Returns
+    -------
+    dict
+        Map each cache level to a 2-tuple `(size, ncpus)`, with `size` the size
+        of a data (or unified) cache in bytes and `ncpus` the number of logical
+        CPUs sharing it. Empty if the detection fails.
+    """
+    mapper = {}
+    for path in sorted(glob('/sys/devices/system/cpu/cpu0/cache/index*')):
+        try:
+            with open(os.path.join(path, 'type')) as f:
+                if f.read().strip() == 'Instruction':
+                    continue
+            with open(os.path.join(path, 'level')) as f:
+                level = int(f.read())
+            with open(os.path.join(path, 'size')) as f:
+                size = f.read().strip()
+            with open(os.path.join(path, 'shared_cpu_list')) as f:
+                cpus = f.read().strip()
+        except (OSError, ValueError):
+            continue
+
+        units = {'K': 2**10, 'M': 2**20, 'G': 2**30}
+        try:
+            size = int(size[:-1]) * units[size[-1]] if size[-1] in units else int(size)
+        except ValueError:
+            continue
+
+        ncpus = 0
+        for i in cpus.split(','):
+            lo, _, hi = i.partition('-')
+            ncpus += int(hi or lo) - int(lo) + 1
+
+        mapper[level] = (size, ncpus)
+
+    return mapper
+
+
 @memoized_func
 def get_platform():
     """Attempt Platform autodetection."""
@@ -637,6 +686,21 @@ class Platform:
     def _detect_isa(self):
         return 'unknown'
 
+    # NOTE: the hardware properties below are only sniffed upon first access,
+    # so that instantiating a Platform (e.g., at import time) is cheap
+
+    @cached_property
+    def cores_logical(self):
+        return get_cpu_info()['logical']
+
+    @cached_property
+    def cores_physical(self):
+        return get_cpu_info()['physical']
+
+    @cached_property
+    def isa(self):
+        return self._detect_isa()
+
     @property
     def numa_domains(self):
         """
@@ -661,6 +725,13 @@ class Platform:
         """Available physical memory in bytes, or None if unknown."""
         return None
 
+    def cache_size(self, level):
+        """
+        Size in bytes of the level-`level` data cache available to each physical
+        core, or None if unknown.
+        """
+        return None
+
     def max_mem_trans_size(self, dtype):
         """
         Number of items of type `dtype` that can be transferred in a single
@@ -691,11 +762,12 @@ class Cpu64(Platform):
     def __init__(self, name, cores_logical=None, cores_physical=None, isa=None):
         super().__init__(name)
 
-        cpu_info = get_cpu_info()
-
-        self.cores_logical = cores_logical or cpu_info['logical']
-        self.cores_physical = cores_physical or cpu_info['physical']
-        self.isa = isa or self._detect_isa()
+        if cores_logical:
+            self.cores_logical = cores_logical
+        if cores_physical:
+            self.cores_physical = cores_physical
+        if isa:
+            self.isa = isa
 
     @classmethod
     def _mro(cls):
@@ -738,6 +810,14 @@ class Cpu64(Platform):
             warning("NUMA domain count autodetection failed")
             return 1
 
+    def cache_size(self, level):
+        try:
+            size, ncpus = get_cache_info()[level]
+        except KeyError:
+            return None
+        ncores = max(ncpus // max(self.threads_per_core, 1), 1)
+        return size // ncores
+
     @cached_property
     def memtotal(self):
         return psutil.virtual_memory().total
@@ -809,10 +889,10 @@ class Device(Platform):
                  max_threads_dimy=1024, max_threads_dimz=64):
         super().__init__(name)
 
-        cpu_info = get_cpu_info()
-
-        self.cores_logical = cores_logical or cpu_info['logical']
-        self.cores_physical = cores_physical or cpu_info['physical']
+        if cores_logical:
+            self.cores_logical = cores_logical
+        if cores_physical:
+            self.cores_physical = cores_physical
         self.isa = isa
 
         self.max_threads_per_block = max_threads_per_block
@@ -1,10 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from hashlib import sha1
 from os import environ, path, makedirs
 from packaging.version import Version
 from subprocess import (DEVNULL, PIPE, CalledProcessError, check_output,
                         check_call, run)
+import os
 import platform
+import threading
 import warnings
 import time
 
@@ -140,6 +143,16 @@ def call_capture_output(cmd):
     return _call_capture_output(cmd)
 
 
+# Suppress codepy complaining that it's taking too long to acquire the cache
+# lock. This warning can only appear in a multiprocess session, typically (but
+# not necessarily) when many processes are frequently attempting jit-compilation
+# (e.g., when running the test suite in parallel). The filter only matches this
+# very warning and is installed once and for all, as altering the process-wide
+# filters around each compilation isn't thread-safe (e.g., `compile_all`)
+warnings.filterwarnings('ignore', message='could not obtain lock',
+                        module='codepy|pytools')
+
+
 class Compiler(GCCToolchain):
     """
     Base class for all compiler classes.
@@ -369,19 +382,81 @@ class Compiler(GCCToolchain):
         # Spinlock in case of MPI
         sleep_delay = 0 if configuration['mpi'] else 1
 
-        # `catch_warnings` suppresses codepy complaining that it's taking
-        # too long to acquire the cache lock. This warning can only appear
-        # in a multiprocess session, typically (but not necessarily) when
-        # many processes are frequently attempting jit-compilation (e.g.,
-        # when running the test suite in parallel)
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore')
-            _, _, _, recompiled = compile_from_string(self, target, code, src_file,
-                                                      cache_dir=cache_dir, debug=debug,
-                                                      sleep_delay=sleep_delay)
+        _, _, _, recompiled = compile_from_string(self, target, code, src_file,
+                                                  cache_dir=cache_dir, debug=debug,
+                                                  sleep_delay=sleep_delay)
 
         return recompiled, src_file
 
+    def jit_compile_units(self, soname, units):
+        """
+        JIT compile multiple translation units, given as strings, and link them
+        into a single shared object.
+
+        Each translation unit is compiled into an object file in parallel with
+        the others. The object files are cached individually, so a change in one
+        translation unit only triggers its own recompilation, besides the
+        final linking.
+
+        Parameters
+        ----------
+        soname : str
+            Name of the .so file (w/o the suffix).
+        units : list of (str, str)
+            The name and the source code of each translation unit.
+        """
+        target = str(self.get_jit_dir().joinpath(soname))
+        sofile = "%s%s" % (target, self.so_ext)
+
+        cache_dir = self.get_codepy_dir().joinpath('units')
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Should the compilation commands be emitted?
+        debug = configuration['log-level'] == 'DEBUG'
+
+        # The object files depend on both the source code and the compiler flags
+        cmdline = ' '.join(self._cmdline([], object=True))
+
+        def build(unit):
+            name, code = unit
+
+            # Concurrent processes (e.g., MPI ranks) and threads may be
+            # compiling the very same translation unit, so both the source
+            # and the object files are written under private names first, and
+            # then atomically renamed
+            src_file = "%s-%s.%s" % (target, name, self.src_ext)
+            suffix = "%d.%d" % (os.getpid(), threading.get_ident())
+            tmp_src_file = "%s-%s.%s.%s" % (target, name, suffix, self.src_ext)
+            with open(tmp_src_file, 'w') as f:
+                f.write(code)
+
+            key = sha1((cmdline + code).encode()).hexdigest()
+            obj_file = cache_dir.joinpath('%s.o' % key)
+            if obj_file.is_file():
+                os.replace(tmp_src_file, src_file)
+                return src_file, str(obj_file), False
+
+            tmp_file = "%s.%s.o" % (obj_file.with_suffix(''), suffix)
+            self.build_object(tmp_file, [tmp_src_file], debug=debug)
+            os.replace(tmp_file, obj_file)
+            os.replace(tmp_src_file, src_file)
+
+            return src_file, str(obj_file), True
+
+        # One compiler process per physical core at most
+        workers = min(len(units), configuration['platform'].cores_physical or
+                      os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            src_files, obj_files, recompiled = zip(*executor.map(build, units))
+
+        recompiled = any(recompiled) or not path.isfile(sofile)
+        if recompiled:
+            tmp_file = "%s.%d%s" % (target, os.getpid(), self.so_ext)
+            self.link_extension(tmp_file, list(obj_files), debug=debug)
+            os.replace(tmp_file, sofile)
+
+        return recompiled, src_files[0]
+
     def __lookup_cmds__(self):
         self.CC = 'unknown'
         self.CXX = 'unknown'
@@ -1,6 +1,7 @@
 import numpy as np
 
 import devito as dv
+from devito.data import parallel_copy
 from devito.tools import as_tuple, as_list
 from devito.builtins.utils import check_builtins_args, nbl_to_padsize, pad_outhalo
 
@@ -216,15 +217,25 @@ def gaussian_smooth(f, sigma=1, truncate=4.0, mode='reflect'):
     return f
 
 
+def _copy(function, data, slices=slice(None)):
+    """
+    Copy `data` into `function.data[slices]`, in parallel unless the copy
+    requires MPI communication.
+    """
+    if function.data._is_mpi_distributed:
+        function.data[slices] = data
+    else:
+        parallel_copy(function.data[slices], data, axis=function._touch_axis)
+
+
 def _initialize_function(function, data, nbl, mapper=None, mode='constant'):
     """
     Construct the symbolic objects for `initialize_function`.
     """
     nbl, slices = nbl_to_padsize(nbl, function.ndim)
     if isinstance(data, dv.Function):
-        function.data[slices] = data.data[:]
-    else:
-        function.data[slices] = data
+        data = data.data[:]
+    _copy(function, data, slices)
     lhs = []
     rhs = []
     options = []
@@ -369,9 +380,9 @@ def initialize_function(function, data, nbl, mapper=None, mode='constant',
     if nbl == 0:
         for f, data in zip(functions, datas):
             if isinstance(data, dv.Function):
-                f.data[:] = data.data[:]
+                _copy(f, data.data[:])
             else:
-                f.data[:] = data[:]
+                _copy(f, data[:])
     else:
         lhss, rhss, optionss = [], [], []
         for f, data in zip(functions, datas):
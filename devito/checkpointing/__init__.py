@@ -1,3 +1,7 @@
+from .compression import *  # noqa
+from .revolve import *  # noqa
+from .snapshot import *  # noqa
+
 try:
     import pyrevolve as pyrevolve  # noqa
     from .checkpoint import *  # noqa
@@ -1,6 +1,11 @@
+import numpy as np
 from pyrevolve import Checkpoint, Operator
+from pyrevolve.storage import Storage
+
 from devito import TimeFunction
+from devito.checkpointing.compression import make_codec
 from devito.tools import flatten
+from devito.operator.operator import PreparedCall
 
 
 class CheckpointOperator(Operator):
@@ -23,14 +28,14 @@ class CheckpointOperator(Operator):
 
     def __init__(self, op, **kwargs):
         self.op = op
+        # The time bounds are only known upon `apply`, hence no validation here
         self.args = self.op._prepare_arguments(**kwargs)
+        self.call = PreparedCall(self.op, self.args, **kwargs)
         self.start_offset = self.args[self.t_arg_names['t_start']]
 
     def _prepare_args(self, t_start, t_end):
-        args = self.args.copy()
-        args[self.t_arg_names['t_start']] = t_start + self.start_offset
-        args[self.t_arg_names['t_end']] = t_end - 1 + self.start_offset
-        return args
+        return {self.t_arg_names['t_start']: t_start + self.start_offset,
+                self.t_arg_names['t_end']: t_end - 1 + self.start_offset}
 
     def apply(self, t_start, t_end):
         """ If the devito operator requires some extra arguments in the call to apply
@@ -38,11 +43,9 @@ class CheckpointOperator(Operator):
             pyRevolve.Operator.apply() without caring about these extra arguments while
             this method passes them on correctly to devito.Operator
         """
-        # Build the arguments list to invoke the kernel function
-        args = self._prepare_args(t_start, t_end)
-        # Invoke kernel function with args
-        arg_values = [args[p.name] for p in self.op.parameters]
-        self.op.cfunction(*arg_values)
+        # The arguments were processed once and for all upon construction; only
+        # the time bounds change across invocations
+        self.call(**self._prepare_args(t_start, t_end))
 
 
 class DevitoCheckpoint(Checkpoint):
@@ -84,6 +87,75 @@ class DevitoCheckpoint(Checkpoint):
                            " of pyrevolve?")
 
 
+class CompressedStorage(Storage):
+    """
+    A pyRevolve in-memory storage for compressed checkpoints.
+
+    With a lossy, fixed-rate, codec each checkpoint occupies a fixed, and
+    smaller, amount of memory. Thus, for a given memory budget, 2x to 4x more
+    checkpoints may be held, which reduces the recomputation in the reverse
+    pass. With the lossless codec, the compressed checkpoints are held as
+    variable-size metadata instead.
+
+    Parameters
+    ----------
+    checkpoint : DevitoCheckpoint
+        The checkpointed objects.
+    n_checkpoints : int
+        The number of checkpoints.
+    scheme : str, optional
+        The compression scheme, one of 'float16', 'bfloat16', 'fixed' or 'zlib'. See
+        `make_codec.__doc__` for more information. Defaults to 'fixed'.
+    tolerance : float, optional
+        The maximum acceptable pointwise error, relative to the largest
+        magnitude in each compressed array.
+
+    Examples
+    --------
+    Replace the default storage of a Revolver
+
+    >>> wrp = Revolver(cp, wrap_fw, wrap_rev, n_checkpoints, nt)  # doctest: +SKIP
+    >>> wrp.resetStorageList()  # doctest: +SKIP
+    >>> wrp.addStorage(CompressedStorage(cp, wrp.n_checkpoints,
+    ...                                  tolerance=1e-3))  # doctest: +SKIP
+    """
+
+    def __init__(self, checkpoint, n_checkpoints, scheme='fixed', tolerance=None,
+                 profiler=None):
+        self.codec = make_codec(scheme, tolerance)
+
+        # The size of a compressed checkpoint, in bytes
+        sizes = [o.size_allocated // o.time_size for o in checkpoint.objects
+                 for _ in range(o.time_order)]
+        size_ckp = sum(self.codec.nbytes(i) for i in sizes)
+
+        super().__init__(size_ckp, n_checkpoints, np.uint8, profiler,
+                         name="CompressedStorage")
+        self.storage = np.empty((n_checkpoints, size_ckp), dtype=np.uint8)
+        self.metadata = {}
+
+    def __getitem__(self, key):
+        return self.storage[key, :]
+
+    def save(self, key, data_pointers):
+        slot = self[key]
+        offset = 0
+        metadata = []
+        for ptr in data_pointers:
+            nbytes = self.codec.nbytes(ptr.size)
+            metadata.append(self.codec.encode(ptr, slot[offset:offset + nbytes]))
+            offset += nbytes
+        self.metadata[key] = metadata
+
+    def load(self, key, locations):
+        slot = self[key]
+        offset = 0
+        for ptr, metadata in zip(locations, self.metadata[key]):
+            nbytes = self.codec.nbytes(ptr.size)
+            self.codec.decode(slot[offset:offset + nbytes], metadata, ptr)
+            offset += nbytes
+
+
 def get_symbol_data(symbol, timestep):
     timestep += symbol.time_order - 1
     ptrs = []
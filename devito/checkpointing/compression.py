@@ -0,0 +1,207 @@
+import zlib
+
+import numpy as np
+
+__all__ = ['make_codec']
+
+
+class Codec:
+
+    """
+    A codec for the checkpointed data.
+
+    A fixed-rate codec encodes each value with the same number of bytes,
+    `itemsize`, so the storage required by a checkpoint is known beforehand.
+    A variable-rate codec, with `itemsize = 0`, returns instead the encoded
+    data as its metadata. The maximum pointwise error, relative to the largest
+    magnitude in the encoded array, is bounded by `error_bound`.
+
+    Parameters
+    ----------
+    tolerance : float, optional
+        The maximum acceptable relative error. An exception is raised if the
+        codec cannot honour it.
+    """
+
+    itemsize = None
+    """The number of bytes per encoded value."""
+
+    error_bound = None
+    """The maximum relative error introduced by the codec."""
+
+    def __init__(self, tolerance=None):
+        if tolerance is not None and tolerance < self.error_bound:
+            raise ValueError("`%s` cannot honour a tolerance of %g, as its error "
+                             "bound is %g" % (self.name, tolerance, self.error_bound))
+        self.tolerance = tolerance
+
+    def __repr__(self):
+        return "%s[itemsize=%d]" % (self.name, self.itemsize)
+
+    @property
+    def name(self):
+        return self.__class__.__name__
+
+    def nbytes(self, size):
+        """The number of bytes required to encode `size` values."""
+        return size * self.itemsize
+
+    def encode(self, array, out):
+        """
+        Encode `array` into the uint8 buffer `out`, of `self.nbytes(array.size)`
+        bytes. Return any metadata needed to decode it.
+        """
+        raise NotImplementedError
+
+    def decode(self, buf, metadata, out):
+        """
+        Decode the uint8 buffer `buf` into `out`, given the metadata returned
+        by `encode`.
+        """
+        raise NotImplementedError
+
+
+class Float16(Codec):
+
+    """
+    Truncation to IEEE half precision, with a scaling factor per encoded
+    array. The values are normalized by their largest magnitude, so they
+    neither overflow nor underflow into the float16 subnormals, whatever
+    their magnitude.
+    """
+
+    itemsize = 2
+    error_bound = 2.**-11
+
+    def encode(self, array, out):
+        vmax = np.abs(array).max(initial=0)
+        if not np.isfinite(vmax):
+            raise ValueError("Cannot encode non-finite values in float16")
+        scale = float(vmax) or 1.
+        # Divide in the input precision, as float16 would underflow
+        np.copyto(out.view(np.float16), array.reshape(-1) / scale,
+                  casting='unsafe')
+        return scale
+
+    def decode(self, buf, metadata, out):
+        np.copyto(out, buf.view(np.float16).reshape(out.shape), casting='unsafe')
+        out *= metadata
+
+
+class BFloat16(Codec):
+
+    """
+    Truncation to bfloat16, that is the 16 most significant bits of a float32,
+    with round-to-nearest-even. The float32 range is preserved.
+    """
+
+    itemsize = 2
+    error_bound = 2.**-8
+
+    def encode(self, array, out):
+        bits = array.reshape(-1).astype(np.float32, copy=False).view(np.uint32)
+        rounding = np.uint32(0x7fff) + ((bits >> 16) & np.uint32(1))
+        np.copyto(out.view(np.uint16), (bits + rounding) >> 16, casting='unsafe')
+
+    def decode(self, buf, metadata, out):
+        bits = buf.view(np.uint16).astype(np.uint32) << 16
+        np.copyto(out, bits.view(np.float32).reshape(out.shape))
+
+
+class FixedPoint(Codec):
+
+    """
+    Quantization to signed integers of `8*itemsize` bits, with a scaling
+    factor per encoded array. The narrowest integer type honouring the
+    tolerance is used; 16-bit integers if no tolerance is specified.
+    """
+
+    def __init__(self, tolerance=None):
+        for dtype in (np.int8, np.int16):
+            self.dtype = dtype
+            if tolerance is not None and tolerance >= self.error_bound:
+                break
+        super().__init__(tolerance=tolerance)
+
+    @property
+    def itemsize(self):
+        return np.dtype(self.dtype).itemsize
+
+    @property
+    def error_bound(self):
+        return 0.5 / np.iinfo(self.dtype).max
+
+    def encode(self, array, out):
+        vmax = np.abs(array).max(initial=0)
+        scale = float(vmax) / np.iinfo(self.dtype).max or 1.
+        np.rint(array.reshape(-1) / scale, out=out.view(self.dtype), casting='unsafe')
+        return scale
+
+    def decode(self, buf, metadata, out):
+        np.multiply(buf.view(self.dtype).reshape(out.shape), metadata, out=out,
+                    casting='unsafe')
+
+
+class Zlib(Codec):
+
+    """
+    Lossless, variable-rate, compression with zlib. The bytes of the values are
+    first grouped by significance ("byte shuffling"), which makes the slowly
+    varying exponents and high-order mantissa bits of floating-point data much
+    more compressible. The compression ratio depends on the data; it's highest
+    for smooth or sparse wavefields.
+    """
+
+    itemsize = 0
+    error_bound = 0.
+
+    def __init__(self, tolerance=None, level=1):
+        super().__init__(tolerance=tolerance)
+        self.level = level
+
+    def __repr__(self):
+        return "%s[level=%d]" % (self.name, self.level)
+
+    def encode(self, array, out):
+        array = np.asarray(array).reshape(-1)
+        shuffled = array.view(np.uint8).reshape(array.size, array.itemsize).T
+        return zlib.compress(np.ascontiguousarray(shuffled), self.level)
+
+    def decode(self, buf, metadata, out):
+        shuffled = np.frombuffer(zlib.decompress(metadata), dtype=np.uint8)
+        array = shuffled.reshape(out.itemsize, out.size).T.copy().view(out.dtype)
+        np.copyto(out, array.reshape(out.shape))
+
+
+codecs = {
+    'float16': Float16,
+    'bfloat16': BFloat16,
+    'fixed': FixedPoint,
+    'zlib': Zlib,
+}
+
+
+def make_codec(scheme, tolerance=None):
+    """
+    Create a Codec for checkpoint compression.
+
+    Parameters
+    ----------
+    scheme : str
+        The compression scheme. Accepted values:
+
+            * 'float16': truncation to IEEE half precision (2x).
+            * 'bfloat16': truncation to bfloat16 (2x).
+            * 'fixed': quantization to 8-bit (4x) or 16-bit (2x) integers,
+              depending on `tolerance`.
+            * 'zlib': lossless compression; the ratio depends on the data.
+
+    tolerance : float, optional
+        The maximum acceptable pointwise error, relative to the largest
+        magnitude in each compressed array.
+    """
+    try:
+        return codecs[scheme](tolerance=tolerance)
+    except KeyError:
+        raise ValueError("Unknown compression scheme `%s`; accepted values are %s"
+                         % (scheme, list(codecs)))
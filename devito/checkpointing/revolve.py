@@ -0,0 +1,377 @@
+from math import comb
+import os
+import tempfile
+
+import numpy as np
+
+from devito.checkpointing.compression import make_codec
+from devito.exceptions import InvalidArgument
+from devito.tools import as_tuple
+
+__all__ = ['Checkpointer', 'forward_with_checkpoints', 'revolve']
+
+
+def split(nsteps, nfree):
+    """
+    The optimal number of steps to advance before taking a checkpoint, in
+    order to reverse `nsteps` steps with `nfree` available checkpoints (in
+    addition to the one holding the initial state), according to the binomial
+    checkpointing theory of Griewank and Walther.
+    """
+    c = nfree + 1
+
+    # The minimal number of repetitions, `r`, that is the maximum number of
+    # times any step gets computed
+    r = 0
+    while comb(c + r, c) < nsteps:
+        r += 1
+
+    return max(comb(c + r - 2, c) if r >= 2 else 1, nsteps - comb(c - 1 + r, r), 1)
+
+
+def revolve(nsteps, ncheckpoints):
+    """
+    The Revolve schedule to reverse `nsteps` steps with `ncheckpoints`
+    checkpoints, one of which holds the initial state.
+
+    Parameters
+    ----------
+    nsteps : int
+        The number of steps.
+    ncheckpoints : int
+        The number of checkpoints.
+
+    Returns
+    -------
+    list of tuples
+        The actions, in order of execution, which are one of:
+
+            * `('advance', t0, t1)`: execute the forward steps in `[t0, t1)`;
+            * `('store', slot, t)`: store the current state, which is the one
+              at step `t`, in the checkpoint `slot`;
+            * `('restore', slot, t)`: restore the state at step `t` from the
+              checkpoint `slot`;
+            * `('reverse', t)`: execute the adjoint of step `t`. The forward
+              step `t` is always the one executed last.
+
+        The checkpoints are used as a stack, so deeper slots are shorter lived.
+
+    Examples
+    --------
+    >>> from devito.checkpointing import revolve
+    >>> for action in revolve(4, 2):
+    ...     print(action)
+    ('store', 0, 0)
+    ('advance', 0, 1)
+    ('store', 1, 1)
+    ('advance', 1, 4)
+    ('reverse', 3)
+    ('restore', 1, 1)
+    ('advance', 1, 3)
+    ('reverse', 2)
+    ('restore', 1, 1)
+    ('advance', 1, 2)
+    ('reverse', 1)
+    ('restore', 0, 0)
+    ('advance', 0, 1)
+    ('reverse', 0)
+    """
+    if ncheckpoints < 1:
+        raise ValueError("At least one checkpoint is required")
+
+    actions = [('store', 0, 0)]
+
+    def reverse(lo, hi, slot):
+        # Reverse the steps in `[lo, hi)`, with the state at `lo` held in the
+        # checkpoint `slot` and being the current state
+        nfree = ncheckpoints - 1 - slot
+        live = True
+        while hi > lo:
+            if not live:
+                actions.append(('restore', slot, lo))
+
+            if nfree == 0 or hi - lo == 1:
+                actions.append(('advance', lo, hi))
+                actions.append(('reverse', hi - 1))
+                hi -= 1
+            else:
+                k = split(hi - lo, nfree)
+                actions.append(('advance', lo, lo + k))
+                actions.append(('store', slot + 1, lo + k))
+                reverse(lo + k, hi, slot + 1)
+                hi = lo + k
+
+            live = False
+
+    reverse(0, nsteps, 0)
+
+    return actions
+
+
+class Checkpointer:
+
+    """
+    Adjoint-state computation with binomial checkpointing, that is without
+    saving the entire history of the forward wavefields.
+
+    The forward Operator is executed storing the forward state at a few
+    timesteps (the checkpoints), chosen according to the Revolve algorithm.
+    In the reverse pass, the forward state required by the adjoint Operator
+    is recomputed from the checkpoints. The `n_checkpoints` checkpoints may
+    be split between a memory tier and a disk tier; the longest-lived
+    checkpoints, which are restored the least often, go to disk.
+
+    The forward state consists of the time buffer slices of the checkpointed
+    TimeFunctions, which are contiguous in memory, so storing and restoring
+    a checkpoint boils down to a few memcpy's, or to a few unbuffered disk
+    reads and writes.
+
+    Parameters
+    ----------
+    op_fwd : Operator
+        The forward Operator.
+    op_adj : Operator
+        The adjoint Operator, iterating backwards in time. Its timestep `t` is
+        executed right after the forward timestep `t`.
+    n_checkpoints : int, optional
+        The number of checkpoints. Defaults to the minimum number such that
+        no timestep is computed more than three times.
+    n_memory : int, optional
+        The number of checkpoints held in memory. The others are stored on disk.
+        Defaults to `n_checkpoints`.
+    path : str, optional
+        The directory in which the disk checkpoints are stored. Defaults to the
+        system temporary directory.
+    functions : TimeFunction or list of TimeFunction, optional
+        The forward state. Defaults to the TimeFunctions with a circular time
+        buffer written by `op_fwd`, or their replacements in the runtime
+        arguments.
+    compression : str, optional
+        Compress the in-memory checkpoints using one of the schemes described
+        in `make_codec.__doc__`. Defaults to None, that is no compression.
+    tolerance : float, optional
+        The error tolerance for the `compression` scheme.
+    fwd_args : dict, optional
+        The runtime arguments for `op_fwd` only.
+    adj_args : dict, optional
+        The runtime arguments for `op_adj` only.
+    **kwargs
+        The runtime arguments for both `op_fwd` and `op_adj`, such as the
+        time bounds.
+
+    Examples
+    --------
+    >>> from devito import Eq, Function, Grid, Operator, TimeFunction
+    >>> from devito.checkpointing import Checkpointer
+    >>> grid = Grid(shape=(4, 4))
+    >>> u = TimeFunction(name='u', grid=grid)
+    >>> v = TimeFunction(name='v', grid=grid)
+    >>> grad = Function(name='grad', grid=grid)
+    >>> op_fwd = Operator(Eq(u.forward, u + 1))
+    >>> op_adj = Operator([Eq(v.backward, v + 1), Eq(grad, grad + u)])
+    >>> cp = Checkpointer(op_fwd, op_adj, n_checkpoints=3, time_M=9)
+    >>> summary = cp.apply_forward()
+    >>> float(u.data[0, 0, 0])
+    10.0
+    >>> summary = cp.apply_reverse()
+    >>> float(grad.data[0, 0])
+    45.0
+    >>> cp.nsteps, cp.nforward
+    (10, 25)
+    """
+
+    def __init__(self, op_fwd, op_adj, n_checkpoints=None, n_memory=None,
+                 path=None, functions=None, compression=None, tolerance=None,
+                 fwd_args=None, adj_args=None, **kwargs):
+        fwd_args = {**kwargs, **(fwd_args or {})}
+        if functions is None:
+            # Any runtime replacements take precedence
+            functions = [fwd_args.get(f.name, f) for f in op_fwd.writes
+                         if f.is_TimeFunction and f._time_buffering]
+        self.functions = as_tuple(functions)
+        if not self.functions:
+            raise InvalidArgument("No TimeFunctions to checkpoint in `%s`"
+                                  % op_fwd.name)
+
+        d = self.functions[0].time_dim.root
+        self._fwd = op_fwd.prepare(**fwd_args)
+        try:
+            self.time_m = self._fwd.args[d.min_name]
+            self.time_M = self._fwd.args[d.max_name]
+        except KeyError:
+            raise InvalidArgument("Operator `%s` does not iterate over `%s`"
+                                  % (op_fwd.name, d))
+        kwargs.update({d.min_name: self.time_m, d.max_name: self.time_M})
+        self._adj = op_adj.prepare(**kwargs, **(adj_args or {}))
+        self._time_names = (d.min_name, d.max_name)
+
+        self.nsteps = self.time_M - self.time_m + 1
+        if n_checkpoints is None:
+            n_checkpoints = 1
+            while comb(n_checkpoints + 2, 2) < self.nsteps:
+                n_checkpoints += 1
+        self.n_checkpoints = n_checkpoints = min(n_checkpoints, self.nsteps)
+        if n_memory is None:
+            n_memory = n_checkpoints
+        self.n_memory = n_memory = min(n_memory, n_checkpoints)
+
+        # The forward state, as contiguous slices of the time buffers
+        self._slices = [(f, i) for f in self.functions for i in range(f.time_order)]
+
+        # The checkpoints at the bottom of the stack go to disk
+        self.n_disk = n_checkpoints - n_memory
+        nbytes = sum(f._data_allocated[0].nbytes for f, _ in self._slices)
+        if self.n_disk > 0:
+            fd, fname = tempfile.mkstemp(prefix='devito-checkpoints-', dir=path)
+            os.unlink(fname)
+            self._fd = fd
+            self._disk_nbytes = nbytes
+        else:
+            self._fd = None
+
+        if compression is None:
+            self.codec = None
+        else:
+            self.codec = make_codec(compression, tolerance)
+            nbytes = sum(self.codec.nbytes(f._data_allocated[0].size)
+                         for f, _ in self._slices)
+        self._memory = np.empty((n_memory, nbytes), dtype=np.uint8)
+        self._metadata = {}
+
+        self._actions = revolve(self.nsteps, n_checkpoints)
+        self._nforward = [n for n, (k, *_) in enumerate(self._actions)
+                          if k == 'reverse'][0]
+
+        # Statistics
+        self.nforward = 0
+
+    def __repr__(self):
+        return ("Checkpointer[nsteps=%d, n_checkpoints=%d, n_disk=%d]"
+                % (self.nsteps, self.n_checkpoints, self.n_disk))
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Release the disk checkpoints, if any."""
+        if getattr(self, '_fd', None) is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _buffers(self, t):
+        """The time buffer slices making up the forward state at step `t`."""
+        for f, i in self._slices:
+            data = f._data_allocated
+            yield data[(t - i) % f.time_size]
+
+    def _store(self, slot, t):
+        if slot < self.n_disk:
+            offset = slot*self._disk_nbytes
+            for buf in self._buffers(t):
+                if os.pwrite(self._fd, buf, offset) != buf.nbytes:
+                    raise OSError("Incomplete write of checkpoint %d" % slot)
+                offset += buf.nbytes
+        else:
+            storage = self._memory[slot - self.n_disk]
+            offset = 0
+            metadata = []
+            for buf in self._buffers(t):
+                if self.codec is None:
+                    nbytes = buf.nbytes
+                    np.copyto(storage[offset:offset + nbytes].view(buf.dtype),
+                              buf.reshape(-1))
+                else:
+                    nbytes = self.codec.nbytes(buf.size)
+                    metadata.append(self.codec.encode(buf,
+                                                      storage[offset:offset + nbytes]))
+                offset += nbytes
+            self._metadata[slot] = metadata
+
+    def _restore(self, slot, t):
+        if slot < self.n_disk:
+            offset = slot*self._disk_nbytes
+            for buf in self._buffers(t):
+                if os.preadv(self._fd, [buf], offset) != buf.nbytes:
+                    raise OSError("Incomplete read of checkpoint %d" % slot)
+                offset += buf.nbytes
+        else:
+            storage = self._memory[slot - self.n_disk]
+            offset = 0
+            metadata = iter(self._metadata[slot])
+            for buf in self._buffers(t):
+                if self.codec is None:
+                    nbytes = buf.nbytes
+                    np.copyto(buf.reshape(-1),
+                              storage[offset:offset + nbytes].view(buf.dtype))
+                else:
+                    nbytes = self.codec.nbytes(buf.size)
+                    self.codec.decode(storage[offset:offset + nbytes],
+                                      next(metadata), buf)
+                offset += nbytes
+
+    def _execute(self, actions):
+        time_m, time_M = self._time_names
+        for action, *args in actions:
+            if action == 'advance':
+                t0, t1 = args
+                self._fwd(**{time_m: self.time_m + t0, time_M: self.time_m + t1 - 1})
+                self.nforward += t1 - t0
+            elif action == 'reverse':
+                t = self.time_m + args[0]
+                self._adj(**{time_m: t, time_M: t})
+            elif action == 'store':
+                slot, t = args
+                self._store(slot, self.time_m + t)
+            else:
+                slot, t = args
+                self._restore(slot, self.time_m + t)
+
+    def apply_forward(self):
+        """
+        Execute the forward Operator over all timesteps, storing the checkpoints.
+
+        Returns
+        -------
+        PerformanceSummary
+            The performance summary of the forward Operator.
+        """
+        self._execute(self._actions[:self._nforward])
+
+        return self._fwd.summary()
+
+    def apply_reverse(self):
+        """
+        Execute the adjoint Operator over all timesteps, backwards, recomputing
+        the forward state from the checkpoints as needed.
+
+        Returns
+        -------
+        PerformanceSummary
+            The performance summary of the adjoint Operator, over all timesteps.
+        """
+        self._execute(self._actions[self._nforward:])
+
+        return self._adj.summary()
+
+
+def forward_with_checkpoints(op_fwd, op_adj, **kwargs):
+    """
+    Execute `op_fwd`, and then `op_adj` backwards in time, using binomial
+    checkpointing to recompute the forward state required by `op_adj`.
+
+    This is a shortcut for `Checkpointer(op_fwd, op_adj, **kwargs)`, followed
+    by `apply_forward` and `apply_reverse`. If some inputs of `op_adj`, such
+    as the adjoint source, depend on the outcome of `op_fwd`, a Checkpointer
+    should be used directly.
+
+    Returns
+    -------
+    Checkpointer
+        The executed Checkpointer.
+    """
+    checkpointer = Checkpointer(op_fwd, op_adj, **kwargs)
+    checkpointer.apply_forward()
+    checkpointer.apply_reverse()
+    checkpointer.close()
+
+    return checkpointer
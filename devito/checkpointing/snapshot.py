@@ -0,0 +1,287 @@
+from queue import Queue
+from threading import Thread
+import os
+import tempfile
+
+import numpy as np
+
+from devito.exceptions import InvalidArgument
+from devito.types import TimeFunction
+
+__all__ = ['SnapshotStream']
+
+
+class SnapshotStream:
+
+    """
+    Stream the snapshots of a TimeFunction, taken every `factor` timesteps, to
+    a file, and read them back, in reverse order, in a subsequent adjoint run.
+
+    In `forward`, the Operator is executed in chunks of `factor` timesteps. At
+    the end of each chunk, the latest snapshot is copied into one of two host
+    buffers and handed over to a helper thread, which writes it to the file
+    while the next chunk is being computed. Likewise, in `backward`, a helper
+    thread prefetches the snapshots, in reverse order, while the Operator is
+    computing. Thus, only a constant number of snapshots is ever held in
+    memory, rather than one per saved timestep as with `save=nt`.
+
+    Parameters
+    ----------
+    function : TimeFunction
+        The snapshotted field, typically with a circular time buffer.
+    factor : int
+        The snapshotting frequency, in timesteps. The snapshots are taken at
+        the timesteps that are a multiple of `factor`.
+    path : str, optional
+        The file in which the snapshots are stored. With MPI, each rank writes
+        the snapshots of its own subdomain to a separate file, suffixed by the
+        rank. Defaults to an anonymous temporary file, which gets deleted upon
+        `close`. The snapshot taken at timestep `t` is stored, in raw binary
+        format, at byte offset `(t // factor) * nbytes`.
+
+    Examples
+    --------
+    >>> from devito import (ConditionalDimension, Eq, Function, Grid, Operator,
+    ...                     TimeFunction)
+    >>> from devito.checkpointing import SnapshotStream
+    >>> grid = Grid(shape=(4, 4))
+    >>> u = TimeFunction(name='u', grid=grid)
+    >>> stream = SnapshotStream(u, factor=4)
+
+    Write the snapshots of `u` at timesteps 0, 4, 8 and 12 to a file
+
+    >>> op = Operator(Eq(u.forward, u + 1))
+    >>> stream.forward(op, time_M=11)
+    >>> stream.nsnapshots
+    4
+
+    Read them back, in reverse order, one at a time, into `usnap`
+
+    >>> usnap = Function(name='usnap', grid=grid)
+    >>> grad = Function(name='grad', grid=grid)
+    >>> tsub = ConditionalDimension(name='tsub', parent=grid.time_dim, factor=4)
+    >>> op = Operator(Eq(grad, grad + usnap, implicit_dims=tsub))
+    >>> stream.backward(op, usnap, time_M=11)
+    >>> float(grad.data[0, 0])
+    12.0
+    >>> stream.close()
+    """
+
+    def __init__(self, function, factor, path=None):
+        if not isinstance(function, TimeFunction):
+            raise InvalidArgument("Expected a TimeFunction, not `%s`" % type(function))
+        if factor < 1:
+            raise InvalidArgument("`factor` must be a positive integer")
+
+        self.function = function
+        self.factor = factor
+
+        distributor = function.grid.distributor if function.grid else None
+        if path is None:
+            fd, fname = tempfile.mkstemp(prefix='devito-snapshots-')
+            # Unlinked straight away, so that it vanishes upon `close` or
+            # if the process terminates
+            os.unlink(fname)
+            self.path = None
+        else:
+            if distributor is not None and distributor.is_parallel:
+                path = '%s.%d' % (path, distributor.myrank)
+            fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+            self.path = path
+        self._fd = fd
+
+        # The indices of the snapshots written so far
+        self._written = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return "SnapshotStream[%s, factor=%d]" % (self.function.name, self.factor)
+
+    @property
+    def shape(self):
+        """The shape of a snapshot."""
+        return self.function.shape[1:]
+
+    @property
+    def dtype(self):
+        return self.function.dtype
+
+    @property
+    def nbytes(self):
+        """The size of a snapshot in bytes."""
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+    @property
+    def nsnapshots(self):
+        """The number of snapshots written so far."""
+        return len(self._written)
+
+    def close(self):
+        """Close the underlying file."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _prepare(self, op, **kwargs):
+        call = op.prepare(**kwargs)
+
+        d = self.function.time_dim.root
+        try:
+            time_m = call.args[d.min_name]
+            time_M = call.args[d.max_name]
+        except KeyError:
+            raise InvalidArgument("Operator `%s` does not iterate over `%s`"
+                                  % (op.name, d))
+
+        def run(t0, t1):
+            call(**{d.min_name: t0, d.max_name: t1})
+
+        return run, time_m, time_M
+
+    def _snapshot(self, f, t=None):
+        """A local view of the domain region of `f`, possibly at timestep `t`."""
+        data = f._data_allocated[f._mask_domain]
+        if t is None:
+            return data
+        else:
+            return data[t % f.time_size]
+
+    def forward(self, op, **kwargs):
+        """
+        Execute `op`, writing a snapshot every `factor` timesteps.
+
+        Parameters
+        ----------
+        op : Operator
+            The Operator computing `function`, e.g. a forward propagator.
+        **kwargs
+            The runtime arguments for `op`, as in ``Operator.apply``.
+        """
+        run, time_m, time_M = self._prepare(op, **kwargs)
+
+        # Double buffering: two buffers circulate between the main thread,
+        # which fills them, and the helper thread, which drains them to disk
+        free = Queue()
+        for _ in range(2):
+            free.put(np.empty(self.shape, dtype=self.dtype))
+        pending = Queue()
+        errors = []
+
+        def write():
+            while True:
+                item = pending.get()
+                if item is None:
+                    return
+                n, buf = item
+                try:
+                    if os.pwrite(self._fd, buf, n*self.nbytes) != self.nbytes:
+                        raise OSError("Incomplete write of snapshot %d" % n)
+                except OSError as e:
+                    errors.append(e)
+                free.put(buf)
+
+        def put(t):
+            if t % self.factor == 0 and not errors:
+                buf = free.get()
+                np.copyto(buf, self._snapshot(self.function, t))
+                pending.put((t // self.factor, buf))
+                self._written.add(t // self.factor)
+
+        thread = Thread(target=write, daemon=True)
+        thread.start()
+        try:
+            t = time_m
+            put(t)
+            while t <= time_M:
+                t1 = min((t // self.factor + 1) * self.factor, time_M + 1)
+                run(t, t1 - 1)
+                t = t1
+                put(t)
+        finally:
+            pending.put(None)
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+    def backward(self, op, target, **kwargs):
+        """
+        Execute `op`, typically iterating backwards in time, loading into
+        `target` the snapshots previously written by `forward`.
+
+        The time loop is executed in chunks, such that the first timestep of
+        each chunk (in increasing order) is a multiple of `factor`. Before
+        executing a chunk starting at timestep `t`, `target` is loaded with
+        the snapshot taken at timestep `t`.
+
+        Parameters
+        ----------
+        op : Operator
+            The Operator consuming the snapshots, e.g. an adjoint propagator.
+        target : Function
+            The Function the snapshots are loaded into, which must be used
+            by `op`.
+        **kwargs
+            The runtime arguments for `op`, as in ``Operator.apply``.
+        """
+        if target.shape != self.shape:
+            raise InvalidArgument("Expected `%s` with shape %s, not %s"
+                                  % (target.name, self.shape, target.shape))
+
+        run, time_m, time_M = self._prepare(op, **kwargs)
+
+        # The chunks, in order of execution
+        chunks = []
+        t = time_M
+        while t >= time_m:
+            t0 = max(time_m, t // self.factor * self.factor)
+            chunks.append((t0, t))
+            t = t0 - 1
+
+        snapshots = [t0 // self.factor for t0, _ in chunks if t0 % self.factor == 0]
+        missing = set(snapshots) - self._written
+        if missing:
+            raise InvalidArgument("Snapshots at timesteps %s were never written"
+                                  % sorted(i*self.factor for i in missing))
+
+        free = Queue()
+        for _ in range(2):
+            free.put(np.empty(self.shape, dtype=self.dtype))
+        ready = Queue()
+        done = []
+
+        def read():
+            for n in snapshots:
+                buf = free.get()
+                if done:
+                    return
+                try:
+                    if os.preadv(self._fd, [buf], n*self.nbytes) != self.nbytes:
+                        raise OSError("Incomplete read of snapshot %d" % n)
+                except OSError as e:
+                    ready.put(e)
+                    return
+                ready.put(buf)
+
+        thread = Thread(target=read, daemon=True)
+        thread.start()
+        try:
+            view = self._snapshot(target)
+            for t0, t1 in chunks:
+                if t0 % self.factor == 0:
+                    buf = ready.get()
+                    if isinstance(buf, Exception):
+                        raise buf
+                    np.copyto(view, buf)
+                    free.put(buf)
+                run(t0, t1)
+        finally:
+            # Unblock the helper thread, if still waiting for a buffer
+            done.append(True)
+            free.put(None)
+            thread.join()
@@ -1,18 +1,23 @@
 from collections import OrderedDict
 from itertools import combinations, product
 from functools import total_ordering
+import hashlib
+import json
+import os
+
+import numpy as np
 
 from devito.arch import KNL, KNL7210
-from devito.ir import Backward, retrieve_iteration_tree
+from devito.ir import Backward, FindSymbols, retrieve_iteration_tree
 from devito.logger import perf, warning as _warning
 from devito.mpi.distributed import MPI, MPINeighborhood
 from devito.mpi.routines import MPIMsgEnriched
 from devito.parameters import configuration
 from devito.symbolics import normalize_args
-from devito.tools import filter_ordered, flatten, is_integer, prod
+from devito.tools import filter_ordered, flatten, is_integer, make_tempdir, prod
 from devito.types import Timer
 
-__all__ = ['autotune']
+__all__ = ['autotune', 'autotuning_db']
 
 
 def autotune(operator, args, level, mode):
@@ -40,6 +45,16 @@ def autotune(operator, args, level, mode):
         raise ValueError("The accepted `(level, mode)` combinations are `%s`; "
                          "provided `%s` instead" % (accepted, key))
 
+    # Reuse the outcome of a previous autotuning, possibly by another process
+    comm = args.comm
+    db_key = autotuning_db.key(operator, args)
+    tuned = autotuning_db.load(db_key, level, args)
+    if tuned is not None:
+        args.update(tuned)
+        log("selected <%s> from the autotuning database"
+            % (','.join('%s=%s' % i for i in tuned.items())))
+        return args, {'runs': 0, 'tpr': 0, 'tuned': tuned}
+
     # We get passed all the arguments, but the cfunction only requires a subset
     at_args = OrderedDict([(p.name, args[p.name]) for p in operator.parameters])
 
@@ -103,7 +118,10 @@ def autotune(operator, args, level, mode):
         # Tunable arguments
         try:
             tunable = []
-            tunable.append(generate_block_shapes(blockable, args, level))
+            block_shapes = generate_block_shapes(blockable, args, level)
+            if configuration['autotuning-search'] == 'model':
+                block_shapes = prune_block_shapes(block_shapes, tree, blockable, args)
+            tunable.append(block_shapes)
             tunable.append(generate_nthreads(operator.nthreads, args, level))
             tunable = list(product(*tunable))
         except ValueError:
@@ -113,6 +131,12 @@ def autotune(operator, args, level, mode):
         # Symbolic number of loop-blocking blocks per thread
         nblocks_per_thread = calculate_nblocks(tree, blockable) / operator.nthreads
 
+        # With live halo exchanges, all ranks must perform the same runs, while
+        # the candidates depend on the local extents, so rank 0 decides
+        collective = mode == 'runtime' and comm is not MPI.COMM_NULL
+        if collective:
+            tunable = comm.bcast(tunable, root=0)
+
         for bs, nt in tunable:
             # Can we safely autotune over the given time range?
             if not check_time_bounds(stepper, at_args, args, mode):
@@ -123,9 +147,12 @@ def autotune(operator, args, level, mode):
             at_args.update(dict(run))
 
             # Drop run if not at least one block per thread
-            if not configuration['develop-mode'] and \
-                    nblocks_per_thread.subs(normalize_args(at_args)) < 1:
-                continue
+            if not configuration['develop-mode']:
+                drop = bool(nblocks_per_thread.subs(normalize_args(at_args)) < 1)
+                if collective:
+                    drop = comm.bcast(drop, root=0)
+                if drop:
+                    continue
 
             # Run the Operator
             operator.cfunction(*list(at_args.values()))
@@ -151,15 +178,20 @@ def autotune(operator, args, level, mode):
                 record = mapper.setdefault(k, Record())
                 record.add(min(i, key=i.get), min(i.values()))
         best = min(mapper, key=mapper.get)
+        elapsed = mapper[best].time
         best = OrderedDict(best + tuple(mapper[best].args))
         best.pop(None, None)
-        log("selected <%s>" % (','.join('%s=%s' % i for i in best.items())))
+        npoints = prod(extent(operator, args).values())*timesteps
+        gpointss = npoints / elapsed / 10**9 if elapsed > 0 else 0.
+        log("selected <%s> after %d runs, achieving %.2f GPts/s"
+            % (','.join('%s=%s' % i for i in best.items()), runs, gpointss))
     except ValueError:
         warning("could not perform any runs")
         return args, {}
 
     # Update the argument list with the tuned arguments
     args.update(best)
+    autotuning_db.save(db_key, level, best, elapsed / max(timesteps, 1), comm)
 
     # In `runtime` mode, some timesteps have been executed already, so we must
     # adjust the time range
@@ -170,10 +202,144 @@ def autotune(operator, args, level, mode):
     summary['runs'] = runs
     summary['tpr'] = timesteps  # tpr -> timesteps per run
     summary['tuned'] = dict(best)
+    summary['gpointss'] = gpointss
 
     return args, summary
 
 
+class AutotuningDB:
+
+    """
+    A persistent, on-disk database of autotuning outcomes.
+
+    An entry is keyed by the Operator's shared object name, the global extent
+    of its iteration space, the MPI topology, the number of threads and the
+    target platform. It stores
+    the tuned arguments, the autotuning level at which they were found, and
+    the time per timestep they achieved. An entry is reused by any subsequent
+    autotuning, in any process, with the same key and an equal or lower level;
+    autotuning at a higher level replaces the entry only if it finds a faster
+    configuration.
+
+    Each entry is stored in a separate JSON file, atomically replaced upon
+    update, so that concurrent processes never observe a partially written
+    entry. With MPI, the lookup is collective -- either all ranks reuse an
+    entry or none does, as otherwise the ranks would perform a different
+    number of runs -- and only rank 0 updates the database.
+
+    Notes
+    -----
+    The database is only used if `configuration['autotuning-db']` is set.
+    """
+
+    @property
+    def enabled(self):
+        return bool(configuration['autotuning-db'])
+
+    @property
+    def path(self):
+        """The directory in which the entries are stored."""
+        path = configuration['autotuning-db']
+        if path is True:
+            return make_tempdir('autotuning')
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def key(self, operator, args):
+        """
+        The key of `operator` in the database, given its runtime arguments.
+        Return None if the database is disabled.
+        """
+        if not self.enabled:
+            return None
+
+        nthreads = operator.nthreads
+        if nthreads != 1:
+            nthreads = int(args[nthreads.name])
+
+        # The local extents may differ across ranks, so the global ones are used
+        ret = extent(operator, args)
+        topology = None
+        if args.comm is not MPI.COMM_NULL:
+            distributor = args.grid.distributor
+            topology = [int(i) for i in distributor.topology]
+            for d, n in zip(distributor.dimensions, topology):
+                if d.name in ret:
+                    # Each slab of ranks along `d` spans its global extent
+                    ret[d.name] = args.comm.allreduce(ret[d.name]) * n // \
+                        distributor.nprocs
+
+        return {'soname': operator._soname,
+                'extent': ret,
+                'topology': topology,
+                'nthreads': nthreads,
+                'platform': configuration['platform'].name}
+
+    def _filename(self, key):
+        digest = hashlib.sha1(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        return os.path.join(self.path, '%s.json' % digest)
+
+    def _read(self, key):
+        try:
+            with open(self._filename(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('key') != key:
+            return None
+        return entry
+
+    def load(self, key, level, args):
+        """
+        Return the tuned arguments for `key`, as found by an autotuning at
+        level `level` or higher, or None if no such entry exists.
+        """
+        if key is None:
+            return None
+        entry = self._read(key)
+        if entry is None or levels.index(entry['level']) < levels.index(level):
+            tuned = None
+        else:
+            tuned = OrderedDict(entry['tuned'])
+            if not all(k in args for k in tuned):
+                tuned = None
+        if args.comm is not MPI.COMM_NULL:
+            if not args.comm.allreduce(tuned is not None, op=MPI.LAND):
+                tuned = None
+        return tuned
+
+    def save(self, key, level, tuned, elapsed, comm=None):
+        """
+        Record the arguments `tuned`, found by an autotuning at level `level`,
+        achieving `elapsed` seconds per timestep, unless the database already
+        holds a faster configuration. If `comm` is provided, only its rank 0
+        updates the database.
+        """
+        if key is None:
+            return
+        if comm is not None and comm is not MPI.COMM_NULL and comm.rank != 0:
+            return
+        entry = self._read(key)
+        if entry is not None:
+            level = max(level, entry['level'], key=levels.index)
+            if entry['elapsed'] <= elapsed:
+                tuned, elapsed = entry['tuned'], entry['elapsed']
+        entry = {'key': key,
+                 'level': level,
+                 'tuned': {k: int(v) for k, v in tuned.items()},
+                 'elapsed': elapsed}
+
+        # Write to a process-private file first, then atomically replace
+        filename = self._filename(key)
+        tmpname = '%s.%d' % (filename, os.getpid())
+        try:
+            with open(tmpname, 'w') as f:
+                json.dump(entry, f, indent=2)
+            os.replace(tmpname, filename)
+        except OSError as e:
+            warning("could not update the autotuning database (%s)" % e)
+
+
 @total_ordering
 class Record:
 
@@ -259,6 +425,68 @@ def finalize_time_bounds(stepper, at_args, args, mode):
         args[dim.max_name] = args[dim.max_name]
 
 
+def extent(operator, args):
+    """The extent of the iteration space along each root space Dimension."""
+    ret = OrderedDict()
+    for d in operator.dimensions:
+        if d.is_Space and d.root is d and d.max_name in args:
+            ret[d.name] = int(args[d.max_name] - args[d.min_name] + 1)
+    return ret
+
+
+def prune_block_shapes(block_shapes, tree, blockable, args):
+    """
+    Model-guided pruning of the candidate block shapes.
+
+    The working set of a block, that is the data accessed by all Functions
+    within a block, is estimated and compared to the capacity of the caches
+    of a core. Only the `options['model-trials']` block shapes whose working
+    set best matches the L2 capacity are retained, excluding those exceeding
+    the L3 capacity. If the cache sizes are unknown, no pruning takes place.
+    """
+    platform = configuration['platform']
+    l2 = platform.cache_size(2)
+    l3 = platform.cache_size(3)
+    if not l2:
+        return block_shapes
+
+    roots = filter_ordered(i.dim.root for i in tree if i.dim.is_Space)
+    extents = {d: args[d.max_name] - args[d.min_name] + 1 for d in roots}
+
+    # The number of bytes accessed per grid point, across all time buffers
+    nbytes = 0
+    for f in FindSymbols().visit(tree.root):
+        if not f.is_AbstractFunction or getattr(f, 'is_SparseFunction', False) \
+                or not any(d.root in roots for d in f.dimensions):
+            continue
+        nbuffers = f.time_order + 1 if f.is_TimeFunction else 1
+        nbytes += np.dtype(f.dtype).itemsize * nbuffers
+
+    steps = {d.step.name: d.root for d in blockable}
+
+    def working_set(bs):
+        # With hierarchical blocking, the innermost block is the one that
+        # should fit in cache
+        sizes = {}
+        for k, v in bs:
+            d = steps[k]
+            sizes[d] = min(sizes.get(d, v), v)
+        return nbytes * prod(sizes.get(d, extents[d]) for d in roots)
+
+    ws = {bs: working_set(bs) for bs in block_shapes}
+    candidates = [bs for bs in block_shapes if not l3 or ws[bs] <= l3]
+    if not candidates:
+        candidates = [min(block_shapes, key=ws.get)]
+    candidates.sort(key=lambda bs: abs(np.log(ws[bs] / l2)))
+
+    ret = candidates[:options['model-trials']]
+    log("model retained %d block shapes out of %d"
+        % (len(ret), len(block_shapes)))
+
+    # Preserve the original ordering
+    return [bs for bs in block_shapes if bs in ret]
+
+
 def calculate_nblocks(tree, blockable):
     block_indices = [n for n, i in enumerate(tree) if i.dim in blockable]
     index = block_indices[0]
@@ -375,10 +603,16 @@ def generate_nthreads(nthreads, args, level):
     return ret
 
 
+levels = ['basic', 'aggressive', 'max']
+"""The autotuning levels, by increasing aggressiveness."""
+
+autotuning_db = AutotuningDB()
+
 options = {
     'squeezer': 4,
     'blocksize-l0': (8, 16, 24, 32, 64, 96, 128),
     'blocksize-l1': (8, 16, 32),
+    'model-trials': 4,
 }
 """Autotuning options."""
 
@@ -3,3 +3,5 @@ from devito.data.allocators import *  # noqa
 from devito.data.decomposition import *  # noqa
 from devito.data.data import *  # noqa
 from devito.data.utils import *  # noqa
+from devito.data.dlpack import *  # noqa
+from devito.data.engine import *  # noqa
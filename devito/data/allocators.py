@@ -1,4 +1,5 @@
 import abc
+from collections import OrderedDict, defaultdict
 from functools import reduce
 from operator import mul
 import ctypes
@@ -6,9 +7,11 @@ from ctypes.util import find_library
 import mmap
 import os
 import sys
+import tempfile
 
 import numpy as np
 
+from devito.data.dlpack import from_dlpack, is_dlpack
 from devito.logger import logger
 from devito.parameters import configuration
 from devito.tools import dtype_to_ctype, is_integer
@@ -29,6 +32,9 @@ class AbstractMemoryAllocator:
     guaranteed_alignment = 64
     """Guaranteed data alignment."""
 
+    zero_init = True
+    """Whether the allocated data must be zero-initialized before use."""
+
     @abc.abstractmethod
     def alloc(self, shape, dtype, padding=0):
         """
@@ -253,6 +259,98 @@ class GuardAllocator(PosixAllocator):
         self.lib.free(c_pointer)
 
 
+class MmapAllocator(PosixAllocator):
+
+    """
+    Memory allocator placing the data in a memory-mapped file. The allocated
+    memory is aligned to page boundaries.
+
+    The pages are written back to the file, rather than to swap, whenever the
+    operating system needs to reclaim memory. This allows, for example, to
+    allocate TimeFunctions with `save=nt` larger than the available RAM: the
+    snapshots are spilled to disk as they are computed, and later streamed
+    back in upon access.
+
+    The file is unlinked as soon as it's mapped, so the disk space is reclaimed
+    when the memory is freed, or as soon as the process terminates.
+
+    Parameters
+    ----------
+    directory : str, optional
+        The directory in which the backing files are created. This should
+        preferably be a fast, local, disk. Defaults to the system temporary
+        directory.
+
+    Examples
+    --------
+    >>> from devito import Grid, TimeFunction
+    >>> from devito.data.allocators import MmapAllocator
+    >>> grid = Grid(shape=(4, 4))
+    >>> u = TimeFunction(name='u', grid=grid, save=10, allocator=MmapAllocator())
+    >>> u.data.shape
+    (10, 4, 4)
+
+    A MmapAllocator may also be registered, and then retrieved by name, through
+    `register_allocator`.
+    """
+
+    _attempted_init = False
+    lib = None
+
+    zero_init = False
+    """
+    The backing files are freshly created and sparse, so they already read as
+    zeros. Zero-filling them would instead touch, and eventually write back to
+    disk, every single page.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory
+
+    @classmethod
+    def initialize(cls):
+        super().initialize()
+        if cls.lib is not None:
+            cls.lib.mmap.restype = ctypes.c_void_p
+            cls.lib.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int,
+                                     ctypes.c_int, ctypes.c_int, ctypes.c_long]
+            cls.lib.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+
+    def _alloc_C_libcall(self, size, ctype):
+        if not self.available():
+            raise RuntimeError("Couldn't find `libc`'s `mmap` to allocate memory")
+
+        # Round up to a multiple of the page size. This also works around the
+        # fact that `mmap` does not accept 0-size mappings
+        pagesize = self.lib.getpagesize()
+        nbytes = size * ctypes.sizeof(ctype)
+        nbytes = max(pagesize, (nbytes + pagesize - 1) // pagesize * pagesize)
+        c_bytesize = ctypes.c_size_t(nbytes)
+
+        fd, path = tempfile.mkstemp(prefix='devito-', suffix='.mmap',
+                                    dir=self.directory)
+        try:
+            os.unlink(path)
+            os.ftruncate(fd, nbytes)
+            c_pointer = self.lib.mmap(None, c_bytesize,
+                                      mmap.PROT_READ | mmap.PROT_WRITE,
+                                      mmap.MAP_SHARED, fd, 0)
+        except OSError:
+            return None, None
+        finally:
+            # The mapping holds its own reference to the file
+            os.close(fd)
+
+        if c_pointer is None or c_pointer == ctypes.c_void_p(-1).value:
+            return None, None
+        else:
+            c_pointer = ctypes.c_void_p(c_pointer)
+            return c_pointer, (c_pointer, c_bytesize)
+
+    def free(self, c_pointer, c_bytesize):
+        self.lib.munmap(c_pointer, c_bytesize)
+
+
 class NumaAllocator(MemoryAllocator):
 
     """
@@ -337,6 +435,115 @@ class NumaAllocator(MemoryAllocator):
         return self._node == 'local'
 
 
+class PoolAllocator(MemoryAllocator):
+
+    """
+    Memory allocator recycling the blocks of memory released by dead Data.
+
+    The blocks are obtained from an underlying MemoryAllocator, and their size
+    is rounded up to a multiple of the page size. Upon `free`, a block is
+    retained in a pool, bucketed by size, rather than returned to the system;
+    a subsequent allocation of the same size class reuses it. This eliminates
+    the allocation churn incurred when Functions of the same shape are
+    repeatedly created and destroyed, for example in a shot loop.
+
+    Parameters
+    ----------
+    allocator : MemoryAllocator, optional
+        The underlying allocator. Defaults to ALLOC_ALIGNED.
+    capacity : int, optional
+        The maximum number of bytes retained by the pool. When exceeded, the
+        least recently released blocks are returned to the underlying allocator.
+        Defaults to None, that is an unbounded pool.
+    zero_init : bool, optional
+        If False, the Data is not zero-initialized upon allocation, so a
+        recycled block retains whatever values it previously held. This is
+        only safe if the data is entirely overwritten before being read.
+        Defaults to True.
+
+    Examples
+    --------
+    >>> from devito import Grid, TimeFunction, clear_cache
+    >>> from devito.data.allocators import PoolAllocator
+    >>> pool = PoolAllocator(capacity=2**30)
+    >>> grid = Grid(shape=(4, 4))
+    >>> u = TimeFunction(name='u', grid=grid, allocator=pool)
+    >>> u.data.fill(1.)
+
+    The block is released to the pool once the Function is garbage collected
+
+    >>> del u
+    >>> clear_cache()
+    >>> pool.nbytes
+    4096
+    >>> v = TimeFunction(name='v', grid=grid, allocator=pool)
+    >>> v.data.shape
+    (2, 4, 4)
+    >>> pool.nbytes
+    0
+    """
+
+    def __init__(self, allocator=None, capacity=None, zero_init=True):
+        self.allocator = allocator or ALLOC_ALIGNED
+        self.capacity = capacity
+        self.zero_init = zero_init
+
+        # Size class -> released blocks, in order of release
+        self._buckets = defaultdict(list)
+        # Released blocks, in order of release, for LRU eviction
+        self._lru = OrderedDict()
+
+    @property
+    def nbytes(self):
+        """The number of bytes currently retained by the pool."""
+        return sum(self._lru.values())
+
+    def available(self):
+        return self.allocator.available()
+
+    def _alloc_C_libcall(self, size, ctype):
+        pagesize = mmap.PAGESIZE
+        nbytes = size * ctypes.sizeof(ctype)
+        nbytes = max(pagesize, (nbytes + pagesize - 1) // pagesize * pagesize)
+
+        bucket = self._buckets[nbytes]
+        if bucket:
+            # Reuse the most recently released block, likely still in cache
+            c_pointer, memfree_args = bucket.pop()
+            self._lru.pop(c_pointer.value)
+        else:
+            c_pointer, memfree_args = self.allocator._alloc_C_libcall(nbytes,
+                                                                      ctypes.c_char)
+            if c_pointer is None:
+                # Perhaps the memory is held by the pool itself
+                self.clear()
+                c_pointer, memfree_args = \
+                    self.allocator._alloc_C_libcall(nbytes, ctypes.c_char)
+                if c_pointer is None:
+                    return None, None
+
+        return c_pointer, (c_pointer, nbytes, memfree_args)
+
+    def free(self, c_pointer, nbytes, memfree_args):
+        self._buckets[nbytes].append((c_pointer, memfree_args))
+        self._lru[c_pointer.value] = nbytes
+
+        if self.capacity is not None:
+            while self._lru and self.nbytes > self.capacity:
+                self._evict()
+
+    def _evict(self):
+        _, nbytes = self._lru.popitem(last=False)
+        # Within a bucket, blocks are ordered by release too
+        _, memfree_args = self._buckets[nbytes].pop(0)
+        self.allocator.free(*memfree_args)
+
+    def clear(self):
+        """Return all of the retained blocks to the underlying allocator."""
+        while self._lru:
+            self._evict()
+
+
 class DataReference(MemoryAllocator):
 
     """
@@ -346,7 +553,11 @@ class DataReference(MemoryAllocator):
     Parameters
     ----------
     array : array-like
-        Any object exposing the buffer interface, such as a numpy.ndarray.
+        Any object exposing the buffer interface, such as a numpy.ndarray,
+        or the DLPack protocol, such as a PyTorch tensor, or a DLPack capsule.
+        It must be C-contiguous, host-accessible, and have the same shape as
+        the Function's `shape_allocated`, that is including the halo and the
+        padding regions.
 
     Notes
     -------
@@ -356,6 +567,12 @@ class DataReference(MemoryAllocator):
     * This can be used to pass one Function's data to another to avoid copying
       during Function rebuilds (this should only be used internally).
 
+    * The generated code is told the actual alignment of the external memory,
+      so that no misaligned vector loads and stores are ever emitted. Memory
+      aligned to at least the size of a SIMD register is thus recommended.
+      For the same reason, such a Function can't replace, at runtime, a more
+      aligned Function that an Operator was generated for.
+
     Example
     --------
     >>> from devito import Grid, Function
@@ -374,17 +591,35 @@ class DataReference(MemoryAllocator):
     """
 
     def __init__(self, numpy_array):
+        if is_dlpack(numpy_array):
+            numpy_array = from_dlpack(numpy_array)
         self.numpy_array = numpy_array
 
-    def alloc(self, shape, dtype, padding=0):
-        assert shape == self.numpy_array.shape, \
-            "Provided array has shape %s. Expected %s" %\
-            (str(self.numpy_array.shape), str(shape))
-        assert dtype == self.numpy_array.dtype, \
-            "Provided array has dtype %s. Expected %s" %\
-            (str(self.numpy_array.dtype), str(dtype))
+        # The largest power of two dividing the base address, up to the
+        # default alignment
+        address = np.asarray(numpy_array).__array_interface__['data'][0]
+        if address:
+            self.guaranteed_alignment = min(address & -address,
+                                            self.guaranteed_alignment)
 
-        return (self.numpy_array, None)
+    def alloc(self, shape, dtype, padding=0):
+        array = self.numpy_array
+        if array.shape != shape:
+            raise ValueError("Provided array has shape %s. Expected %s, that is "
+                             "the domain plus the halo and padding regions"
+                             % (str(array.shape), str(shape)))
+        if array.dtype != dtype:
+            raise ValueError("Provided array has dtype %s. Expected %s"
+                             % (str(array.dtype), str(np.dtype(dtype))))
+        if not array.flags.c_contiguous:
+            raise ValueError("Provided array must be C-contiguous")
+        if not array.flags.writeable:
+            raise ValueError("Provided array must be writeable")
+        if self.guaranteed_alignment % array.dtype.itemsize:
+            raise ValueError("Provided array is not aligned to the size of its "
+                             "items (%d bytes)" % array.dtype.itemsize)
+
+        return (array, None)
 
 
 # For backward compatibility
@@ -439,7 +674,8 @@ def default_allocator(name=None):
                             Falls back to DRAM if there isn't enough space.
         * ALLOC_KNL_DRAM: On a Knights Landing platform, allocate memory in DRAM.
 
-    Custom allocators may be added with `register_allocator`.
+    Custom allocators, such as a `MmapAllocator` to place the data on disk, may
+    be added with `register_allocator`.
     """
     if name is not None:
         try:
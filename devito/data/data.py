@@ -1,9 +1,14 @@
 from collections.abc import Iterable
 from functools import wraps
+from io import BytesIO
+import json
+import os
 
 import numpy as np
 
 from devito.data.allocators import ALLOC_ALIGNED
+from devito.data.dlpack import DLDeviceType, to_dlpack
+from devito.data.engine import parallel_fill
 from devito.data.utils import *
 from devito.logger import warning
 from devito.parameters import configuration
@@ -182,6 +187,8 @@ class Data(np.ndarray):
             elif len(args) > 1 and isinstance(args[1], Data) \
                     and args[1]._is_mpi_distributed:
                 comm_type = index_by_index
+            elif data._is_mpi_distributed and index_is_points(glb_idx, data.ndim):
+                comm_type = batched
             elif data._is_mpi_distributed:
                 for i in as_tuple(glb_idx):
                     if isinstance(i, slice) and i.step is not None and i.step < 0:
@@ -205,8 +212,32 @@ class Data(np.ndarray):
     def __str__(self):
         return super(Data, self._local).__str__()
 
+    def __dlpack__(self, stream=None):
+        """
+        Export the data, without copies, through the DLPack protocol. With
+        MPI, only the data local to the calling rank is exported.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from devito import Function, Grid
+        >>> grid = Grid(shape=(2, 2))
+        >>> f = Function(name='f', grid=grid)
+        >>> a = np.from_dlpack(f.data)
+        >>> f.data[0, 1] = 1.
+        >>> a
+        array([[0., 1.],
+               [0., 0.]], dtype=float32)
+        """
+        return to_dlpack(self._local.view(np.ndarray), stream=stream)
+
+    def __dlpack_device__(self):
+        return (DLDeviceType.kDLCPU, 0)
+
     @_check_idx
     def __getitem__(self, glb_idx, comm_type, gather_rank=None):
+        if comm_type is batched:
+            return self._gather_points(glb_idx)
         loc_idx = self._index_glb_to_loc(glb_idx)
         is_gather = isinstance(gather_rank, int)
         if is_gather and comm_type is gather:
@@ -220,7 +251,8 @@ class Data(np.ndarray):
                 recvbuf = np.zeros(sum(sendcounts), dtype=self.dtype.type)
             else:
                 recvbuf = None
-            comm.Gatherv(sendbuf=sendbuf, recvbuf=(recvbuf, sendcounts), root=gather_rank)
+            comm.Gatherv(sendbuf=mpi_view(sendbuf),
+                         recvbuf=(mpi_view(recvbuf), sendcounts), root=gather_rank)
 
             # Reshape the gathered data to produce the output
             if rank == gather_rank:
@@ -328,6 +360,9 @@ class Data(np.ndarray):
 
     @_check_idx
     def __setitem__(self, glb_idx, val, comm_type):
+        if comm_type is batched:
+            self._set_points(glb_idx, val)
+            return
         loc_idx = self._index_glb_to_loc(glb_idx)
         if loc_idx is NONLOCAL:
             # no-op
@@ -515,6 +550,131 @@ class Data(np.ndarray):
 
         return loc_idx[0] if len(loc_idx) == 1 else tuple(loc_idx)
 
+    def _points_glb_to_loc(self, glb_idx):
+        """
+        Vectorized conversion of a set of points, given as one array of global
+        indices per dimension, into local indices.
+
+        Returns
+        -------
+        mine : numpy.ndarray of bool
+            The points owned by the calling MPI rank.
+        coords : list of numpy.ndarray
+            The coordinates, in the decomposition of each distributed Dimension,
+            of the owner of each point.
+        loc_idx : tuple of numpy.ndarray
+            The local indices of each point, on its owner.
+        """
+        glb_idx = np.broadcast_arrays(*[np.asarray(i) for i in
+                                        self._normalize_index(glb_idx)])
+
+        mine = np.ones(glb_idx[0].shape, dtype=bool)
+        coords = []
+        loc_idx = []
+        for i, s, mod, dec in zip(glb_idx, self.shape, self._modulo,
+                                  self._decomposition):
+            if mod is True:
+                loc_idx.append(i % s)
+            elif dec is None:
+                loc_idx.append(i)
+            else:
+                i = np.where(i < 0, i + dec.glb_max + 1, i)
+                if ((i < dec.glb_min) | (i > dec.glb_max)).any():
+                    raise IndexError("Index out of bounds [%d, %d]"
+                                     % (dec.glb_min, dec.glb_max))
+
+                # The subdomains are contiguous ranges, in increasing order
+                sizes = np.array([len(j) for j in dec])
+                bounds = dec.glb_min + np.cumsum(sizes)
+                c = np.searchsorted(bounds, i, side='right')
+
+                coords.append(c)
+                loc_idx.append(i - bounds[c] + sizes[c])
+                mine &= c == dec.local
+
+        return mine, coords, tuple(loc_idx)
+
+    def _gather_points(self, glb_idx, rank=None):
+        """
+        Retrieve a set of points, collectively across all MPI ranks, with a
+        single communication. The values are returned on all ranks, or only
+        on `rank` if supplied.
+        """
+        mine, _, loc_idx = self._points_glb_to_loc(glb_idx)
+
+        positions = np.flatnonzero(mine)
+        values = self._local.view(np.ndarray)[tuple(i[mine] for i in loc_idx)]
+
+        comm = self._distributor.comm
+        counts = np.array(comm.allgather(positions.size))
+        if rank is None or comm.Get_rank() == rank:
+            retval = np.empty(mine.shape, dtype=self.dtype)
+            all_positions = np.empty(counts.sum(), dtype=np.int64)
+            all_values = np.empty(counts.sum(), dtype=self.dtype)
+            recv = lambda buf, itemsize: [buf.view(np.uint8), counts*itemsize]
+        else:
+            retval = all_positions = all_values = None
+            recv = lambda *args: None
+
+        if rank is None:
+            comm.Allgatherv(_to_bytes(positions), recv(all_positions, 8))
+            comm.Allgatherv(_to_bytes(values), recv(all_values, self.itemsize))
+        else:
+            comm.Gatherv(_to_bytes(positions), recv(all_positions, 8), root=rank)
+            comm.Gatherv(_to_bytes(values), recv(all_values, self.itemsize),
+                         root=rank)
+
+        if retval is not None:
+            retval.reshape(-1)[all_positions] = all_values
+        return retval
+
+    def _set_points(self, glb_idx, val):
+        """
+        Set a set of points to the replicated values `val`. No communication
+        is required, as each rank only sets the points it owns.
+        """
+        mine, _, loc_idx = self._points_glb_to_loc(glb_idx)
+        val = np.broadcast_to(np.asarray(val), mine.shape)
+        self._local.view(np.ndarray)[tuple(i[mine] for i in loc_idx)] = val[mine]
+
+    def _scatter_points(self, glb_idx, val):
+        """
+        Set a set of points, possibly different on each rank, routing the
+        values to their owners with a single all-to-all communication.
+        """
+        _, coords, loc_idx = self._points_glb_to_loc(glb_idx)
+        val = np.broadcast_to(np.asarray(val, dtype=self.dtype),
+                              loc_idx[0].shape).reshape(-1)
+        loc_idx = np.stack([i.reshape(-1) for i in loc_idx], axis=1).astype(np.int64)
+
+        comm = self._distributor.comm
+        nprocs = comm.Get_size()
+
+        # Map the decomposition coordinates onto the MPI ranks
+        decs = [i for i in self._decomposition if i is not None]
+        ranks = np.full([len(i) for i in decs], -1, dtype=np.int64)
+        for rank, c in enumerate(comm.allgather(tuple(i.local for i in decs))):
+            ranks[c] = rank
+        owners = ranks[tuple(i.reshape(-1) for i in coords)]
+
+        # Sort the points by owner, as expected by Alltoallv
+        order = np.argsort(owners, kind='stable')
+        loc_idx = loc_idx[order]
+        val = val[order]
+        sendcounts = np.bincount(owners, minlength=nprocs)
+        recvcounts = np.empty(nprocs, dtype=np.int64)
+        comm.Alltoall(sendcounts, recvcounts)
+
+        ndim = self.ndim
+        recv_idx = np.empty((recvcounts.sum(), ndim), dtype=np.int64)
+        recv_val = np.empty(recvcounts.sum(), dtype=self.dtype)
+        comm.Alltoallv([_to_bytes(loc_idx), sendcounts*ndim*8],
+                       [recv_idx.view(np.uint8), recvcounts*ndim*8])
+        comm.Alltoallv([_to_bytes(val), sendcounts*self.itemsize],
+                       [recv_val.view(np.uint8), recvcounts*self.itemsize])
+
+        self._local.view(np.ndarray)[tuple(recv_idx.T)] = recv_val
+
     def _set_global_idx(self, val, idx, val_idx):
         """
         Compute the global indices to which val (the locally stored data) correspond.
@@ -590,9 +750,220 @@ class Data(np.ndarray):
             gather_rank = None
         return np.array(self.__getitem__(idx, gather_rank=gather_rank))
 
+    @property
+    def _comm(self):
+        """The MPI communicator, if the data is distributed over MPI, else None."""
+        if self._is_mpi_distributed:
+            return self._distributor.comm
+        else:
+            return None
+
+    @property
+    def _glb_box(self):
+        """
+        The global shape of ``self``, and the global index of the first entry
+        local to the calling MPI rank.
+        """
+        shape = []
+        start = []
+        for dec, n in zip(self._decomposition, self.shape):
+            if dec is None:
+                shape.append(n)
+                start.append(0)
+            else:
+                shape.append(int(dec.size))
+                start.append(int(dec.loc_abs_min or 0))
+        return tuple(shape), tuple(start)
+
+    def _write(self, path, layout='single', chunksize=None):
+        """
+        Write distributed data to file(s), collectively across all MPI ranks.
+        See the public ``data_write`` method of `Function`.
+        """
+        chunksize = chunksize or IO_CHUNKSIZE
+        comm = self._comm
+        rank = comm.Get_rank() if comm is not None else 0
+        glb_shape, start = self._glb_box
+        local = self._local.view(np.ndarray)
+
+        if layout == 'single':
+            header = _npy_header(glb_shape, self.dtype)
+            if comm is None:
+                with open(path, 'wb') as f:
+                    f.write(header)
+                    for i in _row_slices(local, chunksize):
+                        f.write(_to_bytes(local[i]))
+                return
+
+            from mpi4py import MPI
+
+            fh = MPI.File.Open(comm, path, MPI.MODE_WRONLY | MPI.MODE_CREATE)
+            fh.Set_size(0)
+            if rank == 0:
+                fh.Write_at(0, header)
+
+            # Each rank views the file as its own sub-box of the global array
+            if local.size > 0:
+                itemsize = self.dtype.itemsize
+                filetype = MPI.BYTE.Create_subarray(glb_shape + (itemsize,),
+                                                    local.shape + (itemsize,),
+                                                    start + (0,))
+                filetype.Commit()
+            else:
+                filetype = MPI.BYTE
+            fh.Set_view(len(header), MPI.BYTE, filetype)
+
+            # The writes are collective, so all ranks must take part in the same
+            # number of rounds, possibly with empty chunks
+            chunks = _row_slices(local, chunksize)
+            nrounds = comm.allreduce(len(chunks), op=MPI.MAX)
+            for i in range(nrounds):
+                if i < len(chunks):
+                    fh.Write_all(_to_bytes(local[chunks[i]]))
+                else:
+                    fh.Write_all(np.empty(0, dtype=np.uint8))
+
+            if filetype is not MPI.BYTE:
+                filetype.Free()
+            fh.Close()
+
+        elif layout == 'ranks':
+            dirname, basename = os.path.split(path)
+            fname = '%s.%d.npy' % (basename, rank)
+            with open(os.path.join(dirname, fname), 'wb') as f:
+                f.write(_npy_header(local.shape, self.dtype))
+                for i in _row_slices(local, chunksize):
+                    f.write(_to_bytes(local[i]))
+
+            block = {'file': fname, 'start': start, 'shape': local.shape}
+            blocks = comm.gather(block, root=0) if comm is not None else [block]
+            if rank == 0:
+                index = {'shape': glb_shape,
+                         'dtype': np.lib.format.dtype_to_descr(self.dtype),
+                         'blocks': blocks}
+                with open(path, 'w') as f:
+                    json.dump(index, f, indent=2)
+            if comm is not None:
+                comm.Barrier()
+
+        else:
+            raise ValueError("Unknown layout `%s`; accepted values are 'single' "
+                             "and 'ranks'" % layout)
+
+    def _read(self, path, chunksize=None):
+        """
+        Read distributed data from file(s) written by ``_write``. See the public
+        ``data_read`` method of `Function`.
+        """
+        chunksize = chunksize or IO_CHUNKSIZE
+        glb_shape, start = self._glb_box
+        local = self._local.view(np.ndarray)
+        box = tuple(slice(i, i + n) for i, n in zip(start, local.shape))
+
+        with open(path, 'rb') as f:
+            is_npy = f.read(6) == b'\x93NUMPY'
+        if is_npy:
+            blocks = [(path, (0,)*len(glb_shape), None)]
+        else:
+            with open(path) as f:
+                index = json.load(f)
+            if tuple(index['shape']) != glb_shape:
+                raise ValueError("Expected data of shape %s, not %s"
+                                 % (glb_shape, tuple(index['shape'])))
+            dirname = os.path.dirname(path)
+            blocks = [(os.path.join(dirname, i['file']), tuple(i['start']),
+                       tuple(i['shape'])) for i in index['blocks']]
+
+        # Each rank only reads the portions of the blocks it owns, and only
+        # opens the block files intersecting them
+        for fname, offset, shape in blocks:
+            if shape is None:
+                src = _npy_load(fname, self.dtype)
+                shape = src.shape
+                if shape != glb_shape:
+                    raise ValueError("Expected data of shape %s, not %s"
+                                     % (glb_shape, shape))
+            else:
+                src = None
+            isect = []
+            for b, i, n in zip(box, offset, shape):
+                lo, hi = max(b.start, i), min(b.stop, i + n)
+                isect.append(slice(lo, max(lo, hi)))
+            if any(i.stop == i.start for i in isect):
+                continue
+            if src is None:
+                src = _npy_load(fname, self.dtype)
+            dst_idx = tuple(slice(i.start - b.start, i.stop - b.start)
+                            for i, b in zip(isect, box))
+            src_idx = tuple(slice(i.start - j, i.stop - j)
+                            for i, j in zip(isect, offset))
+            dst = local[dst_idx]
+            src = src[src_idx]
+            for i in _row_slices(dst, chunksize):
+                dst[i] = src[i]
+
+    def _slabs(self, size=1, rank=0):
+        """
+        Gather distributed data onto a single rank, one slab along the first
+        dimension at a time. See the public ``data_slabs`` method of `Function`.
+        """
+        comm = self._comm
+        glb_shape, start = self._glb_box
+        local = self._local.view(np.ndarray)
+
+        if comm is None:
+            for i in range(0, glb_shape[0], size):
+                idx = slice(i, min(i + size, glb_shape[0]))
+                yield idx, np.array(local[idx])
+            return
+
+        from mpi4py import MPI
+
+        myrank = comm.Get_rank()
+        boxes = comm.allgather((start, local.shape))
+        itemsize = self.dtype.itemsize
+        for i in range(0, glb_shape[0], size):
+            idx = slice(i, min(i + size, glb_shape[0]))
+
+            # The rows of the slab owned by each rank
+            rows = []
+            for (s, shape) in boxes:
+                lo, hi = max(idx.start, s[0]), min(idx.stop, s[0] + shape[0])
+                rows.append(slice(lo, max(lo, hi)))
+
+            s = start[0]
+            mine = rows[myrank]
+            sendbuf = _to_bytes(local[mine.start - s:mine.stop - s])
+
+            if myrank == rank:
+                counts = [(r.stop - r.start)*int(np.prod(shape[1:]))*itemsize
+                          for r, (_, shape) in zip(rows, boxes)]
+                displs = np.concatenate([[0], np.cumsum(counts)[:-1]])
+                recvbuf = np.empty(sum(counts), dtype=np.uint8)
+                comm.Gatherv(sendbuf,
+                             [recvbuf, counts, displs, MPI.BYTE], root=rank)
+
+                slab = np.empty((idx.stop - idx.start,) + glb_shape[1:],
+                                dtype=self.dtype)
+                for r, (s, shape), c, d in zip(rows, boxes, counts, displs):
+                    if c == 0:
+                        continue
+                    piece = recvbuf[d:d + c].view(self.dtype)
+                    piece = piece.reshape((r.stop - r.start,) + tuple(shape[1:]))
+                    box = (slice(r.start - idx.start, r.stop - idx.start),)
+                    box += tuple(slice(j, j + n) for j, n in zip(s[1:], shape[1:]))
+                    slab[box] = piece
+                yield idx, slab
+            else:
+                comm.Gatherv(sendbuf, None, root=rank)
+                yield idx, None
+
     def reset(self):
         """Set all Data entries to 0."""
-        self[:] = 0.0
+        # Threads are split along the outermost non-modulo (i.e., non-time
+        # buffer) axis, as the loops of the Operators
+        axis = self._modulo.index(False) if False in self._modulo else 0
+        parallel_fill(self._local, 0, axis=axis)
 
 
 class CommType(Tag):
@@ -600,3 +971,44 @@ class CommType(Tag):
 index_by_index = CommType('index_by_index')  # noqa
 serial = CommType('serial')  # noqa
 gather = CommType('gather')  # noqa
+batched = CommType('batched')  # noqa
+
+
+IO_CHUNKSIZE = 2**26
+"""The default maximum size, in bytes, of the chunks of data read or written."""
+
+
+def _row_slices(array, chunksize):
+    """
+    Split `array` along its first dimension into chunks of at most `chunksize`
+    bytes, or of a single row if a row is larger than `chunksize`.
+    """
+    if array.size == 0:
+        return []
+    nrows = max(1, chunksize // array[0].nbytes)
+    return [slice(i, i + nrows) for i in range(0, array.shape[0], nrows)]
+
+
+def _to_bytes(array):
+    """A contiguous copy of `array`, as a flat array of bytes."""
+    return np.ascontiguousarray(array).reshape(-1).view(np.uint8)
+
+
+def _npy_header(shape, dtype):
+    """The header of a file in the NumPy `.npy` format."""
+    buf = BytesIO()
+    np.lib.format.write_array_header_1_0(buf, {
+        'descr': np.lib.format.dtype_to_descr(np.dtype(dtype)),
+        'fortran_order': False,
+        'shape': tuple(int(i) for i in shape)
+    })
+    return buf.getvalue()
+
+
+def _npy_load(path, dtype):
+    """Memory-map a file in the NumPy `.npy` format."""
+    array = np.load(path, mmap_mode='r')
+    if array.dtype.kind == 'V' and array.dtype.itemsize == np.dtype(dtype).itemsize:
+        # E.g., bfloat16, which the `.npy` format stores as raw bytes
+        array = array.view(dtype)
+    return array
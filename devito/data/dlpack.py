@@ -0,0 +1,195 @@
+"""
+Zero-copy exchange of data with other array libraries, such as PyTorch, JAX
+or CuPy, through the DLPack protocol:
+
+    https://dmlc.github.io/dlpack/latest/python_spec.html
+
+NumPy already implements most of the protocol. This module fills the gaps
+that matter to Devito: the exchange of bfloat16 data, the import of raw
+DLPack capsules and the import of writable, rather than read-only, arrays.
+"""
+
+import ctypes
+from enum import IntEnum
+
+import numpy as np
+
+from devito.tools import bfloat16
+
+__all__ = ['DLDeviceType', 'from_dlpack', 'to_dlpack', 'is_dlpack']
+
+
+class DLDeviceType(IntEnum):
+
+    """The subset of the DLPack device types accessible from the host."""
+
+    kDLCPU = 1
+    kDLCUDAHost = 3
+    kDLROCMHost = 11
+
+
+class DLDataTypeCode(IntEnum):
+
+    kDLInt = 0
+    kDLUInt = 1
+    kDLFloat = 2
+    kDLBfloat = 4
+
+
+class DLDevice(ctypes.Structure):
+    _fields_ = [('device_type', ctypes.c_int32),
+                ('device_id', ctypes.c_int32)]
+
+
+class DLDataType(ctypes.Structure):
+    _fields_ = [('code', ctypes.c_uint8),
+                ('bits', ctypes.c_uint8),
+                ('lanes', ctypes.c_uint16)]
+
+
+class DLTensor(ctypes.Structure):
+    _fields_ = [('data', ctypes.c_void_p),
+                ('device', DLDevice),
+                ('ndim', ctypes.c_int32),
+                ('dtype', DLDataType),
+                ('shape', ctypes.POINTER(ctypes.c_int64)),
+                ('strides', ctypes.POINTER(ctypes.c_int64)),
+                ('byte_offset', ctypes.c_uint64)]
+
+
+class DLManagedTensor(ctypes.Structure):
+    _fields_ = [('dl_tensor', DLTensor),
+                ('manager_ctx', ctypes.c_void_p),
+                ('deleter', ctypes.c_void_p)]
+
+
+_PyCapsule_IsValid = ctypes.pythonapi.PyCapsule_IsValid
+_PyCapsule_IsValid.restype = ctypes.c_int
+_PyCapsule_IsValid.argtypes = [ctypes.py_object, ctypes.c_char_p]
+
+_PyCapsule_GetPointer = ctypes.pythonapi.PyCapsule_GetPointer
+_PyCapsule_GetPointer.restype = ctypes.c_void_p
+_PyCapsule_GetPointer.argtypes = [ctypes.py_object, ctypes.c_char_p]
+
+
+def is_capsule(obj):
+    return type(obj).__name__ == 'PyCapsule'
+
+
+def is_dlpack(obj):
+    """
+    True if `obj` is a DLPack capsule or an object implementing the DLPack
+    protocol, other than a NumPy array.
+    """
+    if isinstance(obj, np.ndarray):
+        return False
+    return is_capsule(obj) or hasattr(obj, '__dlpack__')
+
+
+def _managed_tensor(capsule):
+    """The DLManagedTensor wrapped by a yet unconsumed DLPack capsule."""
+    if not _PyCapsule_IsValid(capsule, b'dltensor'):
+        raise ValueError("Expected an unconsumed DLPack capsule; note that a "
+                         "capsule may only be consumed once")
+    ptr = _PyCapsule_GetPointer(capsule, b'dltensor')
+    return DLManagedTensor.from_address(ptr)
+
+
+def _check_device(device_type, device_id):
+    if device_type not in set(DLDeviceType):
+        raise ValueError("Cannot import data from DLPack device type %d; the "
+                         "data must be accessible from the host" % device_type)
+
+
+class _Capsule:
+
+    """Adapt a raw DLPack capsule to the DLPack protocol, as used by NumPy."""
+
+    def __init__(self, capsule, device):
+        self.capsule = capsule
+        self.device = device
+
+    def __dlpack__(self, stream=None):
+        return self.capsule
+
+    def __dlpack_device__(self):
+        return self.device
+
+
+class _Writable:
+
+    """Expose a read-only NumPy array as writable, keeping it alive."""
+
+    def __init__(self, array):
+        self.array = array
+        interface = dict(array.__array_interface__)
+        interface['data'] = (interface['data'][0], False)
+        self.__array_interface__ = interface
+
+
+def from_dlpack(obj):
+    """
+    Create a writable NumPy array sharing the memory of `obj`.
+
+    Parameters
+    ----------
+    obj : object
+        Either an object implementing the DLPack protocol, such as a PyTorch
+        tensor, or a DLPack capsule, as returned by ``obj.__dlpack__()``.
+        The memory must be accessible from the host.
+
+    Notes
+    -----
+    DLPack carries no notion of read-only memory, so the returned array is
+    writable even if the producer considers its data immutable (e.g., JAX
+    arrays). Writing to such memory is the user's responsibility.
+    """
+    if is_capsule(obj):
+        capsule = obj
+    else:
+        _check_device(*obj.__dlpack_device__())
+        capsule = obj.__dlpack__()
+
+    tensor = _managed_tensor(capsule).dl_tensor
+    device = (tensor.device.device_type, tensor.device.device_id)
+    _check_device(*device)
+
+    # NumPy refuses bfloat16, so it's reinterpreted as uint16 on the way in
+    dtype = tensor.dtype
+    is_bfloat16 = dtype.code == DLDataTypeCode.kDLBfloat and dtype.bits == 16
+    if is_bfloat16:
+        if bfloat16 is None:
+            raise ValueError("Importing bfloat16 data requires the `ml_dtypes` "
+                             "package")
+        dtype.code = DLDataTypeCode.kDLUInt
+
+    # NumPy takes ownership of the capsule and releases it along with the
+    # returned array
+    array = np.from_dlpack(_Capsule(capsule, device))
+    array = np.asarray(_Writable(array))
+
+    if is_bfloat16:
+        array = array.view(bfloat16)
+
+    return array
+
+
+def to_dlpack(array, stream=None):
+    """
+    Create a DLPack capsule sharing the memory of the NumPy array `array`.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        The exported array.
+    stream : None, optional
+        Must be None, as the data lives on the host.
+    """
+    if array.dtype != bfloat16:
+        return array.__dlpack__(stream=stream)
+
+    # NumPy refuses bfloat16, so it's exported as uint16 and relabelled
+    capsule = array.view(np.uint16).__dlpack__(stream=stream)
+    _managed_tensor(capsule).dl_tensor.dtype.code = DLDataTypeCode.kDLBfloat
+
+    return capsule
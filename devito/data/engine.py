@@ -0,0 +1,149 @@
+"""
+A threaded engine to fill and copy arrays on the Python side.
+
+With a first-touch page placement policy, which is the Linux default, a memory
+page is placed on the NUMA node of the thread that first writes to it. The
+Operators distribute the outermost parallel loop across the OpenMP threads in
+contiguous, equally-sized chunks (static scheduling), so the engine splits the
+arrays along the same axis, in the same way, across as many threads, bound to
+the same cores if ``OMP_PROC_BIND`` is set. Thus, the pages land on the NUMA
+node of the cores that will later compute on them.
+
+NumPy releases the GIL while filling and copying, so the threads genuinely run
+in parallel.
+"""
+
+from threading import Thread
+import os
+
+import numpy as np
+
+from devito.parameters import configuration
+
+__all__ = ['parallel_fill', 'parallel_copy']
+
+
+MIN_CHUNK_NBYTES = 2**20
+"""
+The minimum number of bytes processed by a thread. Smaller arrays are
+processed by fewer threads, down to the calling thread alone.
+"""
+
+
+def nthreads():
+    """
+    The number of threads used by the Operators, that is as many as the default
+    value of their `nthreads` argument when OpenMP is enabled, and 1 otherwise.
+    """
+    if configuration['language'] != 'openmp':
+        return 1
+    return int(os.environ.get(
+        'OMP_NUM_THREADS',
+        configuration['platform'].cores_physical_per_numa_domain
+    ))
+
+
+def places(n):
+    """
+    The set of CPUs each of `n` threads is bound to, mimicking the OpenMP
+    `close` and `spread` binding policies, or None if ``OMP_PROC_BIND`` is
+    unset, in which case the threads are left to the OS scheduler.
+    """
+    bind = os.environ.get('OMP_PROC_BIND', 'false').lower().split(',')[0]
+    if bind == 'false':
+        return None
+    try:
+        cpus = sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not on Linux
+        return None
+
+    if bind == 'spread':
+        return [{cpus[i*len(cpus)//n % len(cpus)]} for i in range(n)]
+    else:
+        return [{cpus[i % len(cpus)]} for i in range(n)]
+
+
+def _run(func, array, axis):
+    """
+    Apply `func` to contiguous chunks of `array` along `axis`, each one in a
+    separate thread. `func` takes the index of the chunk.
+    """
+    size = array.shape[axis] if array.ndim > 0 else 1
+    n = min(nthreads(), size, array.nbytes // MIN_CHUNK_NBYTES)
+    if n <= 1:
+        func(Ellipsis)
+        return
+
+    bounds = [size*i//n for i in range(n + 1)]
+    chunks = [(slice(None),)*axis + (slice(bounds[i], bounds[i+1]),)
+              for i in range(n)]
+    cpus = places(n) or [None]*n
+    errors = []
+
+    def task(idx, cpus):
+        try:
+            if cpus is not None:
+                os.sched_setaffinity(0, cpus)
+            func(idx)
+        except Exception as e:
+            errors.append(e)
+
+    # One thread per chunk, as with an OpenMP static schedule
+    threads = [Thread(target=task, args=i) for i in zip(chunks, cpus)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    if errors:
+        raise errors[0]
+
+
+def parallel_fill(array, value, axis=0):
+    """
+    Fill `array` with the scalar `value`, using the same threads as the
+    Operators.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        The array to be filled.
+    value : scalar
+        The fill value.
+    axis : int, optional
+        The axis along which the array is split across the threads. Should
+        be the one iterated over by the outermost parallel loop of the
+        Operators accessing `array`. Defaults to 0.
+    """
+    array = np.asarray(array)
+
+    def fill(idx):
+        array[idx].fill(value)
+
+    _run(fill, array, axis)
+
+
+def parallel_copy(dst, src, axis=0):
+    """
+    Copy `src` into `dst`, using the same threads as the Operators.
+
+    Parameters
+    ----------
+    dst : numpy.ndarray
+        The destination array.
+    src : array-like
+        The source values, broadcastable to the shape of `dst`. As in a NumPy
+        assignment, they are cast to the type of `dst`.
+    axis : int, optional
+        The axis along which the arrays are split across the threads. Should
+        be the one iterated over by the outermost parallel loop of the
+        Operators accessing `dst`. Defaults to 0.
+    """
+    dst = np.asarray(dst)
+    src = np.broadcast_to(np.asarray(src), dst.shape)
+
+    def copy(idx):
+        np.copyto(dst[idx], src[idx], casting='unsafe')
+
+    _run(copy, dst, axis)
@@ -2,9 +2,10 @@ import numpy as np
 
 from devito.tools import Tag, as_tuple, as_list, is_integer
 
-__all__ = ['Index', 'NONLOCAL', 'PROJECTED', 'index_is_basic', 'index_apply_modulo',
-           'index_dist_to_repl', 'convert_index', 'index_handle_oob',
-           'loc_data_idx', 'mpi_index_maps', 'flip_idx']
+__all__ = ['Index', 'NONLOCAL', 'PROJECTED', 'index_is_basic', 'index_is_points',
+           'index_apply_modulo', 'index_dist_to_repl', 'convert_index',
+           'index_handle_oob', 'loc_data_idx', 'mpi_index_maps', 'flip_idx',
+           'mpi_view']
 
 
 class Index(Tag):
@@ -22,6 +23,24 @@ def index_is_basic(idx):
         return all(is_integer(i) or (i is NONLOCAL) for i in idx)
 
 
+def index_is_points(idx, ndim):
+    """
+    True if `idx` selects a set of points, that is if it consists of one integer
+    array (or list) of indices per dimension, possibly mixed with integers.
+    """
+    if isinstance(idx, np.ndarray):
+        idx = (idx,)
+    elif not isinstance(idx, tuple):
+        return False
+    if len(idx) != ndim:
+        return False
+
+    arrays = [np.asarray(i) for i in idx if isinstance(i, (np.ndarray, list))]
+    if not arrays or len(arrays) + sum(is_integer(i) for i in idx) != ndim:
+        return False
+    return all(i.dtype.kind in 'iu' for i in arrays)
+
+
 def index_apply_modulo(idx, modulo):
     if is_integer(idx):
         return idx % modulo
@@ -470,3 +489,16 @@ def distributed_data_size(shape, coords, topology):
                     n_dat.append(c_dat+p_dat)
             cshape[my_coords] = as_tuple(n_dat)
     return cshape
+
+
+def mpi_view(array):
+    """
+    A view of `array` that MPI can communicate.
+
+    MPI has no half-precision floating-point datatypes (e.g., float16, bfloat16),
+    so arrays of these types are viewed as unsigned integers of the same width.
+    """
+    if array is not None and array.dtype.itemsize == 2 and \
+       array.dtype.kind not in 'iu':
+        return array.view(np.uint16)
+    return array
@@ -21,7 +21,7 @@ from devito.symbolics import (FieldFromComposite, FieldFromPointer,
                               ListInitializer, ccode, uxreplace)
 from devito.tools import (GenericVisitor, as_tuple, ctypes_to_cstr, filter_ordered,
                           filter_sorted, flatten, is_external_ctype,
-                          c_restrict_void_p, sorted_priority)
+                          c_restrict_void_p, sorted_priority, storage_store)
 from devito.types.basic import AbstractFunction, Basic
 from devito.types import (ArrayObject, CompositeObject, Dimension, Pointer,
                           IndexedData, DeviceMap)
@@ -168,6 +168,11 @@ class PrintAST(Visitor):
             return self.indent + "<If %s>\n%s" % (o.condition, then_body)
 
 
+# The qualifier of the elemental functions emitted into separate translation
+# units, so that they do not leak out of the Operator shared object
+_hidden = '__attribute__ ((visibility ("hidden")))'
+
+
 class CGen(Visitor):
 
     """
@@ -313,9 +318,9 @@ class CGen(Visitor):
                 ret.append(ccode(i))
         return ret
 
-    def _gen_signature(self, o, is_declaration=False):
+    def _gen_signature(self, o, is_declaration=False, prefix=None):
         decls = self._args_decl(o.parameters)
-        prefix = ' '.join(o.prefix + (self._gen_rettype(o.retval),))
+        prefix = ' '.join(as_tuple(prefix or o.prefix) + (self._gen_rettype(o.retval),))
         signature = c.FunctionDeclaration(c.Value(prefix, o.name), decls)
         if o.templates:
             tparams = ', '.join([i.inline() for i in self._args_decl(o.templates)])
@@ -470,13 +475,29 @@ class CGen(Visitor):
     def visit_Definition(self, o):
         return self._gen_value(o.function)
 
+    def _compact_write(self, o):
+        """
+        The Function written by `o`, if stored in a narrower data type than the
+        compute one, None otherwise.
+        """
+        try:
+            f = o.write
+            if f.storage_dtype != f.dtype:
+                return f
+        except AttributeError:
+            pass
+        return None
+
     def visit_Expression(self, o):
-        lhs = ccode(o.expr.lhs, dtype=o.dtype, compiler=self._compiler)
+        lhs = ccode(o.expr.lhs, dtype=o.dtype, compiler=self._compiler, lvalue=True)
         rhs = ccode(o.expr.rhs, dtype=o.dtype, compiler=self._compiler)
 
         if o.init:
             code = c.Initializer(self._gen_value(o.expr.lhs, 0), rhs)
         else:
+            f = self._compact_write(o)
+            if f is not None:
+                rhs = storage_store(f.dtype, f.storage_dtype, rhs)
             code = c.Assign(lhs, rhs)
 
         if o.pragmas:
@@ -485,9 +506,17 @@ class CGen(Visitor):
         return code
 
     def visit_AugmentedExpression(self, o):
-        c_lhs = ccode(o.expr.lhs, dtype=o.dtype, compiler=self._compiler)
+        c_lhs = ccode(o.expr.lhs, dtype=o.dtype, compiler=self._compiler, lvalue=True)
         c_rhs = ccode(o.expr.rhs, dtype=o.dtype, compiler=self._compiler)
-        code = c.Statement("%s %s= %s" % (c_lhs, o.op, c_rhs))
+        f = self._compact_write(o)
+        if f is None:
+            code = c.Statement("%s %s= %s" % (c_lhs, o.op, c_rhs))
+        else:
+            # Load-convert, update, convert-store
+            c_load = ccode(o.expr.lhs, dtype=o.dtype, compiler=self._compiler)
+            c_rhs = storage_store(f.dtype, f.storage_dtype,
+                                  '%s %s (%s)' % (c_load, o.op, c_rhs))
+            code = c.Statement("%s = %s" % (c_lhs, c_rhs))
         if o.pragmas:
             code = c.Module(self._visit(o.pragmas) + (code,))
         return code
@@ -676,7 +705,32 @@ class CGen(Visitor):
 
         return [self._gen_value(i) for i in v]
 
-    def visit_Operator(self, o, mode='all'):
+    def _operator_preamble(self, o, signature, mode='all'):
+        # Definitions
+        headers = [c.Define(*i) for i in o._headers] + [blankline]
+
+        # Header files
+        includes = self._operator_includes(o) + [blankline]
+
+        # Namespaces
+        namespaces = [self._visit(i) for i in o._namespaces]
+        if namespaces:
+            namespaces.append(blankline)
+
+        # Type declarations
+        typedecls = self._operator_typedecls(o, mode)
+        if mode in ('all', 'public') and o._compiler.src_ext in ('cpp', 'cu'):
+            typedecls.append(c.Extern('C', signature))
+        typedecls = [i for j in typedecls for i in (j, blankline)]
+
+        # Global variables
+        globs = self._operator_globals(o, mode)
+        if globs:
+            globs.append(blankline)
+
+        return headers + includes + namespaces + typedecls + globs
+
+    def _operator_kernel(self, o):
         # Kernel signature and body
         body = flatten(self._visit(i) for i in o.children)
         signature = self._gen_signature(o)
@@ -687,7 +741,10 @@ class CGen(Visitor):
         else:
             retval = [c.Line(), c.Statement("return 0")]
 
-        kernel = c.FunctionBody(signature, c.Block(body + retval))
+        return signature, c.FunctionBody(signature, c.Block(body + retval))
+
+    def visit_Operator(self, o, mode='all'):
+        signature, kernel = self._operator_kernel(o)
 
         # Elemental functions
         esigns = []
@@ -697,30 +754,46 @@ class CGen(Visitor):
             esigns.append(self._gen_signature(i, is_declaration=True))
             efuncs.extend([self._visit(i), blankline])
 
-        # Definitions
-        headers = [c.Define(*i) for i in o._headers] + [blankline]
+        preamble = self._operator_preamble(o, signature, mode)
 
-        # Header files
-        includes = self._operator_includes(o) + [blankline]
+        return c.Module(preamble + esigns + [blankline, kernel] + efuncs)
 
-        # Namespaces
-        namespaces = [self._visit(i) for i in o._namespaces]
-        if namespaces:
-            namespaces.append(blankline)
+    def units(self, o):
+        """
+        Generate the code for the Operator `o` as a sequence of translation
+        units, namely one for the Operator itself and one for each of its
+        elemental functions.
+
+        The elemental functions are made externally visible, but they remain
+        hidden outside of the shared object they are linked into. If some
+        elemental functions cannot be compiled separately (e.g., they are
+        templated or require special qualifiers), or if the Operator relies on
+        global variables, then a single translation unit is returned.
+
+        Returns
+        -------
+        list of (str, cgen.Module)
+            The name and the code of each translation unit.
+        """
+        items = sorted_efuncs([i.root for i in o._func_table.values() if i.local])
+        if o._globals or \
+           any(i.prefix != ('static',) or i.templates for i in items):
+            return [(o.name, self.visit(o))]
 
-        # Type declarations
-        typedecls = self._operator_typedecls(o, mode)
-        if mode in ('all', 'public') and o._compiler.src_ext in ('cpp', 'cu'):
-            typedecls.append(c.Extern('C', signature))
-        typedecls = [i for j in typedecls for i in (j, blankline)]
+        signature, kernel = self._operator_kernel(o)
 
-        # Global variables
-        globs = self._operator_globals(o, mode)
-        if globs:
-            globs.append(blankline)
+        preamble = self._operator_preamble(o, signature)
+        preamble.extend(self._gen_signature(i, is_declaration=True, prefix=_hidden)
+                        for i in items)
+        preamble.append(blankline)
+
+        units = [(o.name, c.Module(preamble + [kernel]))]
+        for i in items:
+            efunc = c.FunctionBody(self._gen_signature(i, prefix=_hidden),
+                                   self._visit(i).body)
+            units.append((i.name, c.Module(preamble + [efunc])))
 
-        return c.Module(headers + includes + namespaces + typedecls + globs +
-                        esigns + [blankline, kernel] + efuncs)
+        return units
 
 
 class CInterface(CGen):
@@ -1,5 +1,6 @@
 from itertools import chain, product
 from functools import cached_property
+from threading import get_ident
 
 from sympy import S
 import sympy
@@ -15,7 +16,7 @@ from devito.types import (ComponentAccess, Dimension, DimensionTuple, Fence,
                           CriticalRegion, Function, Symbol, Temp, TempArray,
                           TBArray)
 
-__all__ = ['IterationInstance', 'TimedAccess', 'Scope', 'ExprGeometry']
+__all__ = ['IterationInstance', 'TimedAccess', 'Scope', 'ExprGeometry', 'scope_cache']
 
 
 class IndexMode(Tag):
@@ -809,18 +810,89 @@ class DependenceGroup(set):
         return DependenceGroup(i for i in self if i.function is function)
 
 
+class scope_cache:
+
+    """
+    A context manager within which Scopes are memoized.
+
+    Many compiler passes perform data dependence analysis over the very same
+    sequence of expressions; within a `scope_cache`, a Scope, along with the
+    dependences it has computed, is shared by all passes. The cache is keyed by
+    the identity of the expressions -- as these are immutable, a pass
+    producing new expressions automatically gets a new Scope.
+
+    The hits and misses of the cache are recorded in `hits` and `misses`.
+    """
+
+    caches = {}
+    """
+    A ``thread_id -> scope_cache`` mapper, so that multiple Python threads
+    may build different Operators at the same time.
+    """
+
+    def __init__(self):
+        self.mapper = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self):
+        self._prev = scope_cache.caches.get(get_ident())
+        scope_cache.caches[get_ident()] = self
+        return self
+
+    def __exit__(self, *args):
+        if self._prev is None:
+            del scope_cache.caches[get_ident()]
+        else:
+            scope_cache.caches[get_ident()] = self._prev
+        self.mapper.clear()
+
+    @property
+    def counters(self):
+        return {'scope-cache-hits': self.hits, 'scope-cache-misses': self.misses}
+
+
 class Scope:
 
-    def __init__(self, exprs, rules=None):
-        """
-        A Scope enables data dependence analysis on a totally ordered sequence
-        of expressions.
-        """
-        self.exprs = as_tuple(exprs)
+    """
+    A Scope enables data dependence analysis on a totally ordered sequence
+    of expressions.
+    """
+
+    def __new__(cls, exprs, rules=None):
+        # NOTE: `exprs` may be a generator, which can only be consumed once;
+        # hence the Scope is initialized here, from the normalized `exprs`,
+        # rather than in `__init__`, which would receive the raw arguments
+        exprs = as_tuple(exprs)
+        rules = as_tuple(rules)
+
+        cache = scope_cache.caches.get(get_ident())
+        if cache is None:
+            return cls._create(exprs, rules)
+
+        # NOTE: the Scope retains the expressions, hence their ids can't be
+        # recycled as long as the Scope is in the cache
+        key = (cls, tuple(id(i) for i in exprs), rules)
+        try:
+            obj = cache.mapper[key]
+            cache.hits += 1
+        except KeyError:
+            obj = cache.mapper[key] = cls._create(exprs, rules)
+            cache.misses += 1
+
+        return obj
+
+    @classmethod
+    def _create(cls, exprs, rules):
+        obj = super().__new__(cls)
+
+        obj.exprs = exprs
 
         # A set of rules to drive the collection of dependencies
-        self.rules = as_tuple(rules)
-        assert all(callable(i) for i in self.rules)
+        obj.rules = rules
+        assert all(callable(i) for i in obj.rules)
+
+        return obj
 
     @memoized_generator
     def writes_gen(self):
@@ -216,11 +216,44 @@ class Distributor(AbstractDistributor):
     comm : MPI communicator, optional
         The set of processes over which the domain is distributed. Defaults to
         MPI.COMM_WORLD.
+    topology : tuple or str, optional
+        The number of processes along each Dimension, possibly including the
+        wildcard '*' (see `CustomTopology`), or 'optimal' to minimize the
+        estimated volume of halo exchanges (see `optimize_topology`). Defaults
+        to processes spread as evenly as possible along all Dimensions.
+    decomposition : tuple, optional
+        The size of the subdomains along each Dimension, that is, for each
+        Dimension, either None, for an even split, or a sequence of as many
+        sizes as processes along that Dimension, adding up to the Dimension
+        size. Unless `topology` is also given, the number of processes along
+        a Dimension with explicit sizes is the number of sizes.
+    cost : numpy.ndarray or tuple, optional
+        The computational cost of each grid point, used to balance the work
+        across processes, either as an array of shape `shape` or as a tuple
+        of per-Dimension cost profiles (possibly None, for uniform costs).
+        Along each Dimension, the split points are such that all subdomains
+        have the same cost, on average across the other Dimensions. Cannot
+        be used along with `decomposition`.
+    space_order : int, optional
+        The space order of the stencils computed over the domain, which
+        determines the thickness of the halo exchanged by neighbouring
+        processes. Only used to compute an 'optimal' topology.
     """
 
-    def __init__(self, shape, dimensions, input_comm=None, topology=None):
+    def __init__(self, shape, dimensions, input_comm=None, topology=None,
+                 decomposition=None, cost=None, space_order=None):
         super().__init__(shape, dimensions)
 
+        if decomposition is not None and cost is not None:
+            raise ValueError("Cannot use both `decomposition` and `cost`")
+        if decomposition is not None:
+            decomposition = as_tuple(decomposition)
+            if len(decomposition) != len(shape):
+                raise ValueError("Expected a `decomposition` with %d entries, "
+                                 "got %d instead" % (len(shape), len(decomposition)))
+            if topology is None:
+                topology = tuple('*' if i is None else len(i) for i in decomposition)
+
         if configuration['mpi']:
             # First time we enter here, we make sure MPI is initialized
             devito_mpi_init()
@@ -240,6 +273,19 @@ class Distributor(AbstractDistributor):
                 # OpenMPI v3 does not guarantee that 9 ranks are arranged into
                 # a 3x3 grid when shape=(9, 9))
                 self._topology = compute_dims(self._input_comm.size, len(shape))
+            elif topology == 'optimal':
+                # The ranks sharing a node; the least populated node is assumed
+                # so that all ranks agree on the topology
+                local_comm = self._input_comm.Split_type(MPI.COMM_TYPE_SHARED)
+                nprocs_local = self._input_comm.allreduce(local_comm.Get_size(),
+                                                          op=MPI.MIN)
+                local_comm.Free()
+                kwargs = {}
+                if space_order is not None:
+                    # The halo of a centered stencil is half the space order
+                    kwargs['width'] = max(space_order // 2, 1)
+                self._topology = optimize_topology(shape, self._input_comm.size,
+                                                   nprocs_local, **kwargs)
             else:
                 # A custom topology may contain integers or the wildcard '*'
                 self._topology = CustomTopology(topology, self._input_comm)
@@ -257,10 +303,24 @@ class Distributor(AbstractDistributor):
             self._input_comm = None
             self._comm = MPI.COMM_NULL
             self._topology = tuple(1 for _ in range(len(shape)))
+            # Without MPI, there's just a single subdomain
+            decomposition = cost = None
 
         # The domain decomposition
-        self._decomposition = [Decomposition(np.array_split(range(i), j), c)
-                               for i, j, c in zip(shape, self.topology, self.mycoords)]
+        if cost is not None:
+            decomposition = balance_decomposition(cost, shape, self.topology)
+        elif decomposition is None:
+            decomposition = (None,)*len(shape)
+        self._decomposition = []
+        for i, j, c, sizes in zip(shape, self.topology, self.mycoords, decomposition):
+            if sizes is None:
+                split = np.array_split(range(i), j)
+            else:
+                if len(sizes) != j or sum(sizes) != i:
+                    raise ValueError("Cannot decompose a Dimension of size %d into "
+                                     "%d subdomains of sizes %s" % (i, j, sizes))
+                split = np.split(np.arange(i), np.cumsum(sizes)[:-1])
+            self._decomposition.append(Decomposition(split, c))
 
     @property
     def comm(self):
@@ -741,6 +801,167 @@ def compute_dims(nprocs, ndim):
     return tuple(v for _ in range(ndim))
 
 
+def balance_decomposition(cost, shape, topology):
+    """
+    Compute the subdomain sizes balancing the computational cost.
+
+    As the decomposition is Cartesian, the split points along a Dimension are
+    shared by all subdomains, so only the cost profile along that Dimension,
+    that is the total cost of each of its slices, can be balanced.
+
+    Parameters
+    ----------
+    cost : numpy.ndarray or tuple
+        The cost of each grid point, as an array of shape `shape`, or a tuple
+        of per-Dimension cost profiles, possibly None for uniform costs.
+    shape : tuple of ints
+        The shape of the domain to be decomposed.
+    topology : tuple of ints
+        The number of processes along each Dimension.
+
+    Examples
+    --------
+    A cost twice as large in the right half of the domain
+
+    >>> import numpy as np
+    >>> from devito.mpi.distributed import balance_decomposition
+    >>> cost = np.ones((12, 4))
+    >>> cost[6:] = 2
+    >>> balance_decomposition(cost, (12, 4), (2, 2))
+    ((7, 5), (2, 2))
+    """
+    if isinstance(cost, np.ndarray):
+        if cost.shape != tuple(shape):
+            raise ValueError("Expected a `cost` of shape %s, got %s instead"
+                             % (shape, cost.shape))
+        axes = range(len(shape))
+        profiles = [cost.sum(axis=tuple(j for j in axes if j != i)) for i in axes]
+    else:
+        profiles = as_tuple(cost)
+        if len(profiles) != len(shape):
+            raise ValueError("Expected %d cost profiles, got %d instead"
+                             % (len(shape), len(profiles)))
+
+    ret = []
+    for profile, n, p in zip(profiles, shape, topology):
+        if profile is None:
+            ret.append(tuple(len(i) for i in np.array_split(range(n), p)))
+            continue
+        profile = np.asarray(profile, dtype=np.float64)
+        if profile.shape != (n,) or np.any(profile < 0):
+            raise ValueError("Expected a non-negative cost profile of %d entries"
+                             % n)
+        if n < p:
+            raise ValueError("Cannot decompose a Dimension of size %d into %d "
+                             "subdomains" % (n, p))
+
+        # `cumcost[i]` is the cost of the first `i` points
+        cumcost = np.concatenate([[0], np.cumsum(profile)])
+        if cumcost[-1] == 0:
+            ret.append(tuple(len(i) for i in np.array_split(range(n), p)))
+            continue
+
+        # The i-th split point is where the cumulative cost is the closest to
+        # i/p of the total, while leaving at least one point to each subdomain
+        points = []
+        for i in range(1, p):
+            target = cumcost[-1] * i / p
+            b = int(np.searchsorted(cumcost, target))
+            if b > 0 and target - cumcost[b-1] <= cumcost[b] - target:
+                b -= 1
+            lo = (points[-1] if points else 0) + 1
+            hi = n - (p - i)
+            points.append(min(max(b, lo), hi))
+        ret.append(tuple(int(i) for i in np.diff([0] + points + [n])))
+
+    return tuple(ret)
+
+
+def optimize_topology(shape, nprocs, nprocs_local=1, width=4, internode_cost=4.):
+    """
+    Compute the topology minimizing the estimated volume of the halo exchanges.
+
+    All factorizations of `nprocs` into `len(shape)` factors are considered.
+    For each of them, the halo exchanged by every pair of neighbouring ranks is
+    the face of their subdomain, extended by the halo along the other
+    decomposed Dimensions, `width` points thick. The MPI ranks are assumed to
+    be placed on the nodes in blocks of `nprocs_local` consecutive ranks, as
+    is the default of most MPI launchers, and the faces between ranks on
+    different nodes are weighted by `internode_cost`.
+
+    Parameters
+    ----------
+    shape : tuple of ints
+        The shape of the domain to be decomposed.
+    nprocs : int
+        The number of MPI processes.
+    nprocs_local : int, optional
+        The number of MPI processes per node. Defaults to 1.
+    width : int, optional
+        The halo width, e.g. half the space order. Defaults to 4.
+    internode_cost : float, optional
+        The cost of exchanging a point across nodes, relative to that of
+        exchanging it within a node. Defaults to 4.
+
+    Examples
+    --------
+    An elongated domain is decomposed along its longest Dimensions
+
+    >>> from devito.mpi.distributed import optimize_topology
+    >>> optimize_topology((4000, 1000, 800), 16)
+    (8, 2, 1)
+
+    whereas a cube is decomposed evenly
+
+    >>> optimize_topology((200, 200, 200), 8)
+    (2, 2, 2)
+
+    The thicker the halo, the more expensive its extension along the other
+    decomposed Dimensions, so fewer Dimensions get decomposed
+
+    >>> optimize_topology((40, 40), 4, width=1)
+    (2, 2)
+    >>> optimize_topology((40, 40), 4, width=8)
+    (4, 1)
+    """
+    ndim = len(shape)
+    ranks = np.arange(nprocs)
+
+    def factorizations(n, k):
+        if k == 1:
+            yield (n,)
+            return
+        for i in range(1, n + 1):
+            if n % i == 0:
+                for j in factorizations(n // i, k - 1):
+                    yield (i,) + j
+
+    def cost(topology):
+        node = (ranks // max(nprocs_local, 1)).reshape(topology)
+        local = [n / p for n, p in zip(shape, topology)]
+        ret = 0.
+        for d, p in enumerate(topology):
+            if p == 1:
+                continue
+            face = width * np.prod([n + 2*width*(q > 1) for j, (n, q) in
+                                    enumerate(zip(local, topology)) if j != d])
+            left = np.take(node, range(p - 1), axis=d)
+            right = np.take(node, range(1, p), axis=d)
+            ninternode = np.count_nonzero(left != right)
+            nintranode = left.size - ninternode
+            # Both directions
+            ret += 2 * face * (nintranode + internode_cost * ninternode)
+        return ret
+
+    candidates = [i for i in factorizations(nprocs, ndim)
+                  if all(p <= n for p, n in zip(i, shape))]
+    if not candidates:
+        return compute_dims(nprocs, ndim)
+
+    # On ties, prefer more processes along the outermost Dimensions
+    return min(candidates, key=lambda i: (cost(i), tuple(-p for p in i)))
+
+
 # Yes, AFAICT, nothing like this is available in mpi4py
 mpi4py_thread_levels = {
     'single': MPI.THREAD_SINGLE,
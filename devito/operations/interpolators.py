@@ -4,11 +4,6 @@ from functools import wraps, cached_property
 import sympy
 import numpy as np
 
-try:
-    from scipy.special import i0
-except ImportError:
-    from numpy import i0
-
 from devito.finite_differences.differentiable import Mul
 from devito.finite_differences.elementary import floor
 from devito.logger import warning
@@ -21,6 +16,15 @@ from devito.types.utils import DimensionTuple
 __all__ = ['LinearInterpolator', 'PrecomputedInterpolator', 'SincInterpolator']
 
 
+def _i0():
+    # SciPy is imported lazily, as it takes a sizeable chunk of `import devito`
+    try:
+        from scipy.special import i0
+    except ImportError:
+        from numpy import i0
+    return i0
+
+
 def check_radius(func):
     @wraps(func)
     def wrapper(interp, *args, **kwargs):
@@ -476,7 +480,7 @@ class SincInterpolator(PrecomputedInterpolator):
                 7: 7.51, 8: 8.56, 9: 9.56, 10: 10.64}
 
     def __init__(self, sfunction):
-        if i0 is np.i0:
+        if _i0() is np.i0:
             warning("""
 Using `numpy.i0`. We (and numpy) recommend to install scipy to improve the performance
 of the SincInterpolator that uses i0 (Bessel function).
@@ -503,6 +507,7 @@ of the SincInterpolator that uses i0 (Bessel function).
 
     def _arg_defaults(self, coords=None, sfunc=None):
         args = {}
+        i0 = _i0()
         b = self._b_table[self.r]
         b0 = i0(b)
         if coords is None or sfunc is None:
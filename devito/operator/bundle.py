@@ -0,0 +1,153 @@
+import json
+import os
+import pickle
+import platform as pyplatform
+
+from devito.arch import Device
+from devito.exceptions import InvalidOperator
+from devito.logger import warning
+from devito.parameters import configuration
+from devito.tools import ctypes_to_cstr
+
+__all__ = ['export_bundle', 'load_bundle']
+
+
+BUNDLE_FORMAT = 1
+"""The version of the bundle layout; bumped upon incompatible changes."""
+
+_metadata_file = 'metadata.json'
+_operator_file = 'operator.pkl'
+
+
+def fingerprint(platform, compiler, language):
+    """
+    Describe the environment in which an Operator is JIT-compiled. This is
+    what determines whether the resulting shared object may be loaded elsewhere.
+    """
+    from devito import __version__
+
+    try:
+        version = str(compiler.version)
+    except Exception:
+        version = None
+
+    return {
+        'devito': __version__,
+        'machine': pyplatform.machine(),
+        'platform': platform.name,
+        'device': isinstance(platform, Device),
+        'isa': getattr(platform, 'isa', None),
+        'language': str(language),
+        'compiler': compiler.name,
+        'compiler-version': version,
+    }
+
+
+def export_bundle(op, path):
+    """
+    Write `op` into the bundle directory `path`.
+
+    A bundle consists of:
+
+        * the JIT-compiled shared object;
+        * the pickled Operator, without the shared object;
+        * a human-readable `metadata.json`, with the bundle format, the
+          fingerprint of the compilation environment, and the Operator
+          parameters along with their C types.
+    """
+    # Trigger JIT compilation, if not done yet
+    op.cfunction
+
+    os.makedirs(path, exist_ok=True)
+
+    state = op.__getstate__()
+    binary = state.pop('binary')
+    soname = state.pop('soname')
+
+    sofile = '%s%s' % (soname, op._compiler.so_ext)
+    with open(os.path.join(path, sofile), 'wb') as f:
+        f.write(binary)
+
+    with open(os.path.join(path, _operator_file), 'wb') as f:
+        pickle.dump((type(op), state), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    metadata = {
+        'format': BUNDLE_FORMAT,
+        'name': op.name,
+        'soname': soname,
+        'sofile': sofile,
+        'fingerprint': fingerprint(op._platform, op._compiler, op._language),
+        'parameters': [{'name': i.name,
+                        'type': type(i).__name__,
+                        'ctype': ctypes_to_cstr(i._C_ctype)} for i in op.parameters],
+    }
+    with open(os.path.join(path, _metadata_file), 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+
+def load_bundle(path, platform=None):
+    """
+    Load the Operator stored in the bundle directory `path`.
+
+    The bundle is validated against `platform`, which defaults to
+    `configuration['platform']`. An InvalidOperator is raised if the stored
+    shared object cannot be executed on `platform`.
+    """
+    try:
+        with open(os.path.join(path, _metadata_file), 'r') as f:
+            metadata = json.load(f)
+    except (OSError, ValueError) as e:
+        raise InvalidOperator("`%s` is not a valid Operator bundle [%s]" % (path, e))
+
+    if metadata.get('format') != BUNDLE_FORMAT:
+        raise InvalidOperator("Unsupported bundle format `%s` (expected `%s`)"
+                              % (metadata.get('format'), BUNDLE_FORMAT))
+
+    check_fingerprint(metadata['fingerprint'], platform or configuration['platform'])
+
+    with open(os.path.join(path, _operator_file), 'rb') as f:
+        cls, state = pickle.load(f)
+    with open(os.path.join(path, metadata['sofile']), 'rb') as f:
+        state['binary'] = f.read()
+    state['soname'] = metadata['soname']
+
+    op = cls.__new__(cls, None)
+    op.__setstate__(state)
+
+    return op
+
+
+def check_fingerprint(fp, platform):
+    """
+    Raise InvalidOperator if a shared object with fingerprint `fp` cannot be
+    executed on `platform`.
+    """
+    from devito import __version__
+
+    if fp['machine'] != pyplatform.machine():
+        raise InvalidOperator("Bundle compiled for `%s`, but running on `%s`"
+                              % (fp['machine'], pyplatform.machine()))
+
+    if fp['device'] or isinstance(platform, Device):
+        if fp['platform'] != platform.name:
+            raise InvalidOperator("Bundle compiled for `%s`, but the target "
+                                  "platform is `%s`" % (fp['platform'], platform))
+    elif fp['isa'] != platform.isa:
+        # The shared object may still be usable, as long as the host supports
+        # a superset of the ISA it was compiled for
+        known_isas = platform.known_isas
+        if fp['isa'] not in known_isas or \
+           platform.isa not in known_isas or \
+           known_isas.index(fp['isa']) > known_isas.index(platform.isa):
+            raise InvalidOperator("Bundle compiled for ISA `%s`, which is not "
+                                  "supported by `%s` (ISA `%s`)"
+                                  % (fp['isa'], platform, platform.isa))
+
+    if fp['platform'] != platform.name and not fp['device']:
+        warning("Bundle compiled for `%s`, but running on `%s`; the shared "
+                "object may use unsupported instructions"
+                % (fp['platform'], platform))
+
+    if fp['devito'] != __version__:
+        warning("Bundle exported with Devito `%s`, but running Devito `%s`"
+                % (fp['devito'], __version__))
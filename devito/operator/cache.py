@@ -0,0 +1,399 @@
+from collections import OrderedDict, namedtuple
+from io import BytesIO
+from itertools import count
+import os
+import pickle
+
+import numpy as np
+import sympy
+
+from devito.logger import debug
+from devito.operator.profiling import profiling_level
+from devito.parameters import configuration
+from devito.symbolics import retrieve_functions
+from devito.tools import Signer, make_tempdir
+from devito.types.constant import Constant
+from devito.types.equation import Eq
+from devito.types.grid import CartesianDiscretization
+
+__all__ = ['build_cache', 'lift_literals']
+
+
+BuildKey = namedtuple('BuildKey', 'digest bindings')
+"""
+The key of an Operator in the build cache. `digest` is a deterministic hash of
+the symbolic input; `bindings` maps the names of the user-level DiscreteFunctions
+and Constants to the objects appearing in the symbolic input.
+"""
+
+
+# The attributes that do not affect code generation, and that would only
+# cause spurious cache misses (e.g., a Constant's value is a runtime argument)
+_ignored_attrs = frozenset({'initializer', 'allocator', 'value'})
+
+
+class SymbolicSignature:
+
+    """
+    Produce a deterministic string out of a sequence of symbolic objects.
+
+    Unlike pickling, the string is independent of the data carried by the
+    DiscreteFunctions, of the order of sets, and of the process in which it is
+    computed. The DiscreteFunctions and Constants encountered along the way are
+    recorded, as they may be bound to a different symbolic input.
+    """
+
+    def __init__(self):
+        self.memo = {}
+        self.bindings = {}
+
+    def visit(self, obj):
+        try:
+            return self.memo[id(obj)][0]
+        except KeyError:
+            pass
+
+        # Avoid infinite recursion on self-referencing objects
+        self.memo[id(obj)] = ('<%s>' % type(obj).__name__, obj)
+
+        ret = self._visit(obj)
+
+        # Keep `obj` alive so that `id(obj)` can't be reused
+        self.memo[id(obj)] = (ret, obj)
+
+        return ret
+
+    def _visit(self, obj):
+        if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+            return repr(obj)
+        elif isinstance(obj, (np.number, np.bool_)):
+            return '%s(%s)' % (type(obj).__name__, obj)
+        elif isinstance(obj, type):
+            return obj.__name__
+        elif isinstance(obj, np.dtype):
+            return str(obj)
+        elif isinstance(obj, np.ndarray):
+            # Only the metadata, never the data
+            return 'ndarray%s%s' % (obj.shape, obj.dtype)
+        elif isinstance(obj, dict):
+            items = sorted(('%s:%s' % (self.visit(k), self.visit(v))
+                            for k, v in obj.items()))
+            return '{%s}' % ','.join(items)
+        elif isinstance(obj, (set, frozenset)):
+            return '{%s}' % ','.join(sorted(self.visit(i) for i in obj))
+        elif isinstance(obj, (tuple, list)):
+            return '%s(%s)' % (type(obj).__name__,
+                               ','.join(self.visit(i) for i in obj))
+        elif isinstance(obj, CartesianDiscretization):
+            return '%s[%s;%s;%s;%s]' % (type(obj).__name__,
+                                        getattr(obj, 'name', None), obj.shape,
+                                        self.visit(obj.dimensions),
+                                        self.visit(obj.dtype))
+        elif getattr(obj, 'is_AbstractFunction', False):
+            return self._visit_function(obj)
+        elif isinstance(obj, sympy.Basic):
+            return self._visit_basic(obj)
+        elif hasattr(obj, 'sfunction'):
+            # Interpolators
+            return '%s[%s]' % (type(obj).__name__, self.visit(obj.sfunction))
+        elif hasattr(obj, '__rargs__'):
+            return '%s[%s]' % (type(obj).__name__, self._visit_attrs(obj))
+        else:
+            return '%s[%s]' % (type(obj).__name__, obj)
+
+    def _visit_attrs(self, obj, attrs=None):
+        if attrs is None:
+            attrs = tuple(obj.__rargs__) + tuple(obj.__rkwargs__)
+        items = []
+        for i in attrs:
+            i = i.lstrip('*')
+            if i in _ignored_attrs:
+                continue
+            items.append('%s=%s' % (i, self.visit(getattr(obj, i, None))))
+        return ','.join(items)
+
+    def _visit_basic(self, obj):
+        if obj.is_Atom and not hasattr(obj, '__rkwargs__'):
+            return '%s[%s]' % (type(obj).__name__, obj)
+
+        if isinstance(obj, Constant):
+            self.bindings.setdefault(obj.name, obj)
+
+        args = ','.join(self.visit(i) for i in obj.args)
+        attrs = (tuple(getattr(obj, '__rargs__', ())) +
+                 tuple(getattr(obj, '__rkwargs__', ())))
+        return '%s(%s)[%s]' % (type(obj).__name__, args,
+                               self._visit_attrs(obj, attrs))
+
+    def _visit_function(self, obj):
+        # A Function application, e.g. `u(t + dt, x, y)`, is described by its
+        # indices and, once per signature, by its root Function
+        function = obj.function
+        if function is not obj:
+            return '%s(%s)' % (self.visit(function),
+                               ','.join(self.visit(i) for i in obj.args))
+
+        if function.is_DiscreteFunction:
+            self.bindings.setdefault(function.name, function)
+
+        args = ','.join(self.visit(i) for i in obj.args)
+        attrs = self._visit_attrs(obj)
+        if function.is_DiscreteFunction:
+            # The allocator is ignored, but the alignment of the memory it
+            # provides is assumed by the generated code
+            attrs = '%s,alignment=%s' % (attrs, function._data_alignment)
+        return '%s(%s)[%s]' % (type(obj).__name__, args, attrs)
+
+
+class BuildCachePickler(pickle.Pickler):
+
+    """
+    Pickle an Operator without the user-level DiscreteFunctions and Constants,
+    which are instead referenced by name and rebound upon unpickling.
+    """
+
+    def __init__(self, file, bindings):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.bindings = {id(v): k for k, v in bindings.items()}
+
+    def persistent_id(self, obj):
+        return self.bindings.get(id(obj))
+
+
+class BuildCacheUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, bindings):
+        super().__init__(file)
+        self.bindings = bindings
+
+    def persistent_load(self, pid):
+        return self.bindings[pid]
+
+
+def lift_literals(expressions):
+    """
+    Replace the floating-point literals in the right-hand sides of `expressions`
+    with Constants carrying the same value.
+
+    The Constants are named after the order in which the literals are found, so
+    expressions differing only in the value of their literals become
+    structurally identical, and thus share the same build cache entry.
+
+    Literals appearing within Derivatives or Function indices, as well as
+    exponents, are left untouched, as they affect the generated code (e.g.,
+    the finite-difference weights, the access offsets, or the lowering of
+    `u**0.5` into `sqrt(u)`).
+
+    The Constants are floating-point even if the LHS is integer, so that the
+    literals retain their value (e.g., `0.5` in `Eq(f_int, g*0.5)`).
+    """
+    # Avoid clashes with the user-provided symbols
+    names = set()
+    for e in expressions:
+        names.update(i.name for i in retrieve_functions(e))
+        names.update(getattr(i, 'name', None) for i in e.free_symbols)
+
+    counter = count()
+
+    def make_constant(value, dtype):
+        name = next(n for n in ('lit%d' % i for i in counter) if n not in names)
+        return Constant(name=name, value=float(value), dtype=dtype)
+
+    processed = []
+    for e in expressions:
+        if not isinstance(e, Eq):
+            processed.append(e)
+            continue
+
+        dtype = getattr(e.lhs, 'dtype', np.float32)
+        if not np.issubdtype(dtype, np.inexact):
+            dtype = np.result_type(dtype, np.float32).type
+        rhs = _lift_literals(e.rhs, {}, lambda v: make_constant(v, dtype))
+        if rhs is not e.rhs:
+            e = e._rebuild(rhs=rhs)
+        processed.append(e)
+
+    return tuple(processed)
+
+
+def _lift_literals(expr, mapper, make_constant):
+    if isinstance(expr, sympy.Float):
+        try:
+            return mapper[expr]
+        except KeyError:
+            return mapper.setdefault(expr, make_constant(expr))
+    elif expr.is_Atom or \
+            isinstance(expr, (sympy.Derivative, sympy.Indexed)) or \
+            getattr(expr, 'is_AbstractFunction', False):
+        # NOTE: we can't rely on `xreplace` as it would also process the
+        # Derivatives, whose substitutions are postponed until evaluation
+        return expr
+    elif expr.is_Pow:
+        base = _lift_literals(expr.base, mapper, make_constant)
+        if base is expr.base:
+            return expr
+        return expr.func(base, expr.exp)
+
+    args = [_lift_literals(i, mapper, make_constant) for i in expr.args]
+    if all(i is j for i, j in zip(args, expr.args)):
+        return expr
+    return expr.func(*args)
+
+
+class BuildCache:
+
+    """
+    A cache of lowered Operators.
+
+    The Operators are keyed by their symbolic input, that is the input
+    expressions, the optimization level and options, the target platform,
+    language and compiler, and the `configuration`. On a hit, the lowered
+    Operator is unpickled straight from disk, thus skipping lowering entirely.
+
+    The user-level DiscreteFunctions and Constants are not stored in the cache;
+    upon unpickling, the restored Operator is bound to the objects appearing in
+    the new symbolic input.
+
+    The cache has two tiers: an in-memory tier, holding the Operators built by
+    the running process, and a persistent, on-disk tier, shared by all
+    processes.
+
+    Notes
+    -----
+    The cache is only used if `configuration['build-cache']` or
+    `configuration['lift-literals']` is set; the on-disk tier is only used if
+    `configuration['build-cache']` is set.
+    """
+
+    memory_size = 64
+    """The maximum number of Operators in the in-memory tier."""
+
+    def __init__(self, path=None):
+        self._path = path
+        self._memory = OrderedDict()
+
+    @property
+    def enabled(self):
+        return configuration['build-cache'] or configuration['lift-literals']
+
+    @property
+    def persistent(self):
+        return configuration['build-cache']
+
+    @property
+    def path(self):
+        """The directory in which the cache entries are stored."""
+        if self._path is None:
+            return make_tempdir('buildcache')
+        os.makedirs(self._path, exist_ok=True)
+        return self._path
+
+    def key(self, cls, expressions, **kwargs):
+        """
+        Compute the BuildKey for an Operator of type `cls` given its input
+        expressions and keyword arguments. Return None if the cache is disabled.
+        """
+        if not self.enabled:
+            return None
+
+        from devito import __version__
+
+        signature = SymbolicSignature()
+
+        items = [__version__, cls.__name__]
+        items.extend(signature.visit(i) for i in expressions)
+        for k in sorted(kwargs):
+            v = kwargs[k]
+            if k == 'allocator':
+                # Determined by `compiler`, `language` and `platform`
+                continue
+            elif k == 'compiler':
+                v = (v.name, v.cc, v.cflags, v.ldflags, v.include_dirs,
+                     v.libraries, v.library_dirs, v.defines)
+            elif k == 'platform':
+                v = v.name
+            items.append('%s=%s' % (k, signature.visit(v)))
+        items.append(Signer._digest(configuration))
+        # The instrumentation is added at lowering time, but the profiling
+        # level isn't part of the configuration signature (`impacts_jit=False`)
+        items.append('profiling=%s' % profiling_level())
+
+        return BuildKey(Signer._sign(items), signature.bindings)
+
+    def _entry(self, key):
+        return os.path.join(str(self.path), '%s.pkl' % key.digest)
+
+    def load(self, key):
+        """
+        Retrieve the Operator associated with `key`, or None on a cache miss.
+        """
+        if key is None:
+            return None
+
+        try:
+            if key.digest in self._memory:
+                self._memory.move_to_end(key.digest)
+                op = BuildCacheUnpickler(BytesIO(self._memory[key.digest]),
+                                         key.bindings).load()
+            elif self.persistent:
+                with open(self._entry(key), 'rb') as f:
+                    op = BuildCacheUnpickler(f, key.bindings).load()
+            else:
+                return None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # E.g., a corrupted or stale entry; we simply rebuild the Operator
+            debug("Discarding unreadable build-cache entry `%s` [%s]"
+                  % (key.digest, e))
+            return None
+
+        # Python-level timers refer to the original lowering
+        op._profiler.py_timers.clear()
+
+        return op
+
+    def save(self, key, op):
+        """
+        Store `op` in the cache under `key`.
+        """
+        if key is None:
+            return
+
+        # Trigger code generation now, so that the restored Operators won't
+        # have to do it again
+        op._soname
+
+        buf = BytesIO()
+        try:
+            BuildCachePickler(buf, key.bindings).dump(op)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            debug("Operator `%s` could not be stored in the build-cache [%s]"
+                  % (op.name, e))
+            return
+
+        self._memory[key.digest] = buf.getvalue()
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+        if not self.persistent:
+            return
+
+        # Write-then-rename, so that concurrent processes (e.g., MPI ranks)
+        # never observe partially written entries
+        entry = self._entry(key)
+        tmpfile = '%s.%d.tmp' % (entry, os.getpid())
+        with open(tmpfile, 'wb') as f:
+            f.write(buf.getvalue())
+        os.replace(tmpfile, entry)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        self._memory.clear()
+        for i in os.listdir(str(self.path)):
+            if i.endswith('.pkl'):
+                os.remove(os.path.join(str(self.path), i))
+
+
+build_cache = BuildCache()
+"""The default build cache."""
@@ -1,9 +1,11 @@
 from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 import ctypes
 import shutil
-from operator import attrgetter
+from operator import attrgetter, methodcaller
 from math import ceil
+from time import time as seq_time
 from tempfile import gettempdir
 
 from sympy import sympify
@@ -18,16 +20,18 @@ from devito.ir.equations import LoweredEq, lower_exprs, concretize_subdims
 from devito.ir.clusters import ClusterGroup, clusterize
 from devito.ir.iet import (Callable, CInterface, EntryFunction, FindSymbols, MetaCall,
                            derive_parameters, iet_build)
-from devito.ir.support import AccessMode, SymbolRegistry
+from devito.ir.support import AccessMode, SymbolRegistry, scope_cache
 from devito.ir.stree import stree_build
-from devito.operator.profiling import create_profile
+from devito.operator.bundle import export_bundle, load_bundle
+from devito.operator.cache import build_cache, lift_literals
+from devito.operator.profiling import CompileProfile, create_profile
 from devito.operator.registry import operator_selector
 from devito.mpi import MPI
 from devito.parameters import configuration
 from devito.passes import (Graph, lower_index_derivatives, generate_implicit,
                            generate_macros, minimize_symbols, unevaluate,
                            error_mapper, is_on_device)
-from devito.symbolics import estimate_cost, subs_op_args
+from devito.symbolics import estimate_cost, normalize_args, subs_op_args
 from devito.tools import (DAG, OrderedSet, Signer, ReducerMap, as_mapper, as_tuple,
                           flatten, filter_sorted, frozendict, is_integer,
                           split, timed_pass, timed_region, contains_val)
@@ -36,7 +40,7 @@ from devito.types import (Buffer, Grid, Evaluable, host_layer, device_layer,
 from devito.types.dimension import Thickness
 
 
-__all__ = ['Operator']
+__all__ = ['Operator', 'compile_all']
 
 
 class Operator(Callable):
@@ -165,10 +169,24 @@ class Operator(Callable):
         cls._check_kwargs(**kwargs)
         expressions = cls._sanitize_exprs(expressions, **kwargs)
 
-        # Lower to a JIT-compilable object
-        with timed_region('op-compile') as r:
-            op = cls._build(expressions, **kwargs)
+        # Turn the literals into runtime arguments, so that Operators differing
+        # only in the value of some coefficients share the same lowered code
+        if configuration['lift-literals']:
+            expressions = lift_literals(expressions)
+
+        # Lower to a JIT-compilable object, unless the very same Operator was
+        # already lowered by a previous process
+        with timed_region('op-compile', configuration['compile-profiling']) as r, \
+                scope_cache() as sc:
+            key = build_cache.key(cls, expressions, **kwargs)
+            op = build_cache.load(key)
+            if op is None:
+                op = cls._build(expressions, **kwargs)
+                build_cache.save(key, op)
+            else:
+                perf("Operator `%s` fetched from build-cache" % op.name)
         op._profiler.py_timers.update(r.timings)
+        op._compile_profile = CompileProfile.from_region(op.name, r, sc.counters)
 
         # Emit info about how long it took to perform the lowering
         op._emit_build_profiling()
@@ -535,6 +553,15 @@ class Operator(Callable):
     def threads_info(self):
         return frozendict({'nthreads': self.nthreads, 'npthreads': self.npthreads})
 
+    @property
+    def compile_profile(self):
+        """
+        A CompileProfile, that is a breakdown of the time spent in the various
+        compilation passes while building the Operator. More metrics are
+        collected if ``configuration['compile-profiling']`` is set.
+        """
+        return getattr(self, "_compile_profile", None)
+
     # Arguments processing
 
     @cached_property
@@ -760,6 +787,21 @@ class Operator(Callable):
             from devito.ir.iet.visitors import CGen
             return CGen(compiler=self._compiler).visit(self)
 
+    @cached_property
+    def _ccode_units(self):
+        """
+        The generated code as a sequence of translation units, to be compiled
+        separately. Unless `configuration['jit-split']` is set, there's only one.
+        """
+        if not configuration['jit-split'] or configuration['jit-backdoor']:
+            return ((self.name, str(self)),)
+        try:
+            printer = self._ccode_handler(compiler=self._compiler)
+        except TypeError:
+            from devito.ir.iet.visitors import CGen
+            printer = CGen(compiler=self._compiler)
+        return tuple((k, str(v)) for k, v in printer.units(self))
+
     def _jit_compile(self):
         """
         JIT-compile the C code generated by the Operator.
@@ -769,7 +811,13 @@ class Operator(Callable):
         """
         if self._lib is None:
             with self._profiler.timer_on('jit-compile'):
-                recompiled, src_file = self._compiler.jit_compile(self._soname, str(self))
+                if len(self._ccode_units) > 1:
+                    recompiled, src_file = self._compiler.jit_compile_units(
+                        self._soname, self._ccode_units
+                    )
+                else:
+                    recompiled, src_file = self._compiler.jit_compile(self._soname,
+                                                                      str(self))
 
             elapsed = self._profiler.py_timers['jit-compile']
             if recompiled:
@@ -832,6 +880,36 @@ class Operator(Callable):
     def __call__(self, **kwargs):
         return self.apply(**kwargs)
 
+    def prepare(self, **kwargs):
+        """
+        Process the runtime arguments once and return a PreparedCall, that is
+        a handle to invoke the Operator repeatedly with no argument processing.
+
+        The accepted keyword arguments are the same as in ``apply``. The bounds
+        of the time Dimensions (e.g., ``time_m`` and ``time_M``) may be updated
+        upon each invocation of the PreparedCall, within the range allowed by
+        the buffer sizes of the time-varying Functions, while all other
+        arguments are frozen.
+
+        Examples
+        --------
+        Running a time-sliced simulation, one timestep at a time
+
+        >>> from devito import Eq, Grid, TimeFunction, Operator
+        >>> grid = Grid(shape=(3, 3))
+        >>> u = TimeFunction(name='u', grid=grid, save=5)
+        >>> op = Operator(Eq(u.forward, u + 1))
+        >>> call = op.prepare(time_m=0, time_M=0)
+        >>> for i in range(4):
+        ...     call(time_m=i, time_M=i)
+        >>> float(u.data[4, 0, 0])
+        4.0
+        """
+        with self._profiler.timer_on('arguments'):
+            args = self.arguments(**kwargs)
+
+        return PreparedCall(self, args, **kwargs)
+
     def apply(self, **kwargs):
         """
         Execute the Operator.
@@ -1064,6 +1142,54 @@ class Operator(Callable):
 
         return summary
 
+    # Ahead-of-time compilation support
+
+    def export(self, path):
+        """
+        Export the Operator, along with its JIT-compiled shared object, to a
+        bundle directory. The bundle may then be shipped to a different machine
+        and restored via ``Operator.load``, thus bypassing JIT compilation.
+
+        Parameters
+        ----------
+        path : str
+            The bundle directory. It is created if it does not exist.
+
+        Examples
+        --------
+        >>> import tempfile
+        >>> from devito import Eq, Grid, Function, Operator
+        >>> grid = Grid(shape=(4, 4))
+        >>> f = Function(name='f', grid=grid)
+        >>> op = Operator(Eq(f, f + 1))
+        >>> path = tempfile.mkdtemp()
+        >>> op.export(path)
+        >>> op1 = Operator.load(path)
+        >>> summary = op1.apply(f=f)
+        >>> float(f.data[0, 0])
+        1.0
+        """
+        export_bundle(self, path)
+
+    @classmethod
+    def load(cls, path, platform=None):
+        """
+        Load an Operator from a bundle directory created by ``Operator.export``.
+
+        The bundle is validated against the target platform; if the shared object
+        it contains cannot be executed, an InvalidOperator is raised.
+
+        Parameters
+        ----------
+        path : str
+            The bundle directory.
+        platform : str or Platform, optional
+            The target platform. Defaults to ``configuration['platform']``.
+        """
+        if isinstance(platform, str):
+            platform = platform_registry[platform]()
+        return load_bundle(path, platform=platform)
+
     # Pickling support
 
     def __getstate__(self):
@@ -1149,6 +1275,55 @@ def rcompile(expressions, kwargs, options, target=None):
     return cls._lower(expressions, **kwargs)
 
 
+def compile_all(operators, workers=None):
+    """
+    JIT-compile multiple Operators concurrently.
+
+    The backend compiler runs in a separate process for each Operator, so
+    compilation proceeds in parallel and takes roughly as long as that of the
+    slowest Operator. The jit-cache is shared safely across the workers.
+
+    Parameters
+    ----------
+    operators : Operator or iterable of Operator
+        The Operators to be JIT-compiled.
+    workers : int, optional
+        The maximum number of concurrent compilations. Defaults to the number
+        of available CPUs.
+
+    Returns
+    -------
+    The input Operators, in the same order, ready to be applied.
+
+    Examples
+    --------
+    >>> from devito import Eq, Grid, TimeFunction, Operator, compile_all
+    >>> grid = Grid(shape=(4, 4))
+    >>> u = TimeFunction(name='u', grid=grid)
+    >>> op0 = Operator(Eq(u.forward, u + 1))
+    >>> op1 = Operator(Eq(u.backward, u - 1))
+    >>> op0, op1 = compile_all([op0, op1], workers=2)
+    """
+    operators = as_tuple(operators)
+
+    # An Operator appearing more than once must be compiled only once
+    pending = list({id(op): op for op in operators if op._lib is None}.values())
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Code generation is serialized by the GIL, but the backend compilers
+            # run concurrently outside of the Python interpreter
+            for _ in executor.map(methodcaller('_jit_compile'), pending):
+                pass
+
+        # Loading the shared objects isn't thread-safe (e.g., `sysconfig`
+        # lazily initializes its state), so it's performed sequentially
+        for op in pending:
+            op.cfunction
+
+    return operators
+
+
 # Misc helpers
 
 
@@ -1282,6 +1457,142 @@ class ArgumentsMap(dict):
         return mapper
 
 
+class PreparedCall:
+
+    """
+    A handle to invoke an Operator repeatedly with a frozen set of runtime
+    arguments, as produced by ``Operator.prepare``.
+
+    All of the argument processing (derivation of default values, sanity checks,
+    conversion into ctypes objects, autotuning) is performed once, upon creation.
+    Upon invocation, only the bounds of the time Dimensions (e.g., ``time_m``
+    and ``time_M``) may be updated. Their legal range, which depends on the
+    buffer sizes of the time-varying Functions, is also determined once, upon
+    creation, so that an update causing out-of-bounds accesses is rejected.
+
+    Parameters
+    ----------
+    op : Operator
+        The Operator to be invoked.
+    args : ArgumentsMap
+        The finalized runtime arguments.
+    **kwargs
+        The user-provided runtime arguments from which `args` was derived.
+    """
+
+    def __init__(self, op, args, **kwargs):
+        self.op = op
+        self.args = args
+        self.kwargs = kwargs
+
+        self._dims = [d for d in op.dimensions if d.is_Time and not d.is_Derived]
+        names = {i for d in self._dims for i in (d.min_name, d.max_name)}
+
+        self._arg_values = [args[p.name] for p in op.parameters]
+        self._arg_index = {p.name: n for n, p in enumerate(op.parameters)
+                           if p.name in names}
+
+        # Statistics, across all invocations
+        self.elapsed = 0.
+        self._nsteps = {d: 0 for d in self._dims}
+
+        # The legal range of the time bounds, as in `Dimension._arg_check`
+        self._bounds = {}
+        for p in op.parameters:
+            if not getattr(p, 'is_DiscreteFunction', False):
+                continue
+            f = kwargs.get(p.name, p)
+            shape = getattr(f, 'shape_allocated', np.shape(f))
+            intervals = op._dspace[p]
+            for d, size in zip(p.dimensions, shape):
+                if d not in self._dims or not intervals[d].is_Defined:
+                    continue
+                lower = -intervals[d].lower
+                upper = intervals[d].upper
+                if not is_integer(upper):
+                    upper = upper.subs(normalize_args(args))
+                upper = size - 1 - upper
+                self._bounds[d.min_name] = max(self._bounds.get(d.min_name, lower),
+                                               lower)
+                self._bounds[d.max_name] = min(self._bounds.get(d.max_name, upper),
+                                               upper)
+
+    @property
+    def updatable(self):
+        """The names of the arguments that may be updated upon invocation."""
+        return tuple(self._arg_index)
+
+    def update(self, **kwargs):
+        """
+        Update, in place, one or more time bounds.
+
+        Raises
+        ------
+        InvalidArgument
+            If an argument isn't updatable, or if the updated time bounds
+            would cause an out-of-bounds access.
+        """
+        for k, v in kwargs.items():
+            if k not in self._arg_index:
+                raise InvalidArgument(f"Cannot update `{k}` in a PreparedCall; "
+                                      f"updatable arguments are {self.updatable}")
+            if not is_integer(v):
+                raise InvalidArgument(f"Expected integer value for `{k}`, got "
+                                      f"`{v}` instead")
+
+        for d in self._dims:
+            vmin = kwargs.get(d.min_name, self.args.get(d.min_name))
+            vmax = kwargs.get(d.max_name, self.args.get(d.max_name))
+            if vmin is not None and vmin < self._bounds.get(d.min_name, vmin):
+                raise InvalidArgument(f"OOB detected due to {d.min_name}={vmin}")
+            if vmax is not None and vmax > self._bounds.get(d.max_name, vmax):
+                raise InvalidArgument(f"OOB detected due to {d.max_name}={vmax}")
+            if vmin is not None and vmax is not None and vmax < vmin - 1:
+                raise InvalidArgument(f"Illegal {d.max_name}={vmax} < "
+                                      f"{d.min_name}={vmin}")
+
+        for k, v in kwargs.items():
+            self.args[k] = self._arg_values[self._arg_index[k]] = v
+
+    def __call__(self, **kwargs):
+        """
+        Invoke the Operator, after updating the time bounds supplied via
+        `kwargs`, if any.
+        """
+        self.update(**kwargs)
+
+        tic = seq_time()
+        retval = self.op.cfunction(*self._arg_values)
+        self.elapsed += seq_time() - tic
+
+        for d in self._nsteps:
+            try:
+                self._nsteps[d] += max(self.args[d.max_name] -
+                                       self.args[d.min_name] + 1, 0)
+            except KeyError:
+                pass
+
+        self.op._postprocess_errors(retval)
+        self.op._postprocess_arguments(self.args, **self.kwargs)
+
+    apply = __call__
+
+    def summary(self):
+        """
+        A PerformanceSummary of all invocations so far, as if they were a
+        single run of the Operator over all of the timesteps they executed.
+        """
+        # The generated code accumulates the section timings across invocations
+        args = ArgumentsMap(self.args, self.args.grid, self.op)
+        for d, nsteps in self._nsteps.items():
+            if d.min_name in args and d.max_name in args:
+                args[d.min_name] = 0
+                args[d.max_name] = nsteps - 1
+
+        return self.op._profiler.summary(args, self.op._dtype,
+                                         reduce_over=self.elapsed)
+
+
 def parse_kwargs(**kwargs):
     """
     Parse keyword arguments provided to an Operator.
@@ -20,7 +20,7 @@ from devito.parameters import configuration
 from devito.symbolics import subs_op_args
 from devito.tools import DefaultOrderedDict, flatten
 
-__all__ = ['create_profile']
+__all__ = ['create_profile', 'profiling_level', 'CompileProfile']
 
 
 SectionData = namedtuple('SectionData', 'ops sops points traffic itermaps')
@@ -81,12 +81,20 @@ class Profiler:
                 for k, v in i.traffic.items():
                     mapper.setdefault(k, []).append(v)
             traffic = 0
-            for i in mapper.values():
+            for (f, _, _), i in mapper.items():
                 try:
-                    traffic += IntervalGroup.generate('union', *i).size
+                    size = IntervalGroup.generate('union', *i).size
                 except (ValueError, TypeError):
                     # Over different iteration spaces
-                    traffic += sum(j.size for j in i)
+                    size = sum(j.size for j in i)
+
+                # The traffic is measured in units of the compute data type, so
+                # Functions stored in a narrower data type count proportionally less
+                if f.storage_dtype != f.dtype:
+                    size *= (S(np.dtype(f.storage_dtype).itemsize) /
+                             np.dtype(f.dtype).itemsize)
+
+                traffic += size
 
             # Each ExpressionBundle lives in its own iteration space
             itermaps = [i.ispace.dimension_map for i in bundles if i.ops != 0]
@@ -501,14 +509,129 @@ class PerformanceSummary(OrderedDict):
         return OrderedDict([(k, v.time) for k, v in self.items()])
 
 
-def create_profile(name):
-    """Create a new Profiler."""
+PassEntry = namedtuple('PassEntry', 'time ncalls size_in size_out sympy_cache maxrss')
+PassEntry.__new__.__defaults__ = (None,)*5
+
+
+class CompileProfile(OrderedDict):
+
+    """
+    A breakdown of the time spent in the compilation passes while building
+    an Operator.
+
+    The keys are the names of the passes, with nested passes separated by a
+    slash (e.g., ``lowering.Clusters/specializing.Clusters/cire``); the values
+    are PassEntry, providing the time spent in the pass and, if
+    ``configuration['compile-profiling']`` is set, the following metrics:
+
+        * the number of calls to the pass;
+        * the size of the IR in input and output to the pass, that is the number
+          of expressions, Clusters, or IET nodes;
+        * the number of entries in the SymPy cache at the end of the pass;
+        * the peak resident set size of the process at the end of the pass.
+
+    Parameters
+    ----------
+    name : str, optional
+        The name of the Operator.
+    total : float, optional
+        The total time, in seconds, spent in building the Operator.
+    counters : dict, optional
+        Event counters, such as the hits and misses of the compiler caches.
+    """
+
+    def __init__(self, name=None, total=0., *args, counters=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = name
+        self.total = total
+        self.counters = dict(counters or {})
+
+    @classmethod
+    def from_region(cls, name, region, counters=None):
+        """Create a CompileProfile from a `timed_region`."""
+        timings = region.timings
+        metrics = region.metrics or {}
+
+        profile = cls(name, timings.get(region.name, 0.), counters=counters)
+
+        def _flatten(timings, path=()):
+            for k, v in timings.items():
+                if not isinstance(v, dict):
+                    continue
+                key = path + (k,)
+                try:
+                    m = metrics[key]
+                    profile['/'.join(key)] = PassEntry(
+                        m['time'], m['ncalls'], m.get('size-in'), m.get('size-out'),
+                        m['sympy-cache'], m['maxrss']
+                    )
+                except KeyError:
+                    profile['/'.join(key)] = PassEntry(v['total'])
+                _flatten(v, key)
+
+        _flatten(timings)
+
+        return profile
+
+    @property
+    def timings(self):
+        return OrderedDict([(k, v.time) for k, v in self.items()])
+
+    def hotspots(self, n=3):
+        """The `n` most time-consuming leaf passes."""
+        leaves = [k for k in self if not any(i.startswith('%s/' % k) for i in self)]
+        return sorted(leaves, key=lambda k: self[k].time, reverse=True)[:n]
+
+    def todict(self):
+        return {'name': self.name,
+                'total': self.total,
+                'counters': dict(self.counters),
+                'passes': OrderedDict([(k, v._asdict()) for k, v in self.items()])}
+
+    @classmethod
+    def fromdict(cls, d):
+        return cls(d['name'], d['total'],
+                   [(k, PassEntry(**v)) for k, v in d['passes'].items()],
+                   counters=d.get('counters'))
+
+    def __repr__(self):
+        return "CompileProfile[%s]<%.2f s>" % (self.name, self.total)
+
+    def __str__(self):
+        fmt = lambda v, f: '-' if v is None else f % v
+
+        header = ('Pass', 'Time [s]', 'Calls', 'Size in', 'Size out', 'SymPy',
+                  'RSS [MB]')
+        lines = ["%-60s %10s %6s %9s %9s %9s %10s" % header]
+        for k, v in self.items():
+            depth = k.count('/')
+            label = '%s%s' % ('  '*depth, k.rsplit('/', 1)[-1])
+            maxrss = None if v.maxrss is None else v.maxrss / 2**20
+            lines.append("%-60s %10s %6s %9s %9s %9s %10s" % (
+                label, fmt(v.time, '%.3f'), fmt(v.ncalls, '%d'),
+                fmt(v.size_in, '%d'), fmt(v.size_out, '%d'),
+                fmt(v.sympy_cache, '%d'), fmt(maxrss, '%.1f')
+            ))
+        lines.append("%-60s %10.3f" % ('Total', self.total))
+        for k, v in self.counters.items():
+            lines.append("%-60s %10d" % (k, v))
+
+        return '\n'.join(lines)
+
+
+def profiling_level():
+    """The level of the Profiler that `create_profile` would create."""
     if configuration['log-level'] in ['DEBUG', 'PERF'] and \
        configuration['profiling'] == 'basic':
         # Enforce performance profiling in DEBUG mode
-        level = 'advanced'
+        return 'advanced'
     else:
-        level = configuration['profiling']
+        return configuration['profiling']
+
+
+def create_profile(name):
+    """Create a new Profiler."""
+    level = profiling_level()
     profiler = profiler_registry[level](name)
 
     if profiler.initialized:
@@ -38,6 +38,9 @@ class Parameters(OrderedDict, Signer):
         self._preprocess_functions = {}
         self._update_functions = {}
 
+        self._lazy = set()
+        self._pending = {}
+
         if kwargs is not None:
             for key, value in kwargs.items():
                 self[key] = value
@@ -74,11 +77,15 @@ class Parameters(OrderedDict, Signer):
 
     @_check_key_deprecation
     def __getitem__(self, key, *args):
+        if key in self._pending:
+            # A lazy parameter is only processed upon first access
+            self[key] = self._pending.pop(key)
         return super().__getitem__(key)
 
     @_check_key_deprecation
     @_check_key_value
     def __setitem__(self, key, value):
+        self._pending.pop(key, None)
         value = self._preprocess(key, value)
         if key in self._update_functions:
             value = self._update_functions[key](value)
@@ -93,10 +100,11 @@ class Parameters(OrderedDict, Signer):
         ``self[key] = value`` as both preprocessor and callback, if any,
         are bypassed.
         """
+        self._pending.pop(key, None)
         super().__setitem__(key, value)
 
     def add(self, key, value, accepted=None, preprocessor=None, callback=None,
-            impacts_jit=True, deprecate=None):
+            impacts_jit=True, deprecate=None, lazy=False):
         """
         Add a new parameter ``key`` with default value ``value``.
 
@@ -108,6 +116,10 @@ class Parameters(OrderedDict, Signer):
         If ``impacts_jit`` is False (defaults to True), then it can be assumed
         that the parameter doesn't affect code generation, so it can be excluded
         from the construction of the hash key.
+
+        If ``lazy`` is True (defaults to False), then preprocessor and callback
+        are only executed upon the first access to ``key``, rather than upon
+        initialization.
         """
         super().__setitem__(key, value)
         self._accepted[key] = accepted
@@ -119,6 +131,8 @@ class Parameters(OrderedDict, Signer):
             self._update_functions[key] = callback
         if deprecate is not None:
             self._deprecated[deprecate] = key
+        if lazy:
+            self._lazy.add(key)
 
     def initialize(self):
         """
@@ -126,8 +140,17 @@ class Parameters(OrderedDict, Signer):
         initialization.
         """
         for k, v in list(self.items()):
-            # Will trigger preprocessor and callback, if any
-            self[k] = v
+            if k in self._lazy:
+                self._pending[k] = v
+            else:
+                # Will trigger preprocessor and callback, if any
+                self[k] = v
+
+    def is_pending(self, key):
+        """
+        True if ``key`` is a lazy parameter that hasn't been accessed yet.
+        """
+        return key in self._pending
 
     @property
     def name(self):
@@ -136,7 +159,7 @@ class Parameters(OrderedDict, Signer):
     def _signature_items(self):
         # Note: we are discarding some vars that do not affect the C level
         # code in order to avoid recompiling when such vars are modified
-        return tuple(str(sorted((k, v) for k, v in self.items() if self._impact_jit[k])))
+        return tuple(str(sorted((k, self[k]) for k in self if self._impact_jit[k])))
 
 
 env_vars_mapper = {
@@ -149,9 +172,15 @@ env_vars_mapper = {
     'DEVITO_TOPOLOGY': 'topology',
     'DEVITO_LANGUAGE': 'language',
     'DEVITO_AUTOTUNING': 'autotuning',
+    'DEVITO_AUTOTUNING_DB': 'autotuning-db',
+    'DEVITO_AUTOTUNING_SEARCH': 'autotuning-search',
     'DEVITO_LOGGING': 'log-level',
     'DEVITO_FIRST_TOUCH': 'first-touch',
     'DEVITO_JIT_BACKDOOR': 'jit-backdoor',
+    'DEVITO_BUILD_CACHE': 'build-cache',
+    'DEVITO_LIFT_LITERALS': 'lift-literals',
+    'DEVITO_JIT_SPLIT': 'jit-split',
+    'DEVITO_COMPILE_PROFILING': 'compile-profiling',
     'DEVITO_IGNORE_UNKNOWN_PARAMS': 'ignore-unknowns',
     'DEVITO_SAFE_MATH': 'safe-math'
 }
@@ -269,5 +298,5 @@ def print_defaults():
 
 def print_state():
     """Print the current configuration state."""
-    for k, v in configuration.items():
-        info('%s: %s' % (k, v))
+    for k in configuration:
+        info('%s: %s' % (k, configuration[k]))
@@ -132,7 +132,9 @@ class OmpBB(LangBB):
         'simd-for-aligned': lambda n, *a:
             SimdForAligned('omp simd aligned(%s:%d)', arguments=(n, *a)),
         'atomic':
-            Pragma('omp atomic update')
+            Pragma('omp atomic update'),
+        'critical':
+            Pragma('omp critical')
     }
     mapper.update(CBB.mapper)
 
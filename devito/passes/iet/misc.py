@@ -13,7 +13,7 @@ from devito.passes.iet.engine import iet_pass
 from devito.ir.iet.efunc import DeviceFunction, EntryFunction
 from devito.symbolics import (ValueLimit, evalrel, has_integer_args, limits_mapper,
                               ccode)
-from devito.tools import Bunch, as_mapper, filter_ordered, split
+from devito.tools import Bunch, as_mapper, filter_ordered, split, storage_macros
 from devito.types import FIndexed
 
 __all__ = ['avoid_denormals', 'hoist_prodders', 'relax_incr_dimensions',
@@ -148,11 +148,15 @@ def _generate_macros(iet, tracker=None, **kwargs):
     iet = _generate_macros_findexeds(iet, tracker=tracker, **kwargs)
 
     headers = [i.header for i in tracker.values()]
-    headers = sorted((ccode(define), ccode(expr)) for define, expr in headers)
+    headers = sorted((ccode(define), ccode(expr, lvalue=True))
+                     for define, expr in headers)
 
     # Generate Macros from higher-level SymPy objects
     headers.extend(_generate_macros_math(iet))
 
+    # Generate Macros converting data stored in narrow data types
+    headers.extend(_generate_macros_storage(iet))
+
     # Remove redundancies while preserving the order
     headers = filter_ordered(headers)
 
@@ -202,6 +206,18 @@ def _generate_macros_math(iet):
     return headers
 
 
+def _generate_macros_storage(iet):
+    storage_dtypes = {i.function.storage_dtype
+                      for i in FindSymbols('indexeds').visit(iet)
+                      if i.function.is_DiscreteFunction}
+
+    headers = []
+    for i in sorted(storage_dtypes, key=str):
+        headers.extend(storage_macros(i))
+
+    return headers
+
+
 @singledispatch
 def _lower_macro_math(expr):
     return ()
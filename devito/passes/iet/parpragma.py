@@ -48,7 +48,10 @@ class PragmaSimdTransformer(PragmaTransformer):
 
     def _make_simd_pragma(self, iet):
         indexeds = FindSymbols('indexeds').visit(iet)
-        aligned = {i.base for i in indexeds if i.function.is_DiscreteFunction}
+        # NOTE: external data (e.g., via DataReference) might be less aligned
+        # than the size of a SIMD register
+        aligned = {i.base for i in indexeds if i.function.is_DiscreteFunction
+                   and i.function._data_alignment >= self.simd_reg_nbytes}
         if aligned:
             simd = self.lang['simd-for-aligned']
             simd = as_tuple(simd(self.simd_reg_nbytes, *aligned))
@@ -238,8 +241,17 @@ class PragmaShmTransformer(ShmTransformer, PragmaSimdTransformer):
             # Implement reduction
             mapper = {partree.root: partree.root._rebuild(reduction=reductions)}
         elif all(i is OpInc for _, _, i in reductions):
-            # Use atomic increments
-            mapper = {i: i._rebuild(pragmas=self.lang['atomic']) for i in exprs}
+            # Use atomic increments. An atomic update must be a plain compound
+            # assignment, which isn't the case for the increments of Functions
+            # stored in a narrower data type (load-convert, update,
+            # convert-store), so these resort to a critical section
+            mapper = {}
+            for i in exprs:
+                f = i.write
+                if f.storage_dtype != f.dtype:
+                    mapper[i] = i._rebuild(pragmas=self.lang['critical'])
+                else:
+                    mapper[i] = i._rebuild(pragmas=self.lang['atomic'])
         else:
             raise NotImplementedError
 
@@ -17,6 +17,7 @@ from sympy.printing.c import C99CodePrinter
 
 from devito.arch.compiler import AOMPCompiler
 from devito.symbolics.inspection import has_integer_args, sympy_dtype
+from devito.tools import storage_load
 from devito.types.basic import AbstractFunction
 
 __all__ = ['ccode']
@@ -32,7 +33,7 @@ class CodePrinter(C99CodePrinter):
     settings : dict
         Options for code printing.
     """
-    _default_settings = {'compiler': None, 'dtype': np.float32,
+    _default_settings = {'compiler': None, 'dtype': np.float32, 'lvalue': False,
                          **C99CodePrinter._default_settings}
 
     @property
@@ -72,7 +73,7 @@ class CodePrinter(C99CodePrinter):
         U[t,x,y,z] -> U[t][x][y][z]
         """
         inds = ''.join(['[' + self._print(x) + ']' for x in expr.indices])
-        return '%s%s' % (self._print(expr.base.label), inds)
+        return self._print_access(expr, '%s%s' % (self._print(expr.base.label), inds))
 
     def _print_FIndexed(self, expr):
         """
@@ -87,7 +88,25 @@ class CodePrinter(C99CodePrinter):
             label = expr.accessor.label
         except AttributeError:
             label = expr.base.label
-        return '%s(%s)' % (self._print(label), inds)
+        return self._print_access(expr, '%s(%s)' % (self._print(label), inds))
+
+    def _print_access(self, expr, access):
+        """
+        Convert `access` into the compute data type, if `expr` reads data stored
+        in a narrower data type. Nothing is done if `expr` is an lvalue, that is
+        the target of an assignment.
+        """
+        try:
+            dtype = expr.function.dtype
+            storage_dtype = expr.function.storage_dtype
+        except AttributeError:
+            return access
+
+        if storage_dtype == dtype or (self._settings['lvalue'] and
+                                      self._print_level == 1):
+            return access
+        else:
+            return storage_load(dtype, storage_dtype, access)
 
     def _print_Rational(self, expr):
         """Print a Rational as a C-like float/float division."""
@@ -6,6 +6,11 @@ import ctypes
 
 import numpy as np
 from cgen import dtype_to_ctype as cgen_dtype_to_ctype
+try:
+    from ml_dtypes import bfloat16
+except ImportError:
+    # bfloat16 storage is unavailable
+    bfloat16 = None
 
 from .utils import as_tuple
 
@@ -13,7 +18,9 @@ __all__ = ['int2', 'int3', 'int4', 'float2', 'float3', 'float4', 'double2',  # n
            'double3', 'double4', 'dtypes_vector_mapper', 'dtype_to_mpidtype',
            'dtype_to_cstr', 'dtype_to_ctype', 'dtype_to_mpitype', 'dtype_len',
            'ctypes_to_cstr', 'c_restrict_void_p', 'ctypes_vector_mapper',
-           'is_external_ctype', 'infer_dtype', 'CustomDtype']
+           'is_external_ctype', 'infer_dtype', 'CustomDtype', 'bfloat16',
+           'c_float16', 'c_bfloat16', 'storage_dtypes', 'storage_load',
+           'storage_store', 'storage_macros']
 
 
 # *** Custom np.dtypes
@@ -123,6 +130,72 @@ class CustomDtype:
     __str__ = __repr__
 
 
+# *** Compact storage types
+
+# The narrow floating point types in which the data of a DiscreteFunction may
+# be stored, while computing in a wider type (see `storage_dtype`). `ctypes`
+# lacks them, so they are carried around as 16-bit integers
+
+class c_float16(ctypes.c_uint16):
+    pass
+
+
+class c_bfloat16(ctypes.c_uint16):
+    pass
+
+
+ctypes_storage_mapper = {np.float16: c_float16}
+if bfloat16 is not None:
+    ctypes_storage_mapper[bfloat16] = c_bfloat16
+
+storage_dtypes = tuple(ctypes_storage_mapper)
+
+
+def storage_load(dtype, storage_dtype, access):
+    """
+    The C code converting `access`, which reads a value of type `storage_dtype`,
+    into the compute type `dtype`.
+    """
+    if storage_dtype is bfloat16:
+        # bfloat16 is the upper half of a float32
+        return 'BF16_TO_FLOAT(%s)' % access
+    else:
+        return '(%s)%s' % (dtype_to_cstr(dtype), access)
+
+
+def storage_store(dtype, storage_dtype, value):
+    """
+    The C code converting `value`, of compute type `dtype`, into a value of type
+    `storage_dtype`.
+    """
+    if storage_dtype is bfloat16:
+        return 'FLOAT_TO_BF16(%s)' % value
+    else:
+        return '(%s)(%s)' % (ctypes_to_cstr(dtype_to_ctype(storage_dtype)), value)
+
+
+def storage_macros(storage_dtype):
+    """
+    The macros, as (define, expression) 2-tuples, required by the conversions
+    from and to `storage_dtype`.
+    """
+    if storage_dtype is bfloat16:
+        # Type punning through compound literals; the store rounds to nearest,
+        # with ties to even, as ml_dtypes does, and keeps NaNs quiet NaNs
+        return (('BF16_TO_FLOAT(a)',
+                 '(((union {unsigned int i; float f;}){.i = (unsigned int)(a) << 16})'
+                 '.f)'),
+                ('FLOAT_TO_BITS(a)',
+                 '(((union {float f; unsigned int i;}){.f = (a)}).i)'),
+                ('BITS_TO_BF16(b)',
+                 '((unsigned short)((((b) & 0x7fffffffU) > 0x7f800000U) ?'
+                 ' (((b) >> 16) | 0x40U) :'
+                 ' (((b) + 0x7fffU + (((b) >> 16) & 1U)) >> 16)))'),
+                ('FLOAT_TO_BF16(a)', 'BITS_TO_BF16(FLOAT_TO_BITS(a))'))
+    else:
+        return ()
+
+
 # *** np.dtypes lowering
 
 
@@ -138,6 +211,11 @@ def dtype_to_ctype(dtype):
     except KeyError:
         pass
 
+    try:
+        return ctypes_storage_mapper[dtype]
+    except KeyError:
+        pass
+
     if isinstance(dtype, CustomDtype):
         return dtype
     elif issubclass(dtype, ctypes._SimpleCData):
@@ -212,6 +290,10 @@ def ctypes_to_cstr(ctype, toarray=None):
     """Translate ctypes types into C strings."""
     if ctype in ctypes_vector_mapper.values():
         retval = ctype.__name__
+    elif ctype is c_float16:
+        retval = '_Float16'
+    elif ctype is c_bfloat16:
+        retval = 'unsigned short'
     elif isinstance(ctype, CustomDtype):
         retval = str(ctype)
     elif issubclass(ctype, ctypes.Structure):
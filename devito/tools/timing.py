@@ -2,8 +2,15 @@ from collections import OrderedDict, defaultdict
 from functools import partial
 from threading import get_ident
 from time import time
+import sys
 
-__all__ = ['timed_pass', 'timed_region']
+try:
+    import resource
+except ImportError:
+    # E.g., Windows
+    resource = None
+
+__all__ = ['timed_pass', 'timed_region', 'ir_size']
 
 
 class timed_pass:
@@ -24,6 +31,14 @@ class timed_pass:
     A ``thread_id -> stack`` mapper, to keep track of nested `timed_pass`.
     """
 
+    metrics = {}
+    """
+    A ``thread_id -> metrics`` mapper. Only populated within a `timed_region`
+    created with ``metrics=True``, in which case, besides the timings, a set of
+    metrics are recorded for each `timed_pass`, keyed by its position (a tuple)
+    in the stack of nested `timed_pass`.
+    """
+
     def __new__(cls, *args, name=None):
         if args:
             # The typical use case:
@@ -72,6 +87,10 @@ class timed_pass:
         stack = timed_pass.stack[tid]
         stack.append(frame)
 
+        metrics = timed_pass.metrics.get(tid)
+        if metrics is not None:
+            size_in = self._ir_size(args)
+
         tic = time()
         retval = self.func(*args, **kwargs)
         toc = time()
@@ -83,10 +102,39 @@ class timed_pass:
         else:
             timings['total'] = toc - tic
 
+        if metrics is not None:
+            self._update_metrics(metrics.setdefault(tuple(stack), {}), toc - tic,
+                                 size_in, self._ir_size((retval,)))
+
         stack.pop()
 
         return retval
 
+    def _ir_size(self, objs):
+        # IET passes are applied through `Graph.apply`, which updates the
+        # Graph in place, so it's the Graph to be measured
+        graph = getattr(self.func, '__self__', None)
+        if hasattr(graph, 'efuncs'):
+            return ir_size(graph)
+        for i in objs:
+            v = ir_size(i)
+            if v is not None:
+                return v
+        return None
+
+    def _update_metrics(self, metrics, elapsed, size_in, size_out):
+        metrics['ncalls'] = metrics.get('ncalls', 0) + 1
+        metrics['time'] = metrics.get('time', 0.) + elapsed
+
+        # With multiple calls (e.g., a pass applied to one Cluster at a time),
+        # the sizes are accumulated
+        for k, v in [('size-in', size_in), ('size-out', size_out)]:
+            if v is not None:
+                metrics[k] = metrics.get(k, 0) + v
+
+        metrics['sympy-cache'] = sympy_cache_size()
+        metrics['maxrss'] = maxrss()
+
     def __repr__(self):
         """Return the function's docstring."""
         return self.func.__doc__
@@ -102,20 +150,24 @@ class timed_region:
     A context manager for code regions in which the `timed_pass` decorator is used.
     """
 
-    def __init__(self, name):
+    def __init__(self, name, metrics=False):
         self.name = name
+        self.metrics = OrderedDict() if metrics else None
 
     def __enter__(self):
         if isinstance(timed_pass.timings.get(get_ident()), dict):
             raise ValueError("Cannot nest `timed_region`")
         self.timings = OrderedDict()
         timed_pass.timings[get_ident()] = self.timings
+        if self.metrics is not None:
+            timed_pass.metrics[get_ident()] = self.metrics
         self.tic = time()
         return self
 
     def __exit__(self, *args):
         self.timings[self.name] = time() - self.tic
         del timed_pass.timings[get_ident()]
+        timed_pass.metrics.pop(get_ident(), None)
         try:
             # Necessary clean up should one be constructing an Operator within
             # a try-except, with the Operator construction failing
@@ -123,3 +175,57 @@ class timed_region:
         except KeyError:
             # Typically we end up here
             pass
+
+
+def ir_size(obj):
+    """
+    The size of an intermediate representation, that is:
+
+        * the number of nodes, for an IET or a call graph;
+        * the number of items, for a sequence of Clusters or expressions;
+        * the largest of the above, for a sequence of mixed objects.
+
+    Return None if `obj` isn't a recognized intermediate representation.
+    """
+    if isinstance(obj, type):
+        return None
+    elif hasattr(obj, 'efuncs'):
+        return sum(_iet_size(i) for i in obj.efuncs.values())
+    elif hasattr(obj, '_traversable'):
+        return _iet_size(obj)
+    elif isinstance(obj, (list, tuple)) and obj:
+        if all(hasattr(i, 'ispace') or hasattr(i, 'lhs') for i in obj):
+            return len(obj)
+        sizes = [i for i in map(ir_size, obj) if i is not None]
+        return max(sizes, default=None)
+    return None
+
+
+def _iet_size(obj):
+    if isinstance(obj, (list, tuple)):
+        return sum(_iet_size(i) for i in obj)
+    elif hasattr(obj, '_traversable'):
+        return 1 + _iet_size(obj.children)
+    return 0
+
+
+def sympy_cache_size():
+    """The number of entries in the SymPy cache."""
+    from sympy.core.cache import CACHE
+
+    size = 0
+    for i in CACHE:
+        try:
+            size += i.cache_info().currsize
+        except AttributeError:
+            pass
+    return size
+
+
+def maxrss():
+    """The peak resident set size of the process, in bytes, or None if unknown."""
+    if resource is None:
+        return None
+    v = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return v if sys.platform == 'darwin' else v*1024
@@ -1188,6 +1188,14 @@ class AbstractFunction(sympy.Function, Basic, Pickable, Evaluable):
     def dtype(self):
         return self._dtype
 
+    @property
+    def storage_dtype(self):
+        """
+        The data type in which the object is stored in memory. It may be narrower
+        than `dtype`, the data type in which any arithmetic is performed.
+        """
+        return self.dtype
+
     @property
     def ndim(self):
         """The rank of the object."""
@@ -1252,7 +1260,7 @@ class AbstractFunction(sympy.Function, Basic, Pickable, Evaluable):
 
     @property
     def nbytes(self):
-        return self.size*self._dtype().itemsize
+        return self.size*np.dtype(self.storage_dtype).itemsize
 
     @property
     def halo(self):
@@ -1525,7 +1533,7 @@ class IndexedBase(sympy.IndexedBase, Basic, Pickable):
     @cached_property
     def _C_ctype(self):
         try:
-            return POINTER(dtype_to_ctype(self.dtype))
+            return POINTER(dtype_to_ctype(self.storage_dtype))
         except TypeError:
             # `dtype` is a ctypes-derived type!
             return self.dtype
@@ -1542,6 +1550,13 @@ class IndexedBase(sympy.IndexedBase, Basic, Pickable):
     def dtype(self):
         return self.function.dtype
 
+    @property
+    def storage_dtype(self):
+        try:
+            return self.function.storage_dtype
+        except AttributeError:
+            return self.dtype
+
     @cached_property
     def free_symbols(self):
         ret = {self}
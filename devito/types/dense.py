@@ -10,8 +10,10 @@ from functools import cached_property
 
 from devito.builtins import assign
 from devito.data import (DOMAIN, OWNED, HALO, NOPAD, FULL, LEFT, CENTER, RIGHT,
-                         Data, default_allocator)
+                         Data, default_allocator, mpi_view)
 from devito.data.allocators import DataReference
+from devito.data.engine import parallel_copy, parallel_fill
+from devito.data.dlpack import is_dlpack
 from devito.deprecations import deprecations
 from devito.exceptions import InvalidArgument
 from devito.logger import debug, warning
@@ -21,7 +23,8 @@ from devito.symbolics import FieldFromPointer, normalize_args
 from devito.finite_differences import Differentiable, generate_fd_shortcuts
 from devito.finite_differences.tools import fd_weights_registry
 from devito.tools import (ReducerMap, as_tuple, c_restrict_void_p, flatten,
-                          is_integer, memoized_meth, dtype_to_ctype, humanbytes)
+                          is_integer, memoized_meth, dtype_to_ctype, humanbytes,
+                          storage_dtypes)
 from devito.types.dimension import Dimension
 from devito.types.args import ArgProvider
 from devito.types.caching import CacheManager
@@ -63,12 +66,16 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
     The type of the underlying data object.
     """
 
-    __rkwargs__ = AbstractFunction.__rkwargs__ + ('staggered', 'coefficients')
+    __rkwargs__ = AbstractFunction.__rkwargs__ + ('staggered', 'coefficients',
+                                                  'storage_dtype')
 
     def __init_finalize__(self, *args, function=None, **kwargs):
         # Staggering metadata
         self._staggered = self.__staggered_setup__(**kwargs)
 
+        # The in-memory data type, possibly narrower than the compute one
+        self._storage_dtype = self.__storage_dtype_setup__(**kwargs)
+
         # Now that *all* __X_setup__ hooks have been called, we can let the
         # superclass constructor do its job
         super().__init_finalize__(*args, **kwargs)
@@ -79,7 +86,11 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
         # Data-related properties
         self._data = None
         self._first_touch = kwargs.get('first_touch', configuration['first-touch'])
-        self._allocator = kwargs.get('allocator') or default_allocator()
+        allocator = kwargs.get('allocator')
+        if isinstance(allocator, np.ndarray) or is_dlpack(allocator):
+            # Zero-copy import of external data, e.g. a PyTorch tensor
+            allocator = DataReference(allocator)
+        self._allocator = allocator or default_allocator()
 
         # Data initialization
         initializer = kwargs.get('initializer')
@@ -103,7 +114,11 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
             # a reference to the user-provided buffer
             self._initializer = None
             if len(initializer) > 0:
-                self.data_with_halo[:] = initializer[:]
+                data = self.data_with_halo
+                if data._is_mpi_distributed:
+                    data[:] = initializer[:]
+                else:
+                    parallel_copy(data, initializer, axis=self._touch_axis)
             else:
                 # This is a corner case -- we might get here, for example, when
                 # running with MPI and some processes get 0-size arrays after
@@ -132,7 +147,7 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
                 CacheManager.clear(force=False)
 
                 # Allocate the actual data object
-                self._data = self._DataType(self.shape_allocated, self.dtype,
+                self._data = self._DataType(self.shape_allocated, self.storage_dtype,
                                             modulo=self._mask_modulo,
                                             allocator=self._allocator,
                                             distributor=self._distributor,
@@ -150,8 +165,10 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
                     except ValueError:
                         # Perhaps user only wants to initialise the physical domain
                         self._initializer(self.data)
-                else:
-                    self.data_with_halo.fill(0)
+                elif self._allocator.zero_init:
+                    # Zero-fill with the same threads, splitting the data in
+                    # the same way, as the Operators
+                    parallel_fill(self._data, 0, axis=self._touch_axis)
 
             return func(self)
         return wrapper
@@ -167,6 +184,26 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
         else:
             return np.float32
 
+    def __storage_dtype_setup__(self, **kwargs):
+        storage_dtype = kwargs.get('storage_dtype')
+        if storage_dtype is None or storage_dtype == self.dtype:
+            return self.dtype
+        storage_dtype = np.dtype(storage_dtype).type
+
+        if storage_dtype not in storage_dtypes:
+            raise ValueError("Unsupported `storage_dtype=%s`; accepted values are "
+                             "%s" % (storage_dtype, list(storage_dtypes)))
+        if not np.issubdtype(self.dtype, np.floating) or \
+           np.dtype(storage_dtype).itemsize >= np.dtype(self.dtype).itemsize:
+            raise ValueError("`storage_dtype=%s` must be narrower than the "
+                             "floating point `dtype=%s`" % (storage_dtype, self.dtype))
+
+        return storage_dtype
+
+    @property
+    def storage_dtype(self):
+        return self._storage_dtype
+
     def __coefficients_setup__(self, **kwargs):
         """
         Setup finite-differences coefficients mode
@@ -386,6 +423,17 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
         """Boolean mask telling which Dimensions support modulo-indexing."""
         return tuple(True if i.is_Stepping else False for i in self.dimensions)
 
+    @cached_property
+    def _touch_axis(self):
+        """
+        The axis along which the data is split across threads when initialized,
+        that is the outermost non-time axis, as in the loops of the Operators.
+        """
+        for i, d in enumerate(self.dimensions):
+            if not d.is_Time:
+                return i
+        return 0
+
     @cached_property
     def _mask_domain(self):
         """Slice-based mask to access the domain region of the allocated data."""
@@ -462,9 +510,179 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
 
         Note that gathering data from large simulations onto a single rank may
         result in memory blow-up and hence should use this method judiciously.
+        See `data_write` and `data_slabs` for memory-bounded alternatives.
         """
         return self.data._gather(start=start, stop=stop, step=step, rank=rank)
 
+    def data_gather_points(self, indices, rank=None):
+        """
+        Retrieve a set of points of the domain data, collectively across all
+        MPI ranks, with a single communication.
+
+        Plain NumPy-style indexing, e.g. ``f.data[xs, ys]``, also returns all
+        points on all ranks; this also allows gathering them onto a single rank.
+        All ranks must call it with the same points.
+
+        Parameters
+        ----------
+        indices : tuple of array-like
+            The global indices of the points, one array per dimension.
+        rank : int, optional
+            The rank onto which the points are gathered. Defaults to all ranks;
+            the other ranks get None.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from devito import Grid, Function
+        >>> grid = Grid(shape=(4, 4))
+        >>> f = Function(name='f', grid=grid)
+        >>> f.data[3, 2] = 2.
+        >>> f.data_gather_points((np.array([0, 3]), np.array([1, 2])))
+        array([0., 2.], dtype=float32)
+        """
+        data = self.data
+        if data._is_mpi_distributed:
+            return data._gather_points(indices, rank=rank)
+        else:
+            return np.array(data[tuple(indices)])
+
+    def data_scatter(self, indices, values):
+        """
+        Set a set of points of the domain data, collectively across all MPI
+        ranks, each rank providing its own, possibly different, points.
+
+        The values are routed to the ranks owning the points with a single
+        all-to-all communication, and then written in bulk. Conversely, if
+        all ranks provide the same points, plain NumPy-style indexing, e.g.
+        ``f.data[xs, ys] = values``, should be preferred, as it requires no
+        communication at all.
+
+        Parameters
+        ----------
+        indices : tuple of array-like
+            The global indices of the points, one array per dimension.
+        values : array-like
+            The values of the points. If multiple ranks set the same point,
+            the retained value is unspecified.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from devito import Grid, Function
+        >>> grid = Grid(shape=(4, 4))
+        >>> f = Function(name='f', grid=grid)
+        >>> f.data_scatter((np.array([0, 3]), np.array([1, 2])), [1., 2.])
+        >>> f.data[3, 2]
+        2.0
+        """
+        data = self.data
+        if data._is_mpi_distributed:
+            data._scatter_points(indices, values)
+        else:
+            data[tuple(indices)] = values
+
+    def data_write(self, path, layout='single', chunksize=None):
+        """
+        Write the domain data to file, collectively across all MPI ranks.
+
+        Unlike `data_gather`, the data is never funneled through a single rank.
+        Each rank writes its own portion of the domain, in chunks of bounded
+        size, so both memory consumption and bandwidth scale with the number
+        of ranks.
+
+        Parameters
+        ----------
+        path : str
+            The output file.
+        layout : str, optional
+            Accepted values:
+
+                * 'single': a single file, in the NumPy `.npy` format, written
+                  in parallel via MPI-IO. It can be loaded with `numpy.load`.
+                * 'ranks': one `.npy` file per rank, named `<path>.<rank>.npy`,
+                  plus an index, at `path`, describing the portion of the
+                  domain stored in each file. This avoids any file-system
+                  contention.
+
+            Defaults to 'single'.
+        chunksize : int, optional
+            The maximum size, in bytes, of the chunks written by each rank, that
+            is the temporary memory required by the call. A chunk comprises at
+            least one slab along the first dimension. Defaults to 64 MB.
+
+        Examples
+        --------
+        >>> import os
+        >>> import numpy as np
+        >>> from tempfile import mkdtemp
+        >>> from devito import Grid, Function
+        >>> grid = Grid(shape=(4, 4))
+        >>> f = Function(name='f', grid=grid)
+        >>> f.data[:] = np.arange(16).reshape(4, 4)
+        >>> path = os.path.join(mkdtemp(), 'f.npy')
+        >>> f.data_write(path)
+        >>> np.load(path)[1]
+        array([4., 5., 6., 7.], dtype=float32)
+        """
+        self.data._write(path, layout=layout, chunksize=chunksize)
+
+    def data_read(self, path, chunksize=None):
+        """
+        Read the domain data from file, as written by `data_write`, collectively
+        across all MPI ranks.
+
+        Each rank only reads its own portion of the domain. The file may have
+        been written with a different number of ranks.
+
+        Parameters
+        ----------
+        path : str
+            The input file; either a `.npy` file, or the index of a set of
+            per-rank files.
+        chunksize : int, optional
+            The maximum size, in bytes, of the chunks read at once. Defaults
+            to 64 MB.
+        """
+        self.data._read(path, chunksize=chunksize)
+
+    def data_slabs(self, size=1, rank=0):
+        """
+        Gather the distributed domain data onto a single rank, one slab along
+        the first dimension at a time.
+
+        This is a generator, to be consumed by all MPI ranks. Only a slab at a
+        time is ever held by `rank`, so that, e.g., a large 3D field may be
+        streamed to a sequential writer in bounded memory.
+
+        Parameters
+        ----------
+        size : int, optional
+            The number of points along the first dimension in each slab.
+            Defaults to 1.
+        rank : int, optional
+            The rank onto which the slabs are gathered. Defaults to 0.
+
+        Yields
+        ------
+        slice, numpy.ndarray
+            The global indices of the slab along the first dimension, and the
+            slab itself on `rank`, or None on any other rank.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from devito import Grid, Function
+        >>> grid = Grid(shape=(4, 4))
+        >>> f = Function(name='f', grid=grid)
+        >>> f.data[:] = np.arange(16).reshape(4, 4)
+        >>> for idx, slab in f.data_slabs(size=3):
+        ...     print(idx, slab.shape)
+        slice(0, 3, None) (3, 4)
+        slice(3, 4, None) (1, 4)
+        """
+        yield from self.data._slabs(size=size, rank=rank)
+
     @property
     @_allocate_memory
     def data_domain(self):
@@ -716,9 +934,9 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
     def _C_as_ndarray(self, dataobj):
         """Cast the data carried by a DiscreteFunction dataobj to an ndarray."""
         shape = tuple(dataobj._obj.size[i] for i in range(self.ndim))
-        ctype_1d = dtype_to_ctype(self.dtype) * int(reduce(mul, shape))
+        ctype_1d = dtype_to_ctype(self.storage_dtype) * int(reduce(mul, shape))
         buf = cast(dataobj._obj.data, POINTER(ctype_1d)).contents
-        return np.frombuffer(buf, dtype=self.dtype).reshape(shape)
+        return np.frombuffer(buf, dtype=self.storage_dtype).reshape(shape)
 
     @memoized_meth
     def _C_make_index(self, dim, side=None):
@@ -795,10 +1013,11 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
 
                 # Setup recv buffer
                 shape = self._data_in_region(HALO, d, i.flip()).shape
-                recvbuf = np.ndarray(shape=shape, dtype=self.dtype)
+                recvbuf = np.ndarray(shape=shape, dtype=self.storage_dtype)
 
                 # Communication
-                comm.Sendrecv(sendbuf, dest=dest, recvbuf=recvbuf, source=source)
+                comm.Sendrecv(mpi_view(sendbuf), dest=dest,
+                              recvbuf=mpi_view(recvbuf), source=source)
 
                 # Scatter received data
                 if recvbuf is not None and source != MPI.PROC_NULL:
@@ -844,6 +1063,7 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
         if self.name in kwargs:
             new = kwargs.pop(self.name)
             if isinstance(new, DiscreteFunction):
+                self._arg_check_alignment(new)
                 # Set new values and re-derive defaults
                 values = new._arg_defaults(alias=self, metadata=metadata)
                 values = values.reduce_all()
@@ -860,6 +1080,24 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
 
         return values
 
+    def _arg_check_alignment(self, new):
+        """
+        Check that the data of `new`, which replaces `self` at runtime, is at
+        least as aligned as the generated code assumes (e.g., through
+        `__attribute__((aligned(N)))`), which would be undefined behaviour
+        otherwise.
+
+        Raises
+        ------
+        InvalidArgument
+            If `new` is less aligned than `self`.
+        """
+        if self._data_alignment and new._data_alignment < self._data_alignment:
+            raise InvalidArgument("`%s` must be aligned to %d bytes, as assumed by "
+                                  "the generated code, but it's only aligned to "
+                                  "%d bytes" % (new.name, self._data_alignment,
+                                                new._data_alignment))
+
     def _arg_check(self, args, intervals, **kwargs):
         """
         Check that `args` contains legal runtime values bound to `self`.
@@ -878,9 +1116,10 @@ class DiscreteFunction(AbstractFunction, ArgProvider, Differentiable):
             raise InvalidArgument("Shape %s of runtime value `%s` does not match "
                                   "dimensions %s" %
                                   (data.shape, self.name, self.dimensions))
-        if data.dtype != self.dtype:
+        if data.dtype != self.storage_dtype:
             warning("Data type %s of runtime value `%s` does not match the "
-                    "Function data type %s" % (data.dtype, self.name, self.dtype))
+                    "Function data type %s" % (data.dtype, self.name,
+                                               self.storage_dtype))
 
         # Check each Dimension for potential OOB accesses
         for i, s in zip(self.dimensions, data.shape):
@@ -950,6 +1189,13 @@ class Function(DiscreteFunction):
         given.
     dtype : data-type, optional, default=np.float32
         Any object that can be interpreted as a numpy data type.
+    storage_dtype : data-type, optional
+        The data type in which the data is stored in memory, if narrower than
+        `dtype`, in which case the data is converted to `dtype` upon loading
+        and back to `storage_dtype` upon storing. This halves the memory
+        footprint and traffic at the price of accuracy. Accepted values are
+        `np.float16` and, if the `ml_dtypes` package is installed, `bfloat16`.
+        Defaults to `dtype`.
     staggered : Dimension or tuple of Dimension or Stagger, optional, default=None
         Define how the Function is staggered.
     initializer : callable or any object exposing the buffer interface, default=None
@@ -957,7 +1203,10 @@ class Function(DiscreteFunction):
     allocator : MemoryAllocator, optional
         Controller for memory allocation. To be used, for example, when one wants
         to take advantage of the memory hierarchy in a NUMA architecture. Refer to
-        `default_allocator.__doc__` for more information.
+        `default_allocator.__doc__` for more information. A NumPy array, an object
+        implementing the DLPack protocol or a DLPack capsule is also accepted, in
+        which case its memory is used without copies; refer to
+        `DataReference.__doc__`.
     padding : int or tuple of ints, optional
         Allocate extra grid points to maximize data access alignment. When a tuple
         of ints, one int per Dimension should be provided.
@@ -1282,6 +1531,9 @@ class TimeFunction(Function):
         given.
     dtype : data-type, optional, default=np.float32
         Any object that can be interpreted as a numpy data type.
+    storage_dtype : data-type, optional
+        The data type in which the data is stored in memory, if narrower than
+        `dtype`. See `Function.__doc__` for more information.
     save : int or Buffer, optional, default=None
         By default, `save=None`, which indicates the use of alternating
         buffers. This enables cyclic writes to the TimeFunction. For example,
@@ -1303,7 +1555,10 @@ class TimeFunction(Function):
     allocator : MemoryAllocator, optional
         Controller for memory allocation. To be used, for example, when one wants
         to take advantage of the memory hierarchy in a NUMA architecture. Refer to
-        `default_allocator.__doc__` for more information.
+        `default_allocator.__doc__` for more information. A NumPy array, an object
+        implementing the DLPack protocol or a DLPack capsule is also accepted, in
+        which case its memory is used without copies; refer to
+        `DataReference.__doc__`.
     padding : int or tuple of ints, optional
         Allocate extra grid points to maximize data access alignment. When a tuple
         of ints, one int per Dimension should be provided.
@@ -1372,7 +1627,7 @@ class TimeFunction(Function):
 
         # Check we won't allocate too much memory for the system
         available_mem = virtual_memory().available
-        required_mem = np.dtype(self.dtype).itemsize * self.size
+        required_mem = self.nbytes
         if required_mem > available_mem:
             raise MemoryError(
                 f"Trying to allocate more memory ({humanbytes(required_mem)}) "
@@ -87,6 +87,24 @@ class Grid(CartesianDiscretization, ArgProvider):
     comm : MPI communicator, optional
         The set of processes over which the grid is distributed. Only relevant in
         case of MPI execution.
+    topology : tuple or str, optional
+        The number of processes along each dimension, possibly including the
+        wildcard '*', or 'optimal' to minimize the estimated volume of halo
+        exchanges. Only relevant in case of MPI execution. Defaults to
+        `configuration['topology']`.
+    decomposition : tuple, optional
+        The size of the MPI subdomains along each dimension, either None, for
+        an even split, or a sequence of sizes adding up to the dimension size.
+        Only relevant in case of MPI execution.
+    cost : numpy.ndarray or tuple, optional
+        The computational cost of each grid point, as an array of shape `shape`
+        or as a tuple of per-dimension cost profiles, from which an MPI domain
+        decomposition balancing the work is derived. Only relevant in case of
+        MPI execution.
+    space_order : int, optional
+        The space order of the stencils computed over the grid, which
+        determines the thickness of the halo exchanged across MPI ranks. Only
+        used to compute an 'optimal' topology, in which case it defaults to 8.
 
     Examples
     --------
@@ -138,7 +156,8 @@ class Grid(CartesianDiscretization, ArgProvider):
 
     def __init__(self, shape, extent=None, origin=None, dimensions=None,
                  time_dimension=None, dtype=np.float32, subdomains=None,
-                 comm=None, topology=None):
+                 comm=None, topology=None, decomposition=None, cost=None,
+                 space_order=None):
         shape = as_tuple(shape)
 
         # Create or pull the SpaceDimensions
@@ -166,7 +185,9 @@ class Grid(CartesianDiscretization, ArgProvider):
         # by all Functions defined on this Grid
         topology = topology or configuration['topology']
         if topology:
-            if len(topology) == len(self.shape):
+            if topology == 'optimal':
+                self._topology = topology
+            elif len(topology) == len(self.shape):
                 self._topology = topology
             else:
                 warning("Ignoring the provided topology `%s` as it "
@@ -175,7 +196,9 @@ class Grid(CartesianDiscretization, ArgProvider):
                 self._topology = None
         else:
             self._topology = None
-        self._distributor = Distributor(shape, dimensions, comm, self._topology)
+        self._distributor = Distributor(shape, dimensions, comm, self._topology,
+                                        decomposition=decomposition, cost=cost,
+                                        space_order=space_order)
 
         # The physical extent
         self._extent = as_tuple(extent or tuple(1. for _ in self.shape))
@@ -63,6 +63,12 @@ class AbstractSparseFunction(DiscreteFunction):
         # Dynamically add derivative short-cuts
         self._fd = self.__fd_setup__()
 
+    def __storage_dtype_setup__(self, **kwargs):
+        if kwargs.get('storage_dtype') not in (None, self.dtype):
+            raise ValueError("`storage_dtype` is unsupported by `%s`"
+                             % self.__class__.__name__)
+        return self.dtype
+
     @classmethod
     def __indices_setup__(cls, *args, **kwargs):
         # Need this not to break MatrixSparseFunction
@@ -665,6 +671,7 @@ class AbstractSparseFunction(DiscreteFunction):
         if self.name in kwargs:
             new = kwargs.pop(self.name)
             if isinstance(new, AbstractSparseFunction):
+                self._arg_check_alignment(new)
                 # Set new values and re-derive defaults
                 values = new._arg_defaults(alias=self).reduce_all()
             else:
@@ -1,4 +1,5 @@
-from devito import Function, TimeFunction, DevitoCheckpoint, CheckpointOperator, Revolver
+from devito import Function, TimeFunction
+from devito.checkpointing import Checkpointer
 from devito.tools import memoized_meth
 from examples.seismic.acoustic.operators import (
     ForwardOperator, AdjointOperator, GradientOperator, BornOperator
@@ -196,18 +197,15 @@ class AcousticWaveSolver:
         if checkpointing:
             u = TimeFunction(name='u', grid=self.model.grid,
                              time_order=2, space_order=self.space_order)
-            cp = DevitoCheckpoint([u])
-            n_checkpoints = None
-            wrap_fw = CheckpointOperator(self.op_fwd(save=False),
-                                         src=src or self.geometry.src,
-                                         u=u, dt=dt, **kwargs)
-            wrap_rev = CheckpointOperator(self.op_grad(save=False), u=u, v=v,
-                                          rec=rec, dt=dt, grad=grad, **kwargs)
+            cp = Checkpointer(self.op_fwd(save=False), self.op_grad(save=False),
+                              fwd_args={'src': src or self.geometry.src},
+                              adj_args={'v': v, 'rec': rec, 'grad': grad},
+                              u=u, dt=dt, **kwargs)
 
             # Run forward
-            wrp = Revolver(cp, wrap_fw, wrap_rev, n_checkpoints, rec.data.shape[0]-2)
-            wrp.apply_forward()
-            summary = wrp.apply_reverse()
+            cp.apply_forward()
+            summary = cp.apply_reverse()
+            cp.close()
         else:
             summary = self.op_grad().apply(rec=rec, grad=grad, v=v, u=u, dt=dt,
                                            **kwargs)
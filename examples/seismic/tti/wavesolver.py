@@ -1,6 +1,6 @@
 # coding: utf-8
-from devito import (Function, TimeFunction, warning, NODE,
-                    DevitoCheckpoint, CheckpointOperator, Revolver)
+from devito import Function, TimeFunction, warning, NODE
+from devito.checkpointing import Checkpointer
 from devito.tools import memoized_meth
 from examples.seismic.tti.operators import ForwardOperator, AdjointOperator
 from examples.seismic.tti.operators import JacobianOperator, JacobianAdjOperator
@@ -354,17 +354,17 @@ class AnisotropicWaveSolver:
                               time_order=2, space_order=self.space_order)
             v0 = TimeFunction(name='v0', grid=self.model.grid,
                               time_order=2, space_order=self.space_order)
-            cp = DevitoCheckpoint([u0, v0])
-            n_checkpoints = None
-            wrap_fw = CheckpointOperator(self.op_fwd(save=False), src=self.geometry.src,
-                                         u=u0, v=v0, dt=dt, **kwargs)
-            wrap_rev = CheckpointOperator(self.op_jacadj(save=False), u0=u0, v0=v0,
-                                          du=du, dv=dv, rec=rec, dm=dm, dt=dt, **kwargs)
+            cp = Checkpointer(self.op_fwd(save=False), self.op_jacadj(save=False),
+                              functions=[u0, v0],
+                              fwd_args={'src': self.geometry.src, 'u': u0, 'v': v0},
+                              adj_args={'u0': u0, 'v0': v0, 'du': du, 'dv': dv,
+                                        'rec': rec, 'dm': dm},
+                              dt=dt, **kwargs)
 
             # Run forward
-            wrp = Revolver(cp, wrap_fw, wrap_rev, n_checkpoints, rec.data.shape[0]-2)
-            wrp.apply_forward()
-            summary = wrp.apply_reverse()
+            cp.apply_forward()
+            summary = cp.apply_reverse()
+            cp.close()
         else:
             summary = self.op_jacadj().apply(rec=rec, dm=dm, u0=u0, v0=v0, du=du, dv=dv,
                                              dt=dt, **kwargs)
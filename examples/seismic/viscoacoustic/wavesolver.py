@@ -1,5 +1,5 @@
-from devito import (VectorTimeFunction, TimeFunction, Function, NODE,
-                    DevitoCheckpoint, CheckpointOperator, Revolver)
+from devito import VectorTimeFunction, TimeFunction, Function, NODE
+from devito.checkpointing import Checkpointer
 from devito.tools import memoized_meth
 from examples.seismic.viscoacoustic.operators import (
     ForwardOperator, AdjointOperator, GradientOperator, BornOperator
@@ -260,11 +260,12 @@ class ViscoacousticWaveSolver:
         kwargs.update(model.physical_params(**kwargs))
 
         if checkpointing:
+            fwd_args = {'src': self.geometry.src}
             if self.time_order == 1:
                 v = VectorTimeFunction(name="v", grid=self.model.grid,
                                        time_order=self.time_order,
                                        space_order=self.space_order)
-                kwargs.update({k.name: k for k in v})
+                fwd_args.update({k.name: k for k in v})
 
             p = TimeFunction(name='p', grid=self.model.grid,
                              time_order=self.time_order, space_order=self.space_order,
@@ -272,33 +273,27 @@ class ViscoacousticWaveSolver:
 
             r = TimeFunction(name="r", grid=self.model.grid, time_order=self.time_order,
                              space_order=self.space_order, staggered=NODE)
-
-            l = [p, r] + v.values() if self.time_order == 1 else [p, r]
-            cp = DevitoCheckpoint(l)
-            n_checkpoints = None
-            wrap_fw = CheckpointOperator(self.op_fwd(save=False),
-                                         src=self.geometry.src, p=p, r=r, dt=dt, **kwargs)
+            fwd_args.update({'p': p, 'r': r})
 
             ra = TimeFunction(name="ra", grid=self.model.grid, time_order=self.time_order,
                               space_order=self.space_order, staggered=NODE)
+            adj_args = {'p': p, 'pa': pa, 'r': ra, 'rec': rec, 'grad': grad}
 
             if self.time_order == 1:
-                for i in {k.name: k for k in v}.keys():
-                    kwargs.pop(i)
                 va = VectorTimeFunction(name="va", grid=self.model.grid,
                                         time_order=self.time_order,
                                         space_order=self.space_order)
-                kwargs.update({k.name: k for k in va})
-                kwargs['time_m'] = 0
+                adj_args.update({k.name: k for k in va})
 
-            wrap_rev = CheckpointOperator(self.op_grad(save=False), p=p, pa=pa, r=ra,
-                                          rec=rec, dt=dt, grad=grad, **kwargs)
+            l = [p, r] + v.values() if self.time_order == 1 else [p, r]
+            cp = Checkpointer(self.op_fwd(save=False), self.op_grad(save=False),
+                              functions=l, fwd_args=fwd_args, adj_args=adj_args,
+                              dt=dt, **kwargs)
 
             # Run forward
-            wrp = Revolver(cp, wrap_fw, wrap_rev, n_checkpoints,
-                           rec.data.shape[0] - (1 if self.time_order == 1 else 2))
-            wrp.apply_forward()
-            summary = wrp.apply_reverse()
+            cp.apply_forward()
+            summary = cp.apply_reverse()
+            cp.close()
         else:
             if self.time_order == 1:
                 va = va or VectorTimeFunction(name="va", grid=self.model.grid,
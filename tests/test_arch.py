@@ -1,3 +1,6 @@
+from subprocess import check_call
+import sys
+
 import pytest
 
 from devito import switchconfig, configuration
@@ -29,3 +32,44 @@ def test_switcharch():
     assert isinstance(tmp_comp, old_compiler.__class__)
     assert old_compiler.suffix == tmp_comp.suffix
     assert old_compiler.name == tmp_comp.name
+
+
+def test_lazy_parameter():
+    from devito.parameters import Parameters
+
+    calls = []
+
+    def callback(val):
+        calls.append(val)
+        return val*2
+
+    params = Parameters('test')
+    params.add('eager', 1, callback=callback)
+    params.add('lazy', 2, callback=callback, lazy=True)
+    params.initialize()
+
+    assert calls == [1]
+    assert params.is_pending('lazy')
+
+    assert params['lazy'] == 4
+    assert params['lazy'] == 4
+    assert calls == [1, 2]
+    assert not params.is_pending('lazy')
+
+
+def test_lazy_import():
+    # Importing Devito must neither sniff the hardware, nor run the compiler,
+    # nor import SciPy
+    code = ("import subprocess, sys; "
+            "subprocess.Popen = None; "
+            "import devito; "
+            "assert devito.configuration.is_pending('compiler'); "
+            "assert 'cpuinfo' not in sys.modules; "
+            "assert 'scipy' not in sys.modules")
+    check_call([sys.executable, '-c', code])
+
+    # The compiler is built upon first access
+    code = ("import devito; "
+            "assert devito.configuration['compiler'].cc; "
+            "assert not devito.configuration.is_pending('compiler')")
+    check_call([sys.executable, '-c', code])
@@ -1,3 +1,6 @@
+import os
+import shutil
+
 import pytest
 import numpy as np
 
@@ -345,3 +348,120 @@ def test_few_timesteps():
     op.apply(autotune=True)
     assert op._state['autotuning'][0]['runs'] == 2
     assert op._state['autotuning'][0]['tpr'] == 2  # Induced by `save`
+
+
+@switchconfig(develop_mode=True)
+def test_autotuning_db(tmpdir):
+    grid = Grid(shape=(30, 30, 30))
+    f = TimeFunction(name='f', grid=grid)
+    eqn = Eq(f.forward, f.dx + 1)
+
+    with switchconfig(autotuning_db=str(tmpdir)):
+        op = Operator(eqn, opt=('blocking', {'openmp': False}))
+        op.apply(time_M=0, autotune='basic')
+        assert op._state['autotuning'][-1]['runs'] == 4
+        tuned = op._state['autotuning'][-1]['tuned']
+        assert len(tmpdir.listdir()) == 1
+
+        # The very same Operator, as if built by another process, skips the
+        # exploration altogether
+        op = Operator(eqn, opt=('blocking', {'openmp': False}))
+        op.apply(time_M=0, autotune='basic')
+        assert op._state['autotuning'][-1]['runs'] == 0
+        assert op._state['autotuning'][-1]['tuned'] == tuned
+
+        # A more aggressive autotuning explores again, and the outcome is
+        # then reused also at the lower levels
+        op.apply(time_M=0, autotune='aggressive')
+        assert op._state['autotuning'][-1]['runs'] > 4
+        op.apply(time_M=0, autotune='aggressive')
+        op.apply(time_M=0, autotune='basic')
+        assert op._state['autotuning'][-2]['runs'] == 0
+        assert op._state['autotuning'][-1]['runs'] == 0
+        assert len(tmpdir.listdir()) == 1
+
+        # A different problem size requires a new exploration
+        grid = Grid(shape=(32, 32, 32))
+        g = TimeFunction(name='f', grid=grid)
+        op.apply(time_M=0, f=g, autotune='basic')
+        assert op._state['autotuning'][-1]['runs'] > 0
+        assert len(tmpdir.listdir()) == 2
+
+    # Disabled by default
+    op.apply(time_M=0, autotune='basic')
+    assert op._state['autotuning'][-1]['runs'] == 4
+
+
+@pytest.mark.parallel(mode=2)
+def test_autotuning_db_mpi(tmpdir, mode):
+    """
+    With MPI, the autotuning database is looked up collectively, so that in
+    runtime mode the ranks, whose local extents differ, either all skip the
+    exploration or all perform it, thus never deadlocking in the halo exchanges.
+    """
+    grid = Grid(shape=(11, 11))
+    comm = grid.distributor.comm
+    t = grid.stepping_dim
+    x, y = grid.dimensions
+
+    f = TimeFunction(name='f', grid=grid)
+    eq = Eq(f.forward, f[t, x-1, y] + f[t, x+1, y] + 1)
+    op = Operator(eq, opt=('advanced', {'openmp': False, 'blockinner': True}))
+
+    f.data_with_halo[:] = 0.
+    op.apply(time_M=19)
+    expected = np.array(f.data_ro_domain[0])
+
+    path = os.path.join(comm.bcast(str(tmpdir), root=0), 'db')
+    with switchconfig(autotuning_db=path):
+        f.data_with_halo[:] = 0.
+        op.apply(time_M=19, autotune=('basic', 'runtime'))
+        assert op._state['autotuning'][-1]['runs'] > 0
+        assert np.all(f.data_ro_domain[0] == expected)
+
+        # Only rank 0 updates the database
+        comm.barrier()
+        assert len(os.listdir(path)) == 1
+
+        f.data_with_halo[:] = 0.
+        op.apply(time_M=19, autotune=('basic', 'runtime'))
+        assert op._state['autotuning'][-1]['runs'] == 0
+        assert np.all(f.data_ro_domain[0] == expected)
+
+    # Only rank 0 sees the entry, hence all ranks must explore again
+    local = str(tmpdir.join('local'))
+    os.makedirs(local)
+    if comm.rank == 0:
+        for i in os.listdir(path):
+            shutil.copy(os.path.join(path, i), local)
+    with switchconfig(autotuning_db=local):
+        f.data_with_halo[:] = 0.
+        op.apply(time_M=19, autotune=('basic', 'runtime'))
+        assert op._state['autotuning'][-1]['runs'] > 0
+        assert np.all(f.data_ro_domain[0] == expected)
+
+
+@switchconfig(develop_mode=True)
+def test_model_search(monkeypatch):
+    grid = Grid(shape=(64, 64, 64))
+    f = TimeFunction(name='f', grid=grid)
+    op = Operator(Eq(f.forward, f.dx + 1), opt=('blocking', {'openmp': False}))
+
+    op.apply(time_M=0, autotune='aggressive')
+    exhaustive = op._state['autotuning'][-1]['runs']
+
+    # Pretend 32 KB of L2 and 1 MB of L3 per core
+    platform = configuration['platform']
+    monkeypatch.setattr(platform, 'cache_size',
+                        lambda level: {2: 2**15, 3: 2**20}.get(level))
+
+    with switchconfig(autotuning_search='model'):
+        op.apply(time_M=0, autotune='aggressive')
+    summary = op._state['autotuning'][-1]
+    assert summary['runs'] == options['model-trials'] < exhaustive
+    assert summary['gpointss'] > 0
+
+    # Two 4-byte time buffers, i.e. 8 bytes per point, and 64 points along the
+    # unblocked `z`; the selected block shape fits in L3
+    x, y = (summary['tuned'][i] for i in ('x0_blk0_size', 'y0_blk0_size'))
+    assert x*y*64*8 <= 2**20
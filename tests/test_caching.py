@@ -1,4 +1,5 @@
 from ctypes import byref, c_void_p
+import os
 import weakref
 
 import numpy as np
@@ -8,7 +9,8 @@ import pytest
 from devito import (Grid, Function, TimeFunction, SparseFunction, SparseTimeFunction,
                     ConditionalDimension, SubDimension, Constant, Operator, Eq, Dimension,
                     DefaultDimension, _SymbolCache, clear_cache, solve, VectorFunction,
-                    TensorFunction, TensorTimeFunction, VectorTimeFunction)
+                    TensorFunction, TensorTimeFunction, VectorTimeFunction, switchconfig)
+from devito.data.allocators import DataReference
 from devito.types import (DeviceID, NThreadsBase, NPThreads, Object, LocalObject,
                           Scalar, Symbol, ThreadID)
 from devito.types.basic import AbstractSymbol
@@ -856,3 +858,222 @@ class TestMemoryLeaks:
         assert len(_SymbolCache) == 2
         clear_cache()
         assert len(_SymbolCache) == 0
+
+
+@pytest.fixture
+def build_cache(tmp_path):
+    """
+    Enable the Operator build-cache, storing the entries in a fresh directory.
+    """
+    from devito.operator.cache import build_cache
+
+    old_path = build_cache._path
+    build_cache._path = str(tmp_path)
+    build_cache._memory.clear()
+    with switchconfig(build_cache=1):
+        yield build_cache
+    build_cache._path = old_path
+    build_cache._memory.clear()
+
+
+@pytest.fixture
+def lift_literals():
+    """
+    Enable the lifting of literals, with an empty in-memory build-cache.
+    """
+    from devito.operator.cache import build_cache
+
+    build_cache._memory.clear()
+    with switchconfig(lift_literals=1):
+        yield build_cache
+    build_cache._memory.clear()
+
+
+class TestBuildCache:
+
+    @staticmethod
+    def _entries(build_cache):
+        return [i for i in os.listdir(build_cache.path) if i.endswith('.pkl')]
+
+    def test_hit_rebinds_functions(self, build_cache):
+        grid = Grid(shape=(4, 4))
+
+        def build():
+            f = Function(name='f', grid=grid)
+            u = TimeFunction(name='u', grid=grid, space_order=2)
+            f.data[:] = 1.
+            op = Operator(Eq(u.forward, u.dx2 + f))
+            return op, f, u
+
+        op0, _, u0 = build()
+        assert len(self._entries(build_cache)) == 1
+
+        op1, f1, u1 = build()
+        assert len(self._entries(build_cache)) == 1
+        assert str(op0) == str(op1)
+
+        # The restored Operator must be bound to the new Functions
+        assert f1 in op1.parameters
+        assert u1 in op1.parameters
+
+        op0.apply(time_M=2)
+        op1.apply(time_M=2)
+        assert np.all(u1.data == u0.data)
+        assert np.any(u1.data != 0.)
+
+    def test_miss(self, build_cache):
+        grid = Grid(shape=(4, 4))
+
+        u0 = TimeFunction(name='u', grid=grid, space_order=2)
+        u1 = TimeFunction(name='u', grid=grid, space_order=4)
+        u2 = TimeFunction(name='u', grid=grid, space_order=4, dtype=np.float64)
+
+        Operator(Eq(u0.forward, u0.dx2 + 1))
+        Operator(Eq(u1.forward, u1.dx2 + 1))
+        Operator(Eq(u2.forward, u2.dx2 + 1))
+        Operator(Eq(u2.forward, u2.dx2 + 1), opt='noop')
+
+        assert len(self._entries(build_cache)) == 4
+
+    def test_profiling(self, build_cache):
+        grid = Grid(shape=(4, 4))
+
+        u = TimeFunction(name='u', grid=grid)
+        eq = Eq(u.forward, u + 1)
+
+        op0 = Operator(eq)
+        with switchconfig(profiling='advanced'):
+            op1 = Operator(eq)
+
+        assert len(self._entries(build_cache)) == 2
+        assert type(op0._profiler) is not type(op1._profiler)
+        assert type(op1._profiler).__name__ == 'AdvancedProfiler'
+
+    def test_alignment(self, build_cache):
+        grid = Grid(shape=(3, 3))
+        buf = np.zeros(26, dtype=np.float32)
+        # A buffer that is 4-, but not 8-, byte aligned
+        offset = (buf.ctypes.data // 4 + 1) % 2
+        a = buf[offset:offset+25].reshape(5, 5)
+
+        f = Function(name='f', grid=grid, space_order=1)
+        Operator(Eq(f, f + 1))
+
+        # Same name, but less aligned memory than assumed by the cached Operator
+        g = Function(name='f', grid=grid, space_order=1,
+                     allocator=DataReference(a))
+        op = Operator(Eq(g, g + 1))
+
+        assert len(self._entries(build_cache)) == 2
+        assert 'aligned(f' not in str(op)
+
+        op.apply()
+        assert np.all(a[1:-1, 1:-1] == 1)
+
+    def test_constant_value(self, build_cache):
+        grid = Grid(shape=(4, 4))
+
+        def build(v):
+            c = Constant(name='c', value=v)
+            f = Function(name='f', grid=grid)
+            Operator(Eq(f, f + c)).apply()
+            return f
+
+        assert np.all(build(1.).data == 1.)
+        assert np.all(build(2.).data == 2.)
+        assert len(self._entries(build_cache)) == 1
+
+    def test_sparse(self, build_cache):
+        grid = Grid(shape=(5, 5))
+
+        def build():
+            f = Function(name='f', grid=grid)
+            f.data[:] = 2.
+            sf = SparseFunction(name='sf', grid=grid, npoint=2,
+                                coordinates=[(0.3, 0.3), (0.6, 0.6)])
+            Operator(sf.interpolate(f)).apply()
+            return sf
+
+        assert np.allclose(build().data, 2.)
+        assert np.allclose(build().data, 2.)
+        assert len(self._entries(build_cache)) == 1
+
+
+class TestLiftLiterals:
+
+    def test_hit(self, lift_literals):
+        grid = Grid(shape=(4, 4))
+        x, y = grid.dimensions
+
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        c = Constant(name='c')
+
+        def build(a, b, v):
+            u.data[:] = 1.
+            c.data = v
+            op = Operator(Eq(u.forward, a*u + b + c + u.dx(x0=x + 0.5*x.spacing)))
+            op.apply(time_M=0)
+            return op
+
+        op0 = build(0.5, 0.25, 2.)
+        assert np.allclose(u.data[1, :-1], 2.75)
+        assert len(lift_literals._memory) == 1
+
+        op1 = build(0.7, 1.25, 3.)
+        assert np.allclose(u.data[1, :-1], 4.95)
+        assert len(lift_literals._memory) == 1
+        assert str(op0) == str(op1)
+
+        # The literals are runtime arguments
+        assert 'lit0' in [i.name for i in op1.parameters]
+        assert '0.7' not in str(op1)
+
+    def test_derivatives_untouched(self, lift_literals):
+        grid = Grid(shape=(4, 4))
+
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+
+        Operator(Eq(u.forward, (0.5*u).dx))
+        Operator(Eq(u.forward, (0.7*u).dx))
+        assert len(lift_literals._memory) == 2
+
+    def test_name_clash(self, lift_literals):
+        grid = Grid(shape=(4, 4))
+
+        f = Function(name='f', grid=grid)
+        lit0 = Constant(name='lit0', value=1.)
+
+        op = Operator(Eq(f, lit0 + 2.))
+        op.apply()
+        assert np.all(f.data == 3.)
+        assert len([i for i in op.parameters if i.is_Constant]) == 2
+
+    def test_integer_lhs(self, lift_literals):
+        grid = Grid(shape=(4, 4))
+
+        f = Function(name='f', grid=grid, dtype=np.int32)
+        g = Function(name='g', grid=grid)
+        g.data[:] = 10.
+
+        op = Operator(Eq(f, g*0.5))
+        op.apply()
+        assert np.all(f.data == 5)
+
+        lit0, = [i for i in op.parameters if i.name == 'lit0']
+        assert np.issubdtype(lit0.dtype, np.floating)
+
+    def test_exponents_untouched(self, lift_literals):
+        grid = Grid(shape=(4, 4))
+
+        f = Function(name='f', grid=grid)
+        g = Function(name='g', grid=grid)
+        g.data[:] = 4.
+
+        op = Operator(Eq(f, 2.*g**0.5))
+        op.apply()
+        assert np.allclose(f.data, 4.)
+
+        # The square root is still lowered into `sqrt`, while the coefficient
+        # is lifted
+        assert 'sqrt' in str(op)
+        assert 'lit0' in [i.name for i in op.parameters]
@@ -1,11 +1,20 @@
 from functools import reduce
+import os
 
 import pytest
 import numpy as np
 
 from conftest import skipif
 from devito import (Grid, TimeFunction, Operator, Function, Eq, switchconfig, Constant,
-                    Revolver, CheckpointOperator, DevitoCheckpoint)
+                    Revolver, CheckpointOperator, DevitoCheckpoint,
+                    ConditionalDimension, SnapshotStream)
+from devito.exceptions import InvalidArgument
+from devito.checkpointing import (Checkpointer, forward_with_checkpoints, make_codec,
+                                  revolve)
+try:
+    from devito.checkpointing import CompressedStorage
+except ImportError:
+    pass
 from examples.seismic.acoustic.acoustic_example import acoustic_setup
 
 
@@ -244,3 +253,350 @@ def test_index_alignment():
     wrp.apply_reverse()
     assert(np.allclose(v.data[0, :, :], 0))
     assert(np.allclose(prod.data, final_value))
+
+
+@pytest.mark.parametrize('scheme,tolerance,itemsize', [
+    ('float16', None, 2),
+    ('bfloat16', None, 2),
+    ('fixed', None, 2),
+    ('fixed', 1e-2, 1),
+])
+def test_compression_codecs(scheme, tolerance, itemsize):
+    codec = make_codec(scheme, tolerance)
+    assert codec.itemsize == itemsize
+
+    array = np.random.default_rng(0).standard_normal((30, 40)).astype(np.float32)
+    buf = np.empty(codec.nbytes(array.size), dtype=np.uint8)
+    metadata = codec.encode(array, buf)
+
+    out = np.empty_like(array)
+    codec.decode(buf, metadata, out)
+
+    error = np.abs(out - array).max() / np.abs(array).max()
+    assert 0 < error <= codec.error_bound
+    assert codec.error_bound <= (tolerance or 1.)
+
+
+@pytest.mark.parametrize('scheme', ['float16', 'bfloat16', 'fixed'])
+@pytest.mark.parametrize('magnitude', [1e-6, 1e5])
+def test_compression_codecs_magnitude(scheme, magnitude):
+    """
+    The error bound, relative to the largest magnitude, holds for very small
+    and very large values alike.
+    """
+    codec = make_codec(scheme)
+
+    array = np.random.default_rng(0).standard_normal((30, 40)).astype(np.float32)
+    array *= magnitude
+    buf = np.empty(codec.nbytes(array.size), dtype=np.uint8)
+    metadata = codec.encode(array, buf)
+
+    out = np.empty_like(array)
+    codec.decode(buf, metadata, out)
+
+    error = np.abs(out - array).max() / np.abs(array).max()
+    assert error <= codec.error_bound
+
+
+def test_compression_lossless():
+    codec = make_codec('zlib', tolerance=1e-6)
+    assert codec.itemsize == codec.nbytes(100) == 0
+
+    # A smooth, sparse, wavefield
+    array = np.zeros((30, 40), dtype=np.float32)
+    array[10:20, 10:30] = np.random.default_rng(0).standard_normal((10, 20))
+    metadata = codec.encode(array, np.empty(0, dtype=np.uint8))
+    assert len(metadata) < array.nbytes // 4
+
+    out = np.empty_like(array)
+    codec.decode(np.empty(0, dtype=np.uint8), metadata, out)
+    assert np.array_equal(out, array)
+
+
+def test_compression_codecs_invalid():
+    with pytest.raises(ValueError):
+        make_codec('zfp')
+    with pytest.raises(ValueError):
+        make_codec('bfloat16', tolerance=1e-4)
+    with pytest.raises(ValueError):
+        make_codec('fixed', tolerance=1e-6)
+
+    codec = make_codec('float16')
+    array = np.full(10, np.inf, dtype=np.float32)
+    with pytest.raises(ValueError):
+        codec.encode(array, np.empty(codec.nbytes(array.size), dtype=np.uint8))
+
+
+@skipif('chkpnt')
+@pytest.mark.parametrize('scheme,tolerance', [
+    ('float16', None),
+    ('bfloat16', None),
+    ('fixed', None),
+    ('fixed', 1e-2),
+    ('zlib', None),
+])
+def test_compressed_checkpointing(scheme, tolerance):
+    """
+    As in `test_index_alignment`, but with compressed checkpoints, and fewer
+    checkpoints than timesteps so that the forward pass gets recomputed
+    from restored checkpoints.
+    """
+    const = Constant(name="constant")
+    grid = Grid(shape=(4, 4))
+    nt = 20
+
+    u = TimeFunction(name='u', grid=grid)
+    v = TimeFunction(name='v', grid=grid)
+    prod = Function(name="prod", grid=grid)
+    fwd_op = Operator(Eq(u.forward, u + 1.*const))
+    rev_op = Operator([Eq(v, v.forward - 1.*const), Eq(prod, prod + u * v)])
+
+    v.data[nt % 2, :, :] = nt
+
+    cp = DevitoCheckpoint([u])
+    wrap_fw = CheckpointOperator(fwd_op, constant=1)
+    wrap_rev = CheckpointOperator(rev_op, constant=1)
+    wrp = Revolver(cp, wrap_fw, wrap_rev, 4, nt)
+
+    storage = CompressedStorage(cp, wrp.n_checkpoints, scheme, tolerance)
+    assert storage.size_ckp == cp.size*storage.codec.itemsize < cp.nbytes
+    wrp.resetStorageList()
+    wrp.addStorage(storage)
+
+    wrp.apply_forward()
+    assert np.allclose(u.data[nt % 2], nt)
+
+    wrp.apply_reverse()
+    assert np.allclose(v.data[0], 0)
+    assert np.allclose(prod.data, sum(n**2 for n in range(nt)),
+                       rtol=10*storage.codec.error_bound)
+
+
+class TestSnapshotStream:
+
+    def _setup(self, name='u'):
+        grid = Grid(shape=(11, 11))
+        u = TimeFunction(name=name, grid=grid, time_order=2, space_order=2)
+        u.data[:, 5, 5] = 1.
+        eq = Eq(u.forward, 2*u - u.backward + 0.1*u.laplace)
+        return grid, u, eq
+
+    @pytest.mark.parametrize('factor', [1, 3, 4])
+    def test_forward_backward(self, factor, tmpdir):
+        nt = 20
+
+        # Reference: all snapshots in memory
+        grid, u0, eq = self._setup()
+        time = grid.time_dim
+        tsub = ConditionalDimension(name='tsub', parent=time, factor=factor)
+        usave = TimeFunction(name='usave', grid=grid, time_dim=tsub,
+                             save=(nt - 1) // factor + 1)
+        Operator([eq, Eq(usave, u0)])(time_m=1, time_M=nt-1)
+
+        # Streaming
+        _, u1, eq = self._setup(name='v')
+        path = str(tmpdir.join('snapshots'))
+        stream = SnapshotStream(u1, factor, path=path)
+        stream.forward(Operator(eq), time_m=1, time_M=nt-1)
+        assert np.allclose(u1.data, u0.data)
+
+        # The snapshots at the multiples of `factor` within [time_m, time_M + 1]
+        nsnapshots = nt // factor
+        assert stream.nsnapshots == nsnapshots
+        # The snapshots are laid out by timestep, so there's a hole in place of
+        # the one at timestep 0
+        assert os.path.getsize(path) == (nsnapshots + 1)*stream.nbytes
+
+        # Read back; each snapshot is scaled by the timestep it was taken at,
+        # to check they're loaded in the right order
+        usnap = Function(name='usnap', grid=grid)
+        g = Function(name='g', grid=grid)
+        op = Operator(Eq(g, g + time*usnap, implicit_dims=tsub))
+        stream.backward(op, usnap, time_m=1, time_M=nt-1)
+        stream.close()
+
+        expected = sum(i*factor*usave.data[i] for i in range(usave.shape[0]))
+        assert np.allclose(g.data, expected, rtol=1e-5)
+
+    def test_missing_snapshots(self):
+        grid, u, eq = self._setup()
+        usnap = Function(name='usnap', grid=grid)
+
+        with SnapshotStream(u, 2) as stream:
+            stream.forward(Operator(eq), time_m=1, time_M=5)
+
+            op = Operator(Eq(usnap, usnap + 1, implicit_dims=grid.time_dim))
+            with pytest.raises(InvalidArgument):
+                stream.backward(op, usnap, time_m=1, time_M=9)
+
+
+class TestRevolve:
+
+    @pytest.mark.parametrize('nsteps', [1, 2, 7, 20, 55])
+    @pytest.mark.parametrize('ncheckpoints', [1, 2, 3, 6])
+    def test_schedule(self, nsteps, ncheckpoints):
+        """
+        Replay a Revolve schedule, checking that each step is reversed exactly
+        once, in decreasing order, right after having been advanced.
+        """
+        t = None
+        slots = {}
+        reversed_steps = []
+        last = None
+        for action, *args in revolve(nsteps, ncheckpoints):
+            if action == 'store':
+                slot, tt = args
+                assert 0 <= slot < ncheckpoints
+                assert tt == t or (t is None and tt == 0)
+                slots[slot] = tt
+                t = tt
+            elif action == 'restore':
+                slot, tt = args
+                assert slots[slot] == tt
+                t = tt
+            elif action == 'advance':
+                t0, t1 = args
+                assert t0 == t and t0 < t1 <= nsteps
+                t = t1
+            else:
+                assert last == 'advance'
+                assert args[0] == t - 1
+                reversed_steps.append(args[0])
+            last = action
+
+        assert reversed_steps == list(reversed(range(nsteps)))
+
+    def test_optimal(self):
+        """
+        The number of forward steps matches the optimum, computed by
+        dynamic programming.
+        """
+        nsteps, ncheckpoints = 40, 4
+
+        # opt[s][m] is the minimum number of forward steps to reverse `m`
+        # steps with `s` checkpoints
+        opt = [[0]*(nsteps + 1) for _ in range(ncheckpoints + 1)]
+        for m in range(1, nsteps + 1):
+            opt[1][m] = m*(m + 1)//2
+        for s in range(2, ncheckpoints + 1):
+            opt[s][1] = 1
+            for m in range(2, nsteps + 1):
+                opt[s][m] = min(k + opt[s-1][m-k] + opt[s][k] for k in range(1, m))
+
+        for s in range(1, ncheckpoints + 1):
+            nforward = sum(t1 - t0 for action, *args in revolve(nsteps, s)
+                           if action == 'advance' for t0, t1 in [args])
+            assert nforward == opt[s][nsteps]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            revolve(10, 0)
+
+
+class TestCheckpointer:
+
+    def _setup(self, save=None):
+        grid = Grid(shape=(11, 11))
+        u = TimeFunction(name='u', grid=grid, time_order=2, space_order=2, save=save)
+        v = TimeFunction(name='v', grid=grid, time_order=2, space_order=2)
+        grad = Function(name='grad', grid=grid)
+
+        u.data[:, 5, 5] = 1.
+        u.data[:, 3, 7] = -1.
+
+        op_fwd = Operator(Eq(u.forward, 2*u - u.backward + 0.001*u.laplace))
+        op_adj = Operator([Eq(v.backward, 2*v - v.forward + 0.001*v.laplace + u),
+                           Eq(grad, grad + u*v)])
+
+        return u, grad, op_fwd, op_adj
+
+    def _reference(self, nt):
+        u, grad, op_fwd, op_adj = self._setup(save=nt + 2)
+        op_fwd(time_m=1, time_M=nt)
+        op_adj(time_m=1, time_M=nt)
+        return grad.data.copy()
+
+    @pytest.mark.parametrize('kwargs', [
+        {},
+        {'n_checkpoints': 2},
+        {'n_checkpoints': 5, 'n_memory': 1},
+        {'n_checkpoints': 5, 'n_memory': 0},
+        {'n_checkpoints': 40},
+    ])
+    def test_gradient(self, kwargs):
+        """
+        The gradient computed with checkpointing matches the one computed
+        from the entire forward history.
+        """
+        nt = 30
+        ref = self._reference(nt)
+
+        u, grad, op_fwd, op_adj = self._setup()
+        cp = forward_with_checkpoints(op_fwd, op_adj, time_m=1, time_M=nt, **kwargs)
+
+        assert cp.nsteps == nt
+        assert cp.nforward >= nt
+        assert np.allclose(grad.data, ref, rtol=1e-5, atol=1e-6)
+
+    def test_replacement(self):
+        """
+        The checkpointed state is the one of the TimeFunctions supplied at
+        runtime, rather than the ones the Operators were built with.
+        """
+        nt = 30
+        ref = self._reference(nt)
+
+        u, grad, op_fwd, op_adj = self._setup()
+        u1 = TimeFunction(name='u', grid=u.grid, time_order=2, space_order=2)
+        u1.data[:] = u.data
+        u.data[:] = 0.
+
+        cp = forward_with_checkpoints(op_fwd, op_adj, n_checkpoints=3, u=u1,
+                                      time_m=1, time_M=nt)
+
+        assert cp.functions == (u1,)
+        assert np.all(u.data == 0.)
+        assert np.allclose(grad.data, ref, rtol=1e-5, atol=1e-6)
+
+    @pytest.mark.parametrize('scheme', ['float16', 'bfloat16', 'fixed', 'zlib'])
+    def test_compression(self, scheme):
+        nt = 30
+        ref = self._reference(nt)
+
+        u, grad, op_fwd, op_adj = self._setup()
+        cp = Checkpointer(op_fwd, op_adj, n_checkpoints=4, compression=scheme,
+                          time_m=1, time_M=nt)
+        assert cp._memory.nbytes < 4*2*u.data[0].nbytes
+        cp.apply_forward()
+        cp.apply_reverse()
+        cp.close()
+
+        assert np.allclose(grad.data, ref, rtol=1e-1,
+                           atol=1e-1*np.abs(ref).max())
+
+    @switchconfig(profiling='advanced')
+    def test_summary(self):
+        """
+        The performance summary of the adjoint Operator covers all of the
+        reverse timesteps, across the many invocations.
+        """
+        nt = 30
+
+        u, grad, op_fwd, op_adj = self._setup()
+        cp = Checkpointer(op_fwd, op_adj, n_checkpoints=3, time_m=1, time_M=nt)
+        summary = cp.apply_forward()
+        assert summary[('section0', None)].itershapes[0][0] == cp.nforward
+        summary = cp.apply_reverse()
+        cp.close()
+
+        assert summary[('section0', None)].itershapes[0][0] == nt
+        assert summary[('section0', None)].time > 0
+        fdlike = summary.globals['fdlike']
+        assert np.isclose(fdlike.gpointss*fdlike.time*10**9, nt*11*11)
+
+    def test_no_timefunctions(self):
+        grid = Grid(shape=(4, 4))
+        f = Function(name='f', grid=grid)
+        op = Operator(Eq(f, f + 1))
+        with pytest.raises(InvalidArgument):
+            Checkpointer(op, op)
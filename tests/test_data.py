@@ -1,13 +1,25 @@
+import ctypes
+import mmap
+import threading
+
 import pytest
 import numpy as np
 
 from devito import (Grid, Function, TimeFunction, SparseTimeFunction, Dimension, # noqa
                     Eq, Operator, ALLOC_GUARD, ALLOC_ALIGNED, configuration,
                     switchconfig, SparseFunction, PrecomputedSparseFunction,
-                    PrecomputedSparseTimeFunction)
-from devito.data import LEFT, RIGHT, Decomposition, loc_data_idx, convert_index
-from devito.data.allocators import DataReference
-from devito.tools import as_tuple
+                    PrecomputedSparseTimeFunction, clear_cache)
+from devito.builtins import initialize_function
+from devito.data import (LEFT, RIGHT, Decomposition, loc_data_idx, convert_index,
+                         parallel_copy, parallel_fill)
+from devito.data import engine
+from devito.data.allocators import (DataReference, MmapAllocator, PoolAllocator,
+                                    custom_allocators, default_allocator,
+                                    register_allocator)
+from devito.data.data import _npy_load
+from devito.data.dlpack import from_dlpack
+from devito.exceptions import InvalidArgument
+from devito.tools import as_tuple, bfloat16
 from devito.types import Scalar
 
 
@@ -1394,6 +1406,73 @@ class TestDataDistributed:
             assert np.all(result[2] == [[11, 10, 9, 8]])
             assert np.all(result[3] == [[3, 2, 1, 0]])
 
+    @pytest.mark.parallel(mode=4)
+    def test_points(self, mode):
+        grid = Grid(shape=(7, 6))
+        f = Function(name='f', grid=grid, space_order=1)
+        ref = np.zeros(grid.shape, dtype=np.float32)
+
+        xs = np.array([0, 6, 3, 2, -1])
+        ys = np.array([1, 5, 3, 0, 0])
+        vals = np.arange(5, dtype=np.float32) + 1
+
+        f.data[xs, ys] = vals
+        ref[xs, ys] = vals
+        f.data[[1, 4], 2] = -1
+        ref[[1, 4], 2] = -1
+
+        # The local data
+        glb_slices = grid.distributor.glb_slices
+        assert np.all(f.data == ref[tuple(glb_slices[d] for d in grid.dimensions)])
+
+        # The points are retrieved, in the requested order, on all ranks
+        assert np.all(f.data[xs, ys] == vals)
+        assert np.all(f.data[[1, 4], 2] == -1)
+        assert np.all(f.data_gather_points((xs, ys)) == vals)
+
+        # Or only on the target rank
+        res = f.data_gather_points((xs, ys), rank=1)
+        if grid.distributor.myrank == 1:
+            assert np.all(res == vals)
+        else:
+            assert res is None
+
+        # Multi-dimensional index arrays
+        idx = (np.array([[0, 6], [3, 2]]), np.array([[1, 5], [3, 0]]))
+        assert np.all(f.data[idx] == ref[idx])
+        assert np.all(f.data_gather_points(idx) == ref[idx])
+
+    @pytest.mark.parallel(mode=4)
+    def test_points_timefunction(self, mode):
+        grid = Grid(shape=(8, 8))
+        u = TimeFunction(name='u', grid=grid)
+
+        xs = np.arange(8)
+        u.data[1, xs, xs] = xs
+        u.data[-2, xs, 7 - xs] = -xs
+
+        assert np.all(u.data[1, xs, xs] == xs)
+        assert np.all(u.data_gather_points((1, xs, xs)) == xs)
+        assert np.all(u.data_gather_points((0, xs, 7 - xs)) == -xs)
+
+    @pytest.mark.parallel(mode=4)
+    def test_scatter(self, mode):
+        grid = Grid(shape=(8, 8))
+        f = Function(name='f', grid=grid, dtype=np.int32)
+        myrank = grid.distributor.myrank
+
+        # Each rank sets a different row
+        xs = np.full(8, 2*myrank)
+        ys = np.arange(8)
+        f.data_scatter((xs, ys), myrank + 1)
+
+        ref = np.zeros(grid.shape, dtype=np.int32)
+        for i in range(grid.distributor.nprocs):
+            ref[2*i] = i + 1
+        res = f.data_gather(rank=0)
+        if myrank == 0:
+            assert np.all(res == ref)
+
 
 class TestDataGather:
 
@@ -1587,6 +1666,125 @@ def test_boolean_masking_array():
     assert all(f.data == [1, 1, 0, 0, 1])
 
 
+class TestDataIO:
+    """
+    Tests for the chunked, collective, I/O of distributed Function data.
+    """
+
+    def _path(self, grid, tmpdir, name):
+        # All ranks must agree on the output directory
+        path = str(tmpdir.join(name))
+        if grid.distributor.is_parallel:
+            path = grid.distributor.comm.bcast(path, root=0)
+        return path
+
+    @pytest.mark.parametrize('layout', ['single', 'ranks'])
+    @pytest.mark.parametrize('chunksize', [None, 1])
+    def test_write_read(self, layout, chunksize, tmpdir):
+        grid = Grid(shape=(6, 5, 4))
+        f = Function(name='f', grid=grid, space_order=2)
+        g = Function(name='g', grid=grid, space_order=2)
+        dat = np.arange(120, dtype=np.float32).reshape(grid.shape)
+        f.data[:] = dat
+
+        path = self._path(grid, tmpdir, 'f.npy')
+        f.data_write(path, layout=layout, chunksize=chunksize)
+        if layout == 'single':
+            assert np.all(np.load(path) == dat)
+
+        g.data_read(path, chunksize=chunksize)
+        assert np.all(g.data == f.data)
+
+    @pytest.mark.parametrize('storage_dtype', [np.float16, pytest.param(
+        bfloat16, marks=pytest.mark.skipif(bfloat16 is None, reason="No ml_dtypes")
+    )])
+    def test_compact(self, storage_dtype, tmpdir):
+        grid = Grid(shape=(4, 4))
+        f = Function(name='f', grid=grid, storage_dtype=storage_dtype)
+        g = Function(name='g', grid=grid, storage_dtype=storage_dtype)
+        f.data[:] = np.arange(16).reshape(4, 4)
+
+        path = self._path(grid, tmpdir, 'f.npy')
+        f.data_write(path)
+        g.data_read(path)
+        assert np.all(g.data == f.data)
+
+    def test_invalid(self, tmpdir):
+        grid = Grid(shape=(4, 4))
+        f = Function(name='f', grid=grid)
+        g = Function(name='g', grid=Grid(shape=(4, 5)))
+
+        path = self._path(grid, tmpdir, 'f.npy')
+        with pytest.raises(ValueError):
+            f.data_write(path, layout='xyz')
+
+        f.data_write(path)
+        with pytest.raises(ValueError):
+            g.data_read(path)
+
+    def test_slabs(self):
+        grid = Grid(shape=(5, 4))
+        f = Function(name='f', grid=grid)
+        dat = np.arange(20).reshape(grid.shape)
+        f.data[:] = dat
+
+        slabs = list(f.data_slabs(size=2))
+        assert [i for i, _ in slabs] == [slice(0, 2), slice(2, 4), slice(4, 5)]
+        assert np.all(np.concatenate([i for _, i in slabs]) == dat)
+
+    @pytest.mark.parallel(mode=4)
+    @pytest.mark.parametrize('layout', ['single', 'ranks'])
+    def test_write_read_mpi(self, layout, tmpdir, mode, monkeypatch):
+        grid = Grid(shape=(10, 9, 8), topology=(2, 2, 1))
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        dat = np.arange(1440, dtype=np.float32).reshape((2,) + grid.shape)
+        u.data[:] = dat
+
+        path = self._path(grid, tmpdir, 'u.npy')
+        u.data_write(path, layout=layout, chunksize=256)
+        if layout == 'single':
+            assert np.all(np.load(path) == dat)
+
+        opened = []
+
+        def npy_load(fname, dtype):
+            opened.append(fname)
+            return _npy_load(fname, dtype)
+
+        monkeypatch.setattr('devito.data.data._npy_load', npy_load)
+
+        # Read back with a different decomposition
+        grid1 = Grid(shape=(10, 9, 8), topology=(1, 4, 1))
+        v = TimeFunction(name='v', grid=grid1, space_order=1)
+        v.data_read(path, chunksize=256)
+        assert np.all(v.data == dat[(slice(None),) + tuple(
+            grid1.distributor.glb_slices[d] for d in grid1.dimensions
+        )])
+
+        # Each rank only opens the blocks intersecting its own subdomain, that
+        # is, along `y`, the first two or the last two out of four
+        assert len(opened) == (1 if layout == 'single' else 2)
+
+    @pytest.mark.parallel(mode=4)
+    @pytest.mark.parametrize('rank', [0, 3])
+    def test_slabs_mpi(self, rank, mode):
+        grid = Grid(shape=(10, 10))
+        f = Function(name='f', grid=grid, dtype=np.int32)
+        dat = np.arange(100).reshape(grid.shape)
+        f.data[:] = dat
+        myrank = grid.distributor.myrank
+
+        slabs = []
+        for idx, slab in f.data_slabs(size=3, rank=rank):
+            if myrank == rank:
+                assert slab.shape == (idx.stop - idx.start, 10)
+                slabs.append(slab)
+            else:
+                assert slab is None
+        if myrank == rank:
+            assert np.all(np.concatenate(slabs) == dat)
+
+
 class TestDataReference:
     """
     Tests for passing data to a Function using a reference to a
@@ -1659,6 +1857,361 @@ class TestDataReference:
         self._w_data()
 
 
+class TestDLPack:
+    """
+    Tests for the zero-copy exchange of Function data through DLPack.
+    """
+
+    class Producer:
+        """A third-party array, only exposing the DLPack protocol."""
+
+        def __init__(self, array):
+            self.array = array
+
+        def __dlpack__(self, stream=None):
+            return self.array.__dlpack__(stream=stream)
+
+        def __dlpack_device__(self):
+            return self.array.__dlpack_device__()
+
+    def test_export(self):
+        grid = Grid(shape=(4, 4))
+        f = Function(name='f', grid=grid, space_order=2)
+
+        a = np.from_dlpack(f.data)
+        assert np.shares_memory(a, f._data)
+        assert a.shape == f.shape
+
+        Operator(Eq(f, f + 1))()
+        assert np.all(a == 1)
+
+    @pytest.mark.parametrize('storage_dtype', [np.float16, pytest.param(
+        bfloat16, marks=pytest.mark.skipif(bfloat16 is None, reason="No ml_dtypes")
+    )])
+    def test_export_compact(self, storage_dtype):
+        grid = Grid(shape=(4, 4))
+        f = Function(name='f', grid=grid, storage_dtype=storage_dtype)
+        f.data[:] = 2.
+
+        a = from_dlpack(f.data)
+        assert a.dtype == storage_dtype
+        assert np.shares_memory(a, f._data)
+
+        a[0, 0] = 3.
+        assert f.data[0, 0] == 3.
+
+    @pytest.mark.parametrize('capsule', [False, True])
+    def test_import(self, capsule):
+        grid = Grid(shape=(3, 3))
+        a = np.ones((5, 5), dtype=np.float32)
+        producer = self.Producer(a)
+        if capsule:
+            producer = producer.__dlpack__()
+
+        f = Function(name='f', grid=grid, space_order=1, allocator=producer)
+        assert isinstance(f._allocator, DataReference)
+
+        # Check that the external data hasn't been zeroed
+        assert np.all(f.data_with_halo == 1)
+
+        Operator(Eq(f, f + 1))()
+        assert np.all(a[1:-1, 1:-1] == 2)
+        assert np.all(a[0] == 1)
+
+    def test_import_compact(self):
+        grid = Grid(shape=(3, 3))
+        a = np.ones((3, 3), dtype=np.float16)
+
+        f = Function(name='f', grid=grid, space_order=0, storage_dtype=np.float16,
+                     allocator=self.Producer(a))
+
+        Operator(Eq(f, f + 1))()
+        assert np.all(a == 2)
+
+    def test_import_misaligned(self):
+        grid = Grid(shape=(3, 3))
+        buf = np.zeros(26, dtype=np.float32)
+        # A buffer that is 4-, but not 8-, byte aligned
+        offset = (buf.ctypes.data // 4 + 1) % 2
+        a = buf[offset:offset+25].reshape(5, 5)
+
+        f = Function(name='f', grid=grid, space_order=1,
+                     allocator=self.Producer(a))
+        assert f._data_alignment == 4
+
+        op = Operator(Eq(f, f + 1))
+        assert 'aligned(f' not in str(op)
+
+        op()
+        assert np.all(a[1:-1, 1:-1] == 1)
+
+    def test_misaligned_runtime_value(self):
+        grid = Grid(shape=(3, 3))
+        buf = np.zeros(26, dtype=np.float32)
+        offset = (buf.ctypes.data // 4 + 1) % 2
+        a = buf[offset:offset+25].reshape(5, 5)
+
+        f = Function(name='f', grid=grid, space_order=1)
+        g = Function(name='f', grid=grid, space_order=1,
+                     allocator=self.Producer(a))
+
+        op = Operator(Eq(f, f + 1))
+        assert 'aligned(f' in str(op)
+
+        # `g` is less aligned than assumed by the generated code
+        with pytest.raises(InvalidArgument):
+            op.apply(f=g)
+        assert np.all(a == 0)
+
+        # Fine the other way round
+        op = Operator(Eq(g, g + 1))
+        op.apply(f=f)
+        assert np.all(f.data == 1)
+
+    def test_import_invalid(self):
+        grid = Grid(shape=(3, 3))
+
+        # The halo is missing
+        f = Function(name='f', grid=grid, space_order=1,
+                     allocator=self.Producer(np.ones((3, 3), dtype=np.float32)))
+        with pytest.raises(ValueError):
+            f.data
+
+        # Wrong dtype
+        f = Function(name='f', grid=grid, space_order=0,
+                     allocator=self.Producer(np.ones((3, 3), dtype=np.float64)))
+        with pytest.raises(ValueError):
+            f.data
+
+        # Non-contiguous
+        a = np.ones((3, 6), dtype=np.float32)[:, ::2]
+        f = Function(name='f', grid=grid, space_order=0,
+                     allocator=self.Producer(a))
+        with pytest.raises(ValueError):
+            f.data
+
+        # A capsule may only be consumed once
+        capsule = np.ones((3, 3), dtype=np.float32).__dlpack__()
+        Function(name='f', grid=grid, space_order=0, allocator=capsule)
+        with pytest.raises(ValueError):
+            Function(name='f', grid=grid, space_order=0, allocator=capsule)
+
+
+class TestMmapAllocator:
+    """
+    Tests for placing Function data in memory-mapped files.
+    """
+
+    def test_save(self, tmpdir):
+        grid = Grid(shape=(4, 4))
+        nt = 6
+
+        u = TimeFunction(name='u', grid=grid, save=nt,
+                         allocator=MmapAllocator(str(tmpdir)))
+        assert np.all(u.data == 0)
+
+        Operator(Eq(u.forward, u + 1))()
+        for i in range(nt):
+            assert np.all(u.data[i] == i)
+
+        # The data lives in an (unlinked) file within `tmpdir`
+        with open('/proc/self/maps') as f:
+            maps = [i for i in f if str(tmpdir) in i]
+        assert len(maps) == 1
+        assert maps[0].split()[1] == 'rw-s'
+
+    def test_untouched(self, tmpdir):
+        grid = Grid(shape=(64, 64))
+        u = TimeFunction(name='u', grid=grid, save=64,
+                         allocator=MmapAllocator(str(tmpdir)))
+
+        # The allocation doesn't touch any of the pages of the mapping
+        data = u._data_allocated
+        lib = MmapAllocator.lib
+        npages = -(-data.nbytes // lib.getpagesize())
+        vec = (ctypes.c_ubyte*npages)()
+        assert lib.mincore(ctypes.c_void_p(data.ctypes.data),
+                           ctypes.c_size_t(data.nbytes), vec) == 0
+        assert not any(i & 1 for i in vec)
+
+        assert np.all(u.data == 0)
+
+    def test_page_aligned(self, tmpdir):
+        grid = Grid(shape=(3, 5))
+        f = Function(name='f', grid=grid, space_order=2,
+                     allocator=MmapAllocator(str(tmpdir)))
+        f.data[:] = 1.
+
+        pagesize = MmapAllocator.lib.getpagesize()
+        assert f._data_allocated.ctypes.data % pagesize == 0
+        assert np.all(f.data == 1.)
+
+    def test_register(self, tmpdir):
+        allocator = MmapAllocator(str(tmpdir))
+        register_allocator('mmap', allocator)
+        try:
+            assert default_allocator('mmap') is allocator
+        finally:
+            custom_allocators.pop('mmap')
+
+
+class TestPoolAllocator:
+    """
+    Tests for recycling Function data through a pool of memory blocks.
+    """
+
+    def test_reuse(self):
+        pool = PoolAllocator()
+        grid = Grid(shape=(10, 10))
+
+        u = TimeFunction(name='u', grid=grid, space_order=2, allocator=pool)
+        u.data[:] = 2.
+        address = u._data_allocated.ctypes.data
+
+        del u
+        clear_cache()
+        assert pool.nbytes > 0
+
+        # Same shape, different Function
+        v = TimeFunction(name='v', grid=grid, space_order=2, allocator=pool)
+        assert v._data_allocated.ctypes.data == address
+        assert np.all(v.data_with_halo == 0.)
+        assert pool.nbytes == 0
+
+        # Different shape, fresh block
+        w = Function(name='w', grid=grid, space_order=2, allocator=pool)
+        assert w._data_allocated.ctypes.data != address
+
+    def test_capacity(self):
+        pagesize = mmap.PAGESIZE
+        pool = PoolAllocator(capacity=2*pagesize)
+
+        blocks = [pool.alloc((pagesize,), np.int8) for _ in range(3)]
+        assert pool.nbytes == 0
+
+        for _, memfree_args in blocks:
+            pool.free(*memfree_args)
+
+        # The least recently released block has been evicted
+        assert pool.nbytes == 2*pagesize
+        retained = [i[1][0].value for i in blocks[1:]]
+        assert list(pool._lru) == retained
+
+        # The most recently released block is reused first
+        array, _ = pool.alloc((pagesize,), np.int8)
+        assert array.ctypes.data == retained[-1]
+
+        pool.clear()
+        assert pool.nbytes == 0
+
+    def test_no_zero_init(self):
+        pool = PoolAllocator(zero_init=False)
+        grid = Grid(shape=(10, 10))
+
+        u = Function(name='u', grid=grid, allocator=pool)
+        u.data_with_halo[:] = 3.
+
+        del u
+        clear_cache()
+
+        # The recycled block is handed out as is
+        v = Function(name='v', grid=grid, allocator=pool)
+        assert np.all(v.data_with_halo == 3.)
+
+
+class TestParallelEngine:
+    """
+    Tests for the threaded initialization of the data.
+    """
+
+    @pytest.fixture
+    def threaded(self, monkeypatch):
+        monkeypatch.setenv('OMP_NUM_THREADS', '4')
+        monkeypatch.setattr(engine, 'MIN_CHUNK_NBYTES', 1)
+        with switchconfig(language='openmp'):
+            yield
+
+    def test_nthreads(self, monkeypatch):
+        monkeypatch.setenv('OMP_NUM_THREADS', '3')
+        with switchconfig(language='C'):
+            assert engine.nthreads() == 1
+        with switchconfig(language='openmp'):
+            assert engine.nthreads() == 3
+
+    @pytest.mark.parametrize('bind,expected', [
+        ('false', None),
+        ('close', [{0}, {1}, {2}, {3}]),
+        ('spread', [{0}, {2}, {4}, {6}]),
+    ])
+    def test_places(self, monkeypatch, bind, expected):
+        monkeypatch.setenv('OMP_PROC_BIND', bind)
+        monkeypatch.setattr(engine.os, 'sched_getaffinity', lambda pid: set(range(8)))
+        assert engine.places(4) == expected
+
+    @pytest.mark.parametrize('axis', [0, 1])
+    def test_fill(self, threaded, axis):
+        a = np.ones((7, 9), dtype=np.float32)
+        parallel_fill(a[1:, 2:], 3., axis=axis)
+        assert np.all(a[1:, 2:] == 3.)
+        assert np.all(a[0] == 1.) and np.all(a[:, :2] == 1.)
+
+    def test_copy(self, threaded):
+        src = np.arange(63, dtype=np.float64).reshape(7, 9)
+        dst = np.zeros((7, 9), dtype=np.float32)
+        parallel_copy(dst, src, axis=1)
+        assert np.all(dst == src)
+
+        # Broadcasting
+        parallel_copy(dst, src[0])
+        assert np.all(dst == src[0])
+
+    def test_threads(self, threaded):
+        a = np.zeros((8, 3))
+        threads = set()
+
+        def record(idx):
+            threads.add(threading.current_thread())
+            a[idx] = 1
+
+        engine._run(record, a, 0)
+        assert len(threads) == 4
+        assert np.all(a == 1)
+
+    def test_first_touch(self, threaded, monkeypatch):
+        from devito.types import dense
+        _assign = dense.assign
+        assigned = []
+
+        def assign(f, *args, **kwargs):
+            assigned.append(f)
+            return _assign(f, *args, **kwargs)
+
+        # The first touch is performed by an OpenMP Operator, so the pages are
+        # touched by the very same threads as in the computation
+        monkeypatch.setattr(dense, 'assign', assign)
+
+        grid = Grid(shape=(6, 7))
+        u = TimeFunction(name='u', grid=grid, space_order=2, first_touch=True)
+        assert u._touch_axis == 1
+        assert np.all(u.data_with_halo == 0)
+        assert assigned == [u]
+
+        f = Function(name='f', grid=grid, space_order=2,
+                     initializer=np.ones((10, 11)))
+        assert np.all(f.data_with_halo == 1)
+
+        f.data.reset()
+        assert np.all(f.data == 0)
+        assert np.all(f.data_with_halo[0] == 1)
+
+    def test_initialize_function(self, threaded):
+        grid = Grid(shape=(10, 12))
+        f = Function(name='f', grid=grid)
+        a = np.arange(48, dtype=np.float32).reshape(6, 8)
+        initialize_function(f, a, 2)
+        assert np.all(f.data[2:-2, 2:-2] == a)
+
+
 if __name__ == "__main__":
     configuration['mpi'] = True
     TestDataDistributed().test_misc_data()
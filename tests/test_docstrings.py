@@ -22,7 +22,8 @@ import doctest
     'data.decomposition', 'data.allocators', 'finite_differences.finite_difference',
     'finite_differences.coefficients', 'finite_differences.derivative',
     'ir.support.space', 'data.utils', 'data.allocators', 'builtins',
-    'symbolics.inspection', 'tools.utils', 'tools.data_structures'
+    'symbolics.inspection', 'tools.utils', 'tools.data_structures',
+    'checkpointing.snapshot', 'checkpointing.revolve', 'data.data'
 ])
 def test_docstrings(modname):
     module = import_module('devito.%s' % modname)
@@ -10,7 +10,7 @@ from devito.ir.equations.algorithms import dimension_sort
 from devito.ir.iet import Iteration, FindNodes
 from devito.ir.support.basic import (IterationInstance, TimedAccess, Scope,
                                      Vector, AFFINE, REGULAR, IRREGULAR, mocksym0,
-                                     mocksym1)
+                                     mocksym1, scope_cache)
 from devito.ir.support.space import (NullInterval, Interval, Forward, Backward,
                                      IterationSpace)
 from devito.ir.support.guards import GuardOverflow
@@ -886,6 +886,36 @@ class TestDependenceAnalysis:
         assert len(scope.reads[mocksym1]) == 2
         assert len(scope.d_all) == 9
 
+    def test_scope_cache(self):
+        grid = Grid(shape=(4, 4))
+        x, y = grid.dimensions
+
+        u = Function(name='u', grid=grid)
+        v = Function(name='v', grid=grid)
+
+        exprs = [LoweredEq(Eq(u[x, y], v[x + 1, y])),
+                 LoweredEq(Eq(v[x, y], u[x - 1, y]))]
+
+        # No caching outside of a `scope_cache`
+        assert Scope(exprs) is not Scope(exprs)
+        assert Scope(i for i in exprs).exprs == tuple(exprs)
+
+        with scope_cache() as sc:
+            scope = Scope(i for i in exprs)
+            assert scope.exprs == tuple(exprs)
+            assert Scope(list(exprs)) is scope
+            assert Scope(exprs[:1]) is not scope
+            assert Scope(exprs, rules=lambda *args: True) is not scope
+
+            # Same expressions, but different objects
+            exprs1 = [LoweredEq(i) for i in exprs]
+            assert Scope(exprs1) is not scope
+
+            assert sc.hits == 1
+            assert sc.misses == 4
+
+        assert len(scope.d_flow) == len(Scope(exprs).d_flow) == 1
+
 
 class TestParallelismAnalysis:
 
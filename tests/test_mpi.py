@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 import pytest
 from functools import cached_property
@@ -17,13 +19,19 @@ from devito.ir.iet import (Call, Conditional, Iteration, FindNodes, FindSymbols,
 from devito.mpi import MPI
 from devito.mpi.routines import (HaloUpdateCall, HaloUpdateList, MPICall,
                                  ComputeCall)
-from devito.mpi.distributed import CustomTopology
-from devito.tools import Bunch
+from devito.mpi.distributed import (CustomTopology, balance_decomposition,
+                                    optimize_topology)
+from devito.tools import Bunch, bfloat16
 
 from examples.seismic.acoustic import acoustic_setup
 from tests.test_dse import TestTTI
 
 
+storage_dtypes = [np.float16,
+                  pytest.param(bfloat16, marks=pytest.mark.skipif(
+                      bfloat16 is None, reason="requires ml_dtypes"))]
+
+
 class TestDistributor:
 
     @pytest.mark.parallel(mode=[2, 4])
@@ -241,6 +249,95 @@ class TestDistributor:
         # along that instead
         assert f.shape == (4,)
 
+    @pytest.mark.parametrize('shape, nprocs, nprocs_local, expected', [
+        ((200, 200, 200), 8, 1, (2, 2, 2)),
+        ((4000, 1000, 800), 16, 1, (8, 2, 1)),
+        ((4000, 1000, 800), 64, 1, (16, 2, 2)),
+        ((100, 100), 12, 1, (4, 3)),
+        ((10, 1000), 4, 1, (1, 4)),
+        ((3, 100), 8, 1, (1, 8)),
+        ((16,), 4, 1, (4,)),
+        # With 4 ranks per node, the inter-node faces are the expensive ones
+        ((512, 512), 16, 1, (4, 4)),
+        ((512, 512), 16, 4, (2, 8)),
+    ])
+    def test_optimize_topology(self, shape, nprocs, nprocs_local, expected):
+        assert optimize_topology(shape, nprocs, nprocs_local) == expected
+
+    @pytest.mark.parametrize('width, expected', [
+        (1, (2, 2)),
+        (4, (2, 2)),
+        (8, (4, 1)),
+    ])
+    def test_optimize_topology_width(self, width, expected):
+        assert optimize_topology((40, 40), 4, width=width) == expected
+
+    @pytest.mark.parallel(mode=[4])
+    def test_optimal_topology(self, mode):
+        grid = Grid(shape=(40, 10), topology='optimal')
+        f = Function(name='f', grid=grid)
+
+        assert grid.distributor.topology == (4, 1)
+        assert f.shape == (10, 10)
+
+        with switchconfig(topology='optimal'):
+            grid = Grid(shape=(10, 40))
+        assert grid.distributor.topology == (1, 4)
+
+        # The thicker the halo, the fewer the decomposed Dimensions
+        grid = Grid(shape=(40, 40), topology='optimal', space_order=2)
+        assert grid.distributor.topology == (2, 2)
+        grid = Grid(shape=(40, 40), topology='optimal', space_order=16)
+        assert grid.distributor.topology == (4, 1)
+
+    @pytest.mark.parametrize('cost, shape, topology, expected', [
+        ((None,), (10,), (4,), ((3, 3, 2, 2),)),
+        ((np.ones(10),), (10,), (2,), ((5, 5),)),
+        ((np.r_[np.full(4, 3.), np.ones(8)],), (12,), (2,), ((3, 9),)),
+        # Each subdomain gets at least one point
+        ((np.r_[np.zeros(5), 100., np.zeros(5)],), (11,), (4,), ((5, 1, 1, 4),)),
+        ((np.ones(8), np.r_[np.ones(4), np.zeros(4)]), (8, 8), (2, 2),
+         ((4, 4), (2, 6))),
+    ])
+    def test_balance_decomposition(self, cost, shape, topology, expected):
+        assert balance_decomposition(cost, shape, topology) == expected
+
+    def test_balance_decomposition_array(self):
+        # The cost profile along each Dimension is summed over the others
+        cost = np.ones((12, 6))
+        cost[:3, :2] = 10
+        assert balance_decomposition(cost, (12, 6), (2, 2)) == ((3, 9), (2, 4))
+
+    @pytest.mark.parallel(mode=[4])
+    def test_uneven_decomposition(self, mode):
+        grid = Grid(shape=(12, 8), decomposition=((3, 9), None))
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+
+        assert grid.distributor.topology == (2, 2)
+        expected = [(3, 4), (3, 4), (9, 4), (9, 4)]
+        assert u.shape[1:] == expected[grid.distributor.myrank]
+
+        # Same results as with the even decomposition
+        grid1 = Grid(shape=(12, 8))
+        u1 = TimeFunction(name='u', grid=grid1, space_order=2)
+        for v in (u, u1):
+            v.data[0, 4:8, 2:6] = 1.
+            Operator(Eq(v.forward, v.laplace + v))(time_M=3)
+        assert np.isclose(norm(u), norm(u1), rtol=0)
+
+    @pytest.mark.parallel(mode=[4])
+    def test_cost_decomposition(self, mode):
+        cost = np.ones((16, 16))
+        cost[:4] = 3.
+        grid = Grid(shape=(16, 16), topology=(4, 1), cost=cost)
+        f = Function(name='f', grid=grid)
+
+        expected = [(2, 16), (2, 16), (6, 16), (6, 16)]
+        assert f.shape == expected[grid.distributor.myrank]
+
+        with pytest.raises(ValueError):
+            Grid(shape=(16, 16), decomposition=((8, 7), None))
+
 
 class TestFunction:
 
@@ -289,6 +386,38 @@ class TestFunction:
         assert np.all(f._data_ro_with_inhalo[:, 0] == 0.)
         assert np.all(f._data_ro_with_inhalo[:, -1] == 0.)
 
+    @pytest.mark.parametrize('storage_dtype', storage_dtypes)
+    @pytest.mark.parallel(mode=2)
+    def test_halo_exchange_storage_dtype(self, storage_dtype, mode):
+        """
+        Test halo exchange of data stored in a type that MPI lacks (e.g.,
+        float16), which is exchanged as raw bits.
+        """
+        grid = Grid(shape=(12, 12))
+        x, y = grid.dimensions
+
+        f = Function(name='f', grid=grid, storage_dtype=storage_dtype)
+        f.data[:] = grid.distributor.myrank + 1.5
+
+        # Now trigger a halo exchange...
+        f.data_with_halo   # noqa
+
+        glb_pos_map = grid.distributor.glb_pos_map
+        if LEFT in glb_pos_map[x]:
+            assert np.all(f.data_ro_domain[:] == 1.5)
+            assert np.all(f._data_ro_with_inhalo[-1, 1:-1] == 2.5)
+        else:
+            assert np.all(f.data_ro_domain[:] == 2.5)
+            assert np.all(f._data_ro_with_inhalo[0, 1:-1] == 1.5)
+        assert f._data_ro_with_inhalo.dtype == storage_dtype
+
+        # ...and a gather
+        data = f.data_gather(rank=0)
+        if grid.distributor.myrank == 0:
+            assert data.dtype == storage_dtype
+            assert np.all(data[:6] == 1.5)
+            assert np.all(data[6:] == 2.5)
+
     @pytest.mark.parametrize("paddings", [
         (None, None),
         ((0, 0), (0, 0)),
@@ -760,6 +889,38 @@ class TestOperatorSimple:
             assert np.all(f.data_ro_domain[0, :-1] == 3.)
             assert f.data_ro_domain[0, -1] == 2.
 
+    @pytest.mark.parallel(mode=[2])
+    @switchconfig(**{'jit-split': True})
+    def test_trivial_eq_1d_jit_split(self, mode):
+        grid = Grid(shape=(32,))
+        x = grid.dimensions[0]
+        t = grid.stepping_dim
+
+        f = TimeFunction(name='f', grid=grid)
+        f.data_with_halo[:] = 1.
+
+        op = Operator(Eq(f.forward, f[t, x-1] + f[t, x+1] + 1))
+
+        # The halo exchange routines are emitted into separate translation units
+        units = [i for i, _ in op._ccode_units]
+        assert units[0] == op.name
+        assert set(units[1:]) == {i.root.name for i in op._func_table.values()}
+        assert all('static void' not in i for _, i in op._ccode_units)
+
+        op.apply(time=1)
+
+        # The private copies of the source files have been renamed
+        jitdir = op._compiler.get_jit_dir()
+        assert not list(jitdir.glob('%s-*.%d.*' % (op._soname, os.getpid())))
+
+        assert np.all(f.data_ro_domain[1] == 3.)
+        if f.grid.distributor.myrank == 0:
+            assert f.data_ro_domain[0, 0] == 5.
+            assert np.all(f.data_ro_domain[0, 1:] == 7.)
+        else:
+            assert f.data_ro_domain[0, -1] == 5.
+            assert np.all(f.data_ro_domain[0, :-1] == 7.)
+
     @pytest.mark.parallel(mode=2)
     def test_trivial_eq_1d_save(self, mode):
         grid = Grid(shape=(32,))
@@ -817,6 +978,36 @@ class TestOperatorSimple:
             assert np.all(f.data_ro_domain[0, :-1, -1:] == side)
             assert np.all(f.data_ro_domain[0, -1:, :-1] == side)
 
+    @pytest.mark.parametrize('storage_dtype', storage_dtypes)
+    @pytest.mark.parallel(mode=[(4, 'basic'), (4, 'diag'), (4, 'full')])
+    def test_trivial_eq_2d_storage_dtype(self, storage_dtype, mode):
+        """
+        As `test_trivial_eq_2d`, but the generated halo exchanges move data
+        stored in a narrower type than the compute one.
+        """
+        grid = Grid(shape=(8, 8,))
+        x, y = grid.dimensions
+        t = grid.stepping_dim
+
+        f = TimeFunction(name='f', grid=grid, space_order=1,
+                         storage_dtype=storage_dtype)
+        f.data_with_halo[:] = 1.
+
+        eqn = Eq(f.forward, f[t, x-1, y] + f[t, x+1, y] + f[t, x, y-1] + f[t, x, y+1])
+        op = Operator(eqn)
+        op.apply(time=1)
+
+        # Expected computed values, all exactly representable
+        corner, side, interior = 10., 13., 16.
+
+        data = f.data_ro_domain[0].astype(np.float32)
+        glb_pos_map = f.grid.distributor.glb_pos_map
+        assert np.all(data[1:-1, 1:-1] == interior)
+        ix = 0 if LEFT in glb_pos_map[x] else -1
+        iy = 0 if LEFT in glb_pos_map[y] else -1
+        assert data[ix, iy] == corner
+        assert np.sum(data == side) == 2*(data.shape[0] - 1)
+
     @pytest.mark.parallel(mode=[(8, 'basic'), (8, 'diag'), (8, 'overlap'),
                                 (8, 'overlap2'), (8, 'diag2'), (8, 'full')])
     def test_trivial_eq_3d(self, mode):
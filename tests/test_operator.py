@@ -1,4 +1,5 @@
 from itertools import permutations
+import warnings
 
 import numpy as np
 import sympy
@@ -9,9 +10,9 @@ from devito import (Grid, Eq, Operator, Constant, Function, TimeFunction,
                     SparseFunction, SparseTimeFunction, Dimension, error, SpaceDimension,
                     NODE, CELL, dimensions, configuration, TensorFunction,
                     TensorTimeFunction, VectorFunction, VectorTimeFunction,
-                    div, grad, switchconfig)
+                    div, grad, switchconfig, compile_all)
 from devito import  Inc, Le, Lt, Ge, Gt  # noqa
-from devito.exceptions import InvalidOperator
+from devito.exceptions import InvalidArgument, InvalidOperator
 from devito.finite_differences.differentiable import diff2sympy
 from devito.ir.equations import ClusterizedEq
 from devito.ir.equations.algorithms import lower_exprs
@@ -20,7 +21,7 @@ from devito.ir.iet import (Callable, Conditional, Expression, Iteration, TimedLi
 from devito.ir.support import Any, Backward, Forward
 from devito.passes.iet.languages.C import CDataManager
 from devito.symbolics import ListInitializer, indexify, retrieve_indexed
-from devito.tools import flatten, powerset, timed_region
+from devito.tools import bfloat16, flatten, powerset, timed_region
 from devito.types import Array, Barrier, CustomDimension, Indirection, Scalar, Symbol
 
 
@@ -133,6 +134,69 @@ class TestOperatorSetup:
         assert op0._compiler is not op2._compiler
         assert op1._compiler is not op2._compiler
 
+    def test_compile_all(self):
+        grid = Grid(shape=(4, 4))
+
+        u = TimeFunction(name='u', grid=grid)
+        v = TimeFunction(name='v', grid=grid)
+
+        op0 = Operator(Eq(u.forward, u + 1))
+        op1 = Operator(Eq(v.forward, v + 2))
+        op2 = Operator(Eq(u.forward, u*v + 1))
+
+        ops = compile_all([op0, op1, op2, op0], workers=2)
+
+        assert ops == (op0, op1, op2, op0)
+        assert all(op._lib is not None for op in ops)
+        assert all('jit-compile' in op._profiler.py_timers for op in ops)
+
+        # The compiled Operators are ready to be applied
+        op0.apply(time_M=2)
+        op1.apply(time_M=2)
+        assert np.all(u.data[1] == 3.)
+        assert np.all(v.data[1] == 6.)
+
+    def test_compile_all_warnings_filters(self):
+        grid = Grid(shape=(4, 4))
+
+        u = TimeFunction(name='u', grid=grid)
+        ops = [Operator(Eq(u.forward, u + i), name='op%d' % i) for i in range(4)]
+
+        filters = list(warnings.filters)
+        compile_all(ops, workers=4)
+
+        # The concurrent compilations leave the warnings filters untouched
+        assert warnings.filters == filters
+
+    def test_compile_profile(self):
+        grid = Grid(shape=(4, 4))
+
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        eq = Eq(u.forward, u.laplace + 1)
+
+        # By default, only the timings are available
+        op = Operator(eq)
+        profile = op.compile_profile
+        assert profile.name == op.name
+        assert profile.total == op._profiler.py_timers['op-compile']
+        assert 'lowering.Clusters' in profile
+        assert 'lowering.Clusters/specializing.Clusters/cire' in profile
+        assert all(v.ncalls is None for v in profile.values())
+        assert profile.counters['scope-cache-misses'] > 0
+
+        with switchconfig(**{'compile-profiling': True}):
+            op = Operator(eq)
+        profile = op.compile_profile
+        assert all(v.ncalls >= 1 for v in profile.values())
+        assert profile['lowering.Clusters'].size_in == 1
+        assert profile['lowering.Clusters'].size_out >= 1
+        assert profile['lowering.IET'].size_out > 1
+        assert all(v.sympy_cache > 0 for v in profile.values())
+
+        # Serialization, e.g. to compare profiles across versions
+        assert profile.fromdict(profile.todict()) == profile
+        assert profile.fromdict(profile.todict()).counters == profile.counters
+
 
 class TestCodeGen:
 
@@ -696,6 +760,155 @@ class TestAllocation:
             assert f.data[index] == 2.
 
 
+class TestStorageDtype:
+
+    """
+    Data stored in a narrower data type than the compute one.
+    """
+
+    storage_dtypes = [np.float16,
+                      pytest.param(bfloat16, marks=pytest.mark.skipif(
+                          bfloat16 is None, reason="requires ml_dtypes"))]
+
+    def test_data(self):
+        grid = Grid(shape=(4, 4))
+        f = Function(name='f', grid=grid, space_order=2, storage_dtype=np.float16)
+        g = Function(name='g', grid=grid, space_order=2)
+
+        assert f.dtype == np.float32
+        assert f.storage_dtype == np.float16
+        assert f.data.dtype == np.float16
+        assert f.nbytes == g.nbytes // 2
+
+        f.data[:] = 1/3
+        assert np.all(f.data == np.float16(1/3))
+
+        # Derived objects share the storage data type
+        assert f.func(name='f').storage_dtype == np.float16
+        assert f.subs(grid.dimensions[0], grid.dimensions[0] + 1).storage_dtype == \
+            np.float16
+        assert f.indexed.storage_dtype == np.float16
+        assert g.storage_dtype == g.dtype == np.float32
+
+    def test_invalid(self):
+        grid = Grid(shape=(4, 4))
+        with pytest.raises(ValueError):
+            Function(name='f', grid=grid, storage_dtype=np.float64)
+        with pytest.raises(ValueError):
+            Function(name='f', grid=grid, storage_dtype=np.int16)
+        with pytest.raises(ValueError):
+            Function(name='f', grid=grid, dtype=np.int32, storage_dtype=np.float16)
+        with pytest.raises(ValueError):
+            SparseFunction(name='s', grid=grid, npoint=1, storage_dtype=np.float16)
+
+    def test_codegen(self):
+        grid = Grid(shape=(4, 4))
+        u = TimeFunction(name='u', grid=grid, storage_dtype=np.float16)
+        f = Function(name='f', grid=grid, storage_dtype=np.float16)
+
+        op = Operator([Eq(u.forward, u + f), Inc(f, u)])
+
+        assert '_Float16 (*restrict u)' in str(op)
+        assert '_Float16 (*restrict f)' in str(op)
+        exprs = [str(i) for i in FindNodes(Expression).visit(op)]
+        assert len(exprs) == 2
+        assert exprs[0] == ('u[t1][x + 1][y + 1] = (_Float16)((float)f[x + 1][y + 1]'
+                            ' + (float)u[t0][x + 1][y + 1]);')
+        assert exprs[1] == ('f[x + 1][y + 1] = (_Float16)((float)f[x + 1][y + 1]'
+                            ' + ((float)u[t0][x + 1][y + 1]));')
+
+    @pytest.mark.parametrize('storage_dtype', storage_dtypes)
+    @pytest.mark.parametrize('linearize', [False, True])
+    def test_accuracy(self, storage_dtype, linearize):
+        """
+        The computation is carried out in the compute data type, so the error
+        remains in the order of the storage data type resolution.
+        """
+        grid = Grid(shape=(11, 11))
+
+        def run(storage_dtype):
+            u = TimeFunction(name='u', grid=grid, space_order=2,
+                             storage_dtype=storage_dtype)
+            m = Function(name='m', grid=grid, storage_dtype=storage_dtype)
+            m.data[:] = 0.1
+            u.data[:, 5, 5] = 1.
+
+            op = Operator([Eq(u.forward, u + m*u.laplace/1000), Inc(m, u)],
+                          opt=('advanced', {'linearize': linearize}))
+            op(time_M=5)
+
+            return u.data[0].astype(np.float32), m.data.astype(np.float32)
+
+        u_ref, m_ref = run(None)
+        u, m = run(storage_dtype)
+
+        eps = np.finfo(np.float16).eps if storage_dtype is np.float16 else 2.**-7
+        assert np.allclose(u, u_ref, rtol=10*eps, atol=10*eps)
+        assert np.allclose(m, m_ref, rtol=10*eps, atol=10*eps)
+
+    @pytest.mark.skipif(bfloat16 is None, reason="requires ml_dtypes")
+    def test_bfloat16_rounding(self):
+        """
+        The stores from the generated code round as the stores from Python,
+        that is to nearest with ties to even, and NaNs remain NaNs.
+        """
+        grid = Grid(shape=(8,))
+        f = Function(name='f', grid=grid, storage_dtype=bfloat16)
+        g = Function(name='g', grid=grid)
+
+        g.data.view(np.uint32)[:] = [0x3f808000, 0x3f818000, 0xbf808000, 0x3f808001,
+                                     0x7f7fffff, 0x7f800000, 0x7fffffff, 0xffc00001]
+
+        Operator(Eq(f, g))()
+
+        expected = g.data.astype(bfloat16)
+        assert np.all(f.data.view(np.uint16)[:6] == expected.view(np.uint16)[:6])
+        assert np.all(np.isnan(f.data.astype(np.float32)[6:]))
+
+    @pytest.mark.parametrize('storage_dtype', storage_dtypes)
+    @switchconfig(language='openmp')
+    def test_injection(self, storage_dtype):
+        """
+        The increments of a Function with a storage data type can't be atomic
+        updates, so they are performed within a critical section.
+        """
+        grid = Grid(shape=(11, 11))
+
+        f = Function(name='f', grid=grid, storage_dtype=storage_dtype)
+        src = SparseFunction(name='src', grid=grid, npoint=3,
+                             coordinates=[(0.5, 0.5), (0.5, 0.5), (0.25, 0.5)])
+        src.data[:] = 1.
+
+        op = Operator(src.inject(field=f, expr=src))
+
+        assert '#pragma omp critical' in str(op)
+        assert '#pragma omp atomic' not in str(op)
+
+        op.apply()
+
+        assert f.data[5, 5] == 2.
+        assert f.data[2, 5] + f.data[3, 5] == 1.
+        assert np.sum(f.data.astype(np.float32)) == 3.
+
+    @switchconfig(profiling='advanced')
+    def test_traffic(self):
+        """
+        The compulsory traffic reported by the AdvancedProfiler accounts for
+        the storage data type.
+        """
+        grid = Grid(shape=(16, 16))
+
+        traffic = []
+        for storage_dtype in [None, np.float16]:
+            u = TimeFunction(name='u', grid=grid, space_order=2,
+                             storage_dtype=storage_dtype)
+            op = Operator(Eq(u.forward, u.laplace))
+            summary = op.apply(time_M=1)
+            traffic.append(summary.input[('section0', None)].traffic)
+
+        assert traffic[1] == traffic[0] / 2
+
+
 class TestApplyArguments:
 
     def verify_arguments(self, arguments, expected):
@@ -1268,6 +1481,68 @@ class TestApplyArguments:
         # But the following should work perfectly fine
         op.arguments(x_size=2, y_size=2)
 
+    def test_prepared_call(self):
+        grid = Grid(shape=(4, 4))
+
+        u0 = TimeFunction(name='u', grid=grid, save=6)
+        u1 = TimeFunction(name='u', grid=grid, save=6)
+        c = Constant(name='c', value=2.)
+
+        op = Operator(Eq(u0.forward, u0 + c))
+
+        op.apply(time_M=4)
+
+        call = op.prepare(u=u1, time_m=0, time_M=0)
+        assert set(call.updatable) == {'time_m', 'time_M'}
+        for i in range(5):
+            call(time_m=i, time_M=i)
+
+        assert np.all(u1.data == u0.data)
+        assert np.all(u1.data[5] == 10.)
+
+    def test_prepared_call_illegal_update(self):
+        grid = Grid(shape=(4, 4))
+
+        u = TimeFunction(name='u', grid=grid)
+        c = Constant(name='c', value=2.)
+
+        op = Operator(Eq(u.forward, u + c))
+
+        call = op.prepare(time_M=1)
+
+        with pytest.raises(InvalidArgument):
+            call(c=3.)
+        with pytest.raises(InvalidArgument):
+            call(u=u)
+        with pytest.raises(InvalidArgument):
+            call(time_M=1.5)
+        with pytest.raises(InvalidArgument):
+            call(x_m=0)
+
+    def test_prepared_call_oob_update(self):
+        grid = Grid(shape=(4, 4))
+
+        u = TimeFunction(name='u', grid=grid, save=3)
+
+        op = Operator(Eq(u.forward, u + 1))
+
+        with pytest.raises(InvalidArgument):
+            op.apply(time_M=50)
+
+        # The legal range of the time bounds is the same as in `apply`
+        call = op.prepare(time_M=1)
+        with pytest.raises(InvalidArgument):
+            call(time_M=50)
+        with pytest.raises(InvalidArgument):
+            call(time_m=-1)
+        with pytest.raises(InvalidArgument):
+            call(time_m=1, time_M=-1)
+        assert call.args['time_M'] == 1
+
+        call(time_m=0, time_M=0)
+        call(time_m=1, time_M=1)
+        assert np.all(u.data[2] == 2.)
+
 
 @skipif('device')
 class TestDeclarator:
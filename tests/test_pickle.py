@@ -1,3 +1,4 @@
+import json
 import pickle as pickle0
 import cloudpickle as pickle1
 
@@ -11,6 +12,7 @@ from devito import (Constant, Eq, Function, TimeFunction, SparseFunction, Grid,
                     PrecomputedSparseTimeFunction)
 from devito.ir import Backward, Forward, GuardFactor, GuardBound, GuardBoundNext
 from devito.data import LEFT, OWNED
+from devito.exceptions import InvalidOperator
 from devito.finite_differences.tools import direct, transpose, left, right, centered
 from devito.mpi.halo_scheme import Halo
 from devito.mpi.routines import (MPIStatusObject, MPIMsgEnriched, MPIRequestObject,
@@ -106,6 +108,18 @@ class TestBasic:
         assert f.dtype == new_f.dtype
         assert f.shape == new_f.shape
 
+    def test_function_storage_dtype(self, pickle):
+        grid = Grid(shape=(3, 3, 3))
+        f = Function(name='f', grid=grid, storage_dtype=np.float16)
+        f.data[0] = 1.
+
+        new_f = pickle.loads(pickle.dumps(f))
+
+        assert new_f.dtype == np.float32
+        assert new_f.storage_dtype == np.float16
+        assert new_f.data.dtype == np.float16
+        assert np.all(new_f.data[0] == 1.)
+
     @pytest.mark.parametrize('interp', ['linear', 'sinc'])
     def test_sparse_function(self, pickle, interp):
         grid = Grid(shape=(3,))
@@ -981,3 +995,55 @@ class TestOperator:
         op_new = pickle.load(open(tmp_pickle_op_fn, "rb"))
 
         assert str(op_fwd) == str(op_new)
+
+
+class TestBundle:
+
+    def test_export_load(self, tmp_path):
+        grid = Grid(shape=(4, 4))
+        f = Function(name='f', grid=grid)
+        u = TimeFunction(name='u', grid=grid, save=4)
+
+        op = Operator(Eq(u.forward, u + f))
+        op.export(str(tmp_path))
+
+        assert (tmp_path / 'metadata.json').is_file()
+        with open(str(tmp_path / 'metadata.json')) as fp:
+            metadata = json.load(fp)
+        assert metadata['name'] == op.name
+        assert [i['name'] for i in metadata['parameters']] == \
+            [i.name for i in op.parameters]
+        assert (tmp_path / metadata['sofile']).is_file()
+
+        new_op = Operator.load(str(tmp_path))
+
+        assert str(op) == str(new_op)
+        assert new_op._lib is not None
+
+        f.data[:] = 1.
+        new_op.apply(u=u, f=f)
+        assert np.all(u.data[3] == 3.)
+
+    def test_invalid_bundle(self, tmp_path):
+        with pytest.raises(InvalidOperator):
+            Operator.load(str(tmp_path))
+
+    def test_incompatible_platform(self, tmp_path):
+        grid = Grid(shape=(4, 4))
+        f = Function(name='f', grid=grid)
+
+        op = Operator(Eq(f, f + 1))
+        op.export(str(tmp_path))
+
+        # A device is not a suitable target for a CPU shared object
+        with pytest.raises(InvalidOperator):
+            Operator.load(str(tmp_path), platform='nvidiaX')
+
+        # Neither is a CPU lacking the ISA the shared object was compiled for
+        with open(str(tmp_path / 'metadata.json')) as fp:
+            metadata = json.load(fp)
+        metadata['fingerprint']['isa'] = 'unknown-isa'
+        with open(str(tmp_path / 'metadata.json'), 'w') as fp:
+            json.dump(metadata, fp)
+        with pytest.raises(InvalidOperator):
+            Operator.load(str(tmp_path))